@@ -1,374 +1,834 @@
-#! /usr/bin/env python3
-
-#Pre-requisites software required to run this script:
-    #Python 2.7: Modules:: sys, re, os
-    #Graphviz
-        ##If you just installed Graphviz, "restart" your computer for Graphviz commandline execution to work
-
-#Purpose of this script and How can a modeler use it:
-    #Convert a GridLAB-D file (.glm) to a Graphviz file (.dot)
-    #Use that .dot to generate .svg
-    #Use any web browser to open the .svg file - SIMPLE
-
-#Usage:
-    #python glmMap.py inputfile.glm outputfile.dot
-
-#Licensing: Copyright 2016; licensing falls under GridLAB-D
-#Email Contact: sri at pnnl dot gov
-#Devloped at: Pacific Northwest National Laboratory
-#Acknowledgements: This tool is developed using a base script provided by Philip Douglass, Technical University of Denmark in 2013
-
-#Version and Patch Notes:
-    ##05/20/2016: Added    :: line spacing; object names; object color coding
-    ##06/02/2016: Bug Fix  :: If the node names has ':' in it, grapgviz errors out. replaced ':' with '_' as well
-
-import sys;
-import re;
-import os
-
-# # argument validation
-if len(sys.argv) < 3:
-    raise Exception("Usage: python3 glmMap.py model.glm model.dot")
-# if
-
-# # recursively include dependencies
-
-# get initial lines
-with open(sys.argv[1], 'r') as f:
-    lines = f.readlines()
-# with
-
-# helper function
-def extract_field(_line)->str:
-    line = _line.strip()
-
-    field = None
-    if line.startswith("object "):
-        tmp_list = line.split(" ");
-        new_tmp_list = []
-        for tmp in tmp_list:
-            tmp = tmp.strip()
-            if "" != tmp:
-                new_tmp_list.append(tmp)
-            # if
-        # for
-        field = new_tmp_list[1]
-
-    else:
-        field_type = line.split(" ")[0]
-        if field_type in ["#include", "name", "from", "to", "phases", "length"]:
-            field = line[(len(field_type) + 1):].rstrip(";")
-        # if
-    # elif line.endswith(";"):
-    #     field_type = line.split(" ")[0]
-    #     if field_type in ["#include", "name", "from", "to", "phases", "length"]:
-    #         field = line[(len(field_type) + 1):-1]
-    #     # if
-    # if-else
-
-    return field
-# if
-
-# failsafe counter to mitigate cyclic includes
-_append_includes_depth = 0
-def append_includes(_lines:list)->list:
-    global _append_includes_depth
-    _append_includes_depth += 1
-
-    new_lines = []
-    for l in _lines:
-        l = l.strip()
-        if "" != l:
-            new_lines.append(l)
-        # if
-
-        if l.startswith("#include"):
-            # inc_file = l.split(" ")[1][1:-1]
-            inc_file = extract_field(l)
-            if inc_file.startswith("\""):
-                inc_file = inc_file[1:-1]
-            # if
-            with open(inc_file, "r") as f:
-                inc_lines = f.readlines()
-            # with
-            new_lines.extend(append_includes(inc_lines))
-        # if
-    # for
-
-    _append_includes_depth -= 1
-    return new_lines
-# get includes
-
-# recurse
-lines = append_includes(lines)
-
-# # sanitize lines by removing comments and blank lines
-
-new_lines = []
-for s in range(len(lines)):
-    new_line = lines[s]
-
-    # discard comments
-    if "//" in lines[s]:
-        new_line = new_line[:new_line.index("//")].strip()
-    # if
-
-    # skip empty lines
-    if "" == new_line:
-        continue
-    # if
-
-    # add sanitized line
-    new_lines.append(new_line)
-# for
-lines = new_lines
-
-# # extract information from objects
-
-# helper function
-def verify_none(_obj, _field):
-    if None is not _obj[_field]:
-        raise Exception(f"object {_obj['type']}:{_obj['name']} has more than one `{_field}`.")
-    # if
-# verify_none()
-
-# helper function
-obj_list = []
-def extract_object(_lines:list, _s:int):
-    lines = [l.strip() for l in _lines]
-    s = _s
-
-    # validation
-    if not lines[s].startswith("object "):
-        return s + 1
-    # if
-
-    # object we will save
-    obj = {
-        "name": None,
-        "type": None,
-        "from": None,
-        "to": None,
-        "phases": None,
-        "length": None,
-        "shape": "box", # default
-        "raw": []
-    }
-
-    # extract object type
-    obj["type"] = extract_field(lines[s])
-
-    # find end of object
-    end_s = s + 1
-    while end_s < len(lines):
-        # recursive or termination conditions
-        if lines[end_s].startswith("object "):
-            # recurse
-            end_s = extract_object(lines, end_s)
-        elif lines[end_s].startswith("}"):
-            break
-        # if-elif-else
-
-        # termination after recursion
-        if end_s >= len(lines):
-            break
-        # if
-
-        # various important fields
-        if lines[end_s].startswith("name "):
-            verify_none(obj, "name")
-            obj["name"] = extract_field(lines[end_s])
-
-        elif lines[end_s].startswith("from "):
-            verify_none(obj, "from")
-            obj["from"] = extract_field(lines[end_s])
-
-        elif lines[end_s].startswith("to "):
-            verify_none(obj, "to")
-            obj["to"] = extract_field(lines[end_s])
-
-        elif lines[end_s].startswith("phases "):
-            verify_none(obj, "phases")
-            obj["phases"] = extract_field(lines[end_s]).upper()
-
-        elif lines[end_s].startswith("length "):
-            verify_none(obj, "length")
-            length = extract_field(lines[end_s])
-            # remove possible `ft` at end
-            obj["length"] = length.split(" ")[0]
-
-        # if-elif
-
-        obj["raw"].append(lines[end_s])
-
-        end_s += 1
-    # while
-    global obj_list
-    obj_list.append(obj)
-
-    return end_s
-# extract_object
-
-# for line, extract object if found
-s = 0
-while s < len(lines):
-    # extract object
-    if lines[s].startswith("object "):
-        s = extract_object(lines, s)
-    # if
-
-    s += 1
-# for
-
-# # enumerate nodes/edges
-
-# helper function
-def get_obj_by_name(_name:str)->dict:
-    # get object
-    obj = None
-    global obj_list
-    for obj_tmp in obj_list:
-        if _name == obj_tmp["name"]:
-            obj = obj_tmp
-            break
-        # if
-    # for
-
-    return obj
-# get_obj_by_name()
-
-# enumerate
-names = set([d["name"] for d in obj_list])
-nodes = set()
-edges = []
-for obj in obj_list:
-    f = obj["from"]
-    if f not in names:
-        f = None
-    # if
-    t = obj["to"]
-    if t not in names:
-        t = None
-    # if
-
-    if (None is not f) and (None is not t):
-        # create edge
-        name = obj["name"]
-        nodes.add(f)
-        nodes.add(t)
-        d = {
-            "name": name,
-            "edge": (f, t)
-        }
-        edges.append(d)
-
-        # if a node is pointed to by a transformer (read: if a node is on the low-side of a transformer), then the node is an oval
-        if "transformer" == obj["type"]:
-            to_obj = get_obj_by_name(t)
-            to_obj["shape"] = "oval"
-        # if
-
-    # if
-# for
-
-# # write output dot file
-
-# helper function
-def sanitize_for_dot(_string:str)->str:
-    # don't trust dot to handle dashes or colons
-    return _string.rstrip(';').replace('-','_').replace(':','_')   
-# sanitize_for_dot()
-
-# write output dot file
-nodes = sorted(nodes)
-edges = sorted(edges, key=lambda x: x["edge"])
-if 0 < len(nodes):
-    with open(sys.argv[2], "w") as file:
-        # start dot file
-        file.write("digraph {\n")
-
-        for node in nodes:
-            # get object
-            obj = None
-            for obj_tmp in obj_list:
-                if node == obj_tmp["name"]:
-                    obj = obj_tmp
-                    break
-                # if
-            # for
-
-            node = sanitize_for_dot(node)
-            file.write(f"\t{node} [shape={obj['shape']}];\n")
-        # for
-        for edge in edges:
-            name = edge["name"]
-            edge = edge["edge"]
-            f = sanitize_for_dot(edge[0])
-            t = sanitize_for_dot(edge[1])
-
-            # default
-            style = "solid"
-            color = "black"
-
-            # get object
-            obj = get_obj_by_name(name)
-
-            # style
-            #   four phase --> bold
-            #   three phase --> dashed
-            #   two/one/zero phase --> solid
-            if 3 < len(obj["phases"]):
-                style = "bold"
-            elif 2 < len(obj["phases"]):
-                style = "dashed"
-            else:
-                pass # style = /default/
-            # if-elif-else
-
-            # color (why doesn't anything else have a specific color?)
-            #   transformer --> red
-            #   triplex_line --> green
-            #   fuse --> blue
-            if "transformer" == obj["type"]:
-                color = "red"
-            elif "triplex_line" == obj["type"]:
-                color = "green"
-            elif "fuse" == obj["type"]:
-                color = "blue"
-            else:
-                pass # color = /default/
-            # if-elif-else
-
-            # don't trust dot to handle dashes or colons
-            name = sanitize_for_dot(name)
-
-            # create edge label
-            label = f"/type: {obj['type']}\\l /name: {name}\\l /phases: {obj['phases'].upper()}\\l"
-
-            # if edge is a line, it has length
-            if obj["type"].endswith("line"):
-                # default
-                length = "?"
-
-                # convert to integer value if found
-                if None is not obj["length"]:
-                    # add comma separation between thousands
-                    length = f"{int(obj['length']):,}"
-                # if
-
-                # update label
-                label += f"/length: {length} ft\\l"
-            # if
-
-            # write edge to file
-            file.write(f"\t{f} -> {t} [style={style}, color={color}, label=\"{label}\"];\n")
-        # for
-
-        # terminate dot file
-        file.write("}\n")
-    # with
-# if
-
-# # dot to svg
-
-os.system("dot -Tsvg -O " + sys.argv[2])
+#! /usr/bin/env python3
+
+#Pre-requisites software required to run this script:
+    #Python 3: Modules:: sys, os, math, xml
+    #Graphviz (not needed for the .svg drawn directly, see below)
+        ##If you just installed Graphviz, "restart" your computer for Graphviz commandline execution to work
+
+#Purpose of this script and How can a modeler use it:
+    #Convert a GridLAB-D file (.glm) to a Graphviz file (.dot)
+    #Use that .dot to generate .svg
+    #Use any web browser to open the .svg file - SIMPLE
+
+#Usage:
+    #python glmMap.py inputfile.glm outputfile.dot
+    #python glmMap.py inputfile.glm outputfile.svg
+        ##large feeders: series chains and triplex subtrees collapsed, nodes colored by feeder section, the .svg
+        ##drawn directly in Python (100k+ objects in seconds); add `--no-collapse` to keep all the nodes
+    #python glmMap.py inputfile.glm outputfile.dot --layout=neato
+        ##the same collapsed graph (a cluster per feeder section) rendered by Graphviz at the Python coordinates
+        ##(`--layout=sfdp` lets sfdp lay it out instead)
+    #or, as a module:
+    #   import glmMap
+    #   obj_list, obj_dict, nodes, edges = glmMap.map_glm("inputfile.glm")
+    #   glmMap.write_dot("outputfile.dot", nodes, edges, obj_dict)
+
+#Licensing: Copyright 2016; licensing falls under GridLAB-D
+#Email Contact: sri at pnnl dot gov
+#Devloped at: Pacific Northwest National Laboratory
+#Acknowledgements: This tool is developed using a base script provided by Philip Douglass, Technical University of Denmark in 2013
+
+#Version and Patch Notes:
+    ##05/20/2016: Added    :: line spacing; object names; object color coding
+    ##06/02/2016: Bug Fix  :: If the node names has ':' in it, grapgviz errors out. replaced ':' with '_' as well
+    ##10/19/2026: Changed  :: importable module with a CLI entry point; name -> object dict instead of the linear
+    ##                        scans (O(N) instead of O(N^2)); the lines are streamed through one pass (includes,
+    ##                        comments, and blank lines); include files are found relative to the including file
+    ##10/19/2026: Bug Fix  :: a fractional `length` (e.g., 3.602362) no longer stops the dot file half-written
+    ##10/19/2026: Changed  :: objects are extracted by a single cursor pass over the streamed lines, with an explicit
+    ##                        stack for the nested objects (no per-object copies of the line list, no recursion)
+    ##10/19/2026: Added    :: scalable maps of large feeders: series chains and triplex subtrees collapsed into summary
+    ##                        links/nodes, nodes clustered by feeder section, and a radial layout computed in Python;
+    ##                        drawn as an .svg directly, or via `neato -n2` (at those coordinates) or `sfdp`
+
+import sys
+import os
+import math
+from xml.sax.saxutils import escape
+
+# the layouts of main(): Graphviz `dot` of the full graph (the original output), or the collapsed graph drawn
+# directly in Python, by `neato` at the precomputed coordinates, or by `sfdp`
+LAYOUTS = ["dot", "python", "neato", "sfdp"]
+
+# failsafe depth to mitigate cyclic includes
+MAX_INCLUDE_DEPTH = 32
+
+# helper function
+def extract_field(_line)->str:
+    line = _line.strip()
+
+    field = None
+    if line.startswith("object "):
+        tmp_list = line.split(" ");
+        new_tmp_list = []
+        for tmp in tmp_list:
+            tmp = tmp.strip()
+            if "" != tmp:
+                new_tmp_list.append(tmp)
+            # if
+        # for
+        field = new_tmp_list[1]
+
+    else:
+        field_type = line.split(" ")[0]
+        if field_type in ["#include", "name", "from", "to", "phases", "length"]:
+            field = line[(len(field_type) + 1):].rstrip(";")
+        # if
+    # if-else
+
+    return field
+# extract_field()
+
+# # stream the lines: includes inlined, comments and blank lines discarded
+
+def iter_glm_lines(_path:str, _depth:int=0):
+    if MAX_INCLUDE_DEPTH < _depth:
+        raise Exception(f"includes nested deeper than {MAX_INCLUDE_DEPTH} levels (cyclic?) at `{_path}`.")
+    # if
+
+    with open(_path, "r") as f:
+        for l in f:
+            # discard comments
+            if "//" in l:
+                l = l[:l.index("//")]
+            # if
+
+            # skip empty lines
+            l = l.strip()
+            if "" == l:
+                continue
+            # if
+
+            yield l
+
+            if l.startswith("#include"):
+                inc_file = extract_field(l)
+                if inc_file.startswith("\""):
+                    inc_file = inc_file[1:-1]
+                # if
+
+                # relative to the including file first, then to the working folder
+                inc_path = os.path.join(os.path.dirname(_path), inc_file)
+                if not os.path.exists(inc_path):
+                    inc_path = inc_file
+                # if
+                yield from iter_glm_lines(inc_path, _depth + 1)
+            # if
+        # for
+    # with
+# iter_glm_lines()
+
+# # extract information from objects
+
+# helper function
+def verify_none(_obj, _field):
+    if None is not _obj[_field]:
+        raise Exception(f"object {_obj['type']}:{_obj['name']} has more than one `{_field}`.")
+    # if
+# verify_none()
+
+# helper function
+def new_object(_line:str)->dict:
+    # object we will save
+    return {
+        "name": None,
+        "type": extract_field(_line),
+        "from": None,
+        "to": None,
+        "phases": None,
+        "length": None,
+        "shape": "box", # default
+        "raw": []
+    }
+# new_object()
+
+# helper function
+def extract_fields(_obj:dict, _line:str):
+    # various important fields
+    if _line.startswith("name "):
+        verify_none(_obj, "name")
+        _obj["name"] = extract_field(_line)
+
+    elif _line.startswith("from "):
+        verify_none(_obj, "from")
+        _obj["from"] = extract_field(_line)
+
+    elif _line.startswith("to "):
+        verify_none(_obj, "to")
+        _obj["to"] = extract_field(_line)
+
+    elif _line.startswith("phases "):
+        verify_none(_obj, "phases")
+        _obj["phases"] = extract_field(_line).upper()
+
+    elif _line.startswith("length "):
+        verify_none(_obj, "length")
+        length = extract_field(_line)
+        # remove possible `ft` at end
+        _obj["length"] = length.split(" ")[0]
+
+    # if-elif
+# extract_fields()
+
+def extract_objects(_lines)->list:
+    # one pass over the (pre-stripped) lines, with an explicit stack of the open (nested) objects;
+    # an object is saved when it is closed, so a nested object comes before its parent
+    obj_list = []
+    stack = []
+    for line in _lines:
+        if line.startswith("object "):
+            stack.append(new_object(line))
+            continue
+        # if
+
+        # outside of any object
+        if 0 == len(stack):
+            continue
+        # if
+
+        if line.startswith("}"):
+            obj_list.append(stack.pop())
+
+            # the closing line of a nested object is a raw line of its parent
+            if 0 < len(stack):
+                stack[-1]["raw"].append(line)
+            # if
+            continue
+        # if
+
+        extract_fields(stack[-1], line)
+        stack[-1]["raw"].append(line)
+    # for
+
+    # objects left open at the end of the file
+    while 0 < len(stack):
+        obj_list.append(stack.pop())
+    # while
+
+    return obj_list
+# extract_objects()
+
+# # enumerate nodes/edges
+
+def index_objects(_obj_list:list)->dict:
+    # name -> object (the first one wins for a repeated name, as the former linear scan did)
+    obj_dict = {}
+    for obj in _obj_list:
+        obj_dict.setdefault(obj["name"], obj)
+    # for
+
+    return obj_dict
+# index_objects()
+
+def enumerate_edges(_obj_list:list, _obj_dict:dict):
+    nodes = set()
+    edges = []
+    for obj in _obj_list:
+        f = obj["from"]
+        if f not in _obj_dict:
+            f = None
+        # if
+        t = obj["to"]
+        if t not in _obj_dict:
+            t = None
+        # if
+
+        if (None is not f) and (None is not t):
+            # create edge
+            nodes.add(f)
+            nodes.add(t)
+            edges.append({
+                "name": obj["name"],
+                "edge": (f, t),
+                "obj": obj
+            })
+
+            # if a node is pointed to by a transformer (read: if a node is on the low-side of a transformer), then the node is an oval
+            if "transformer" == obj["type"]:
+                _obj_dict[t]["shape"] = "oval"
+            # if
+        # if
+    # for
+
+    return nodes, edges
+# enumerate_edges()
+
+def map_glm(_path:str):
+    obj_list = extract_objects(iter_glm_lines(_path))
+    obj_dict = index_objects(obj_list)
+    nodes, edges = enumerate_edges(obj_list, obj_dict)
+
+    return obj_list, obj_dict, nodes, edges
+# map_glm()
+
+# # write output dot file
+
+# helper function
+def sanitize_for_dot(_string:str)->str:
+    # don't trust dot to handle dashes or colons
+    return _string.rstrip(';').replace('-','_').replace(':','_')
+# sanitize_for_dot()
+
+def get_edge_attrs(_obj:dict):
+    # default
+    style = "solid"
+    color = "black"
+
+    # style
+    #   four phase --> bold
+    #   three phase --> dashed
+    #   two/one/zero phase --> solid
+    if 3 < len(_obj["phases"]):
+        style = "bold"
+    elif 2 < len(_obj["phases"]):
+        style = "dashed"
+    else:
+        pass # style = /default/
+    # if-elif-else
+
+    # color (why doesn't anything else have a specific color?)
+    #   transformer --> red
+    #   triplex_line --> green
+    #   fuse --> blue
+    if "transformer" == _obj["type"]:
+        color = "red"
+    elif "triplex_line" == _obj["type"]:
+        color = "green"
+    elif "fuse" == _obj["type"]:
+        color = "blue"
+    else:
+        pass # color = /default/
+    # if-elif-else
+
+    return style, color
+# get_edge_attrs()
+
+def write_dot(_path:str, _nodes:set, _edges:list, _obj_dict:dict):
+    nodes = sorted(_nodes)
+    edges = sorted(_edges, key=lambda x: x["edge"])
+    if 0 == len(nodes):
+        return False
+    # if
+
+    with open(_path, "w") as file:
+        # start dot file
+        file.write("digraph {\n")
+
+        for node in nodes:
+            obj = _obj_dict[node]
+            file.write(f"\t{sanitize_for_dot(node)} [shape={obj['shape']}];\n")
+        # for
+
+        for edge in edges:
+            obj = edge["obj"]
+            f = sanitize_for_dot(edge["edge"][0])
+            t = sanitize_for_dot(edge["edge"][1])
+            style, color = get_edge_attrs(obj)
+
+            # don't trust dot to handle dashes or colons
+            name = sanitize_for_dot(edge["name"])
+
+            # create edge label
+            label = f"/type: {obj['type']}\\l /name: {name}\\l /phases: {obj['phases'].upper()}\\l"
+
+            # if edge is a line, it has length
+            if obj["type"].endswith("line"):
+                # default
+                length = "?"
+
+                # convert to integer value if found
+                if None is not obj["length"]:
+                    # add comma separation between thousands
+                    length = f"{int(float(obj['length'])):,}"
+                # if
+
+                # update label
+                label += f"/length: {length} ft\\l"
+            # if
+
+            # write edge to file
+            file.write(f"\t{f} -> {t} [style={style}, color={color}, label=\"{label}\"];\n")
+        # for
+
+        # terminate dot file
+        file.write("}\n")
+    # with
+
+    return True
+# write_dot()
+
+# # dot to svg
+
+def render_svg(_dot_path:str):
+    os.system("dot -Tsvg -O " + _dot_path)
+# render_svg()
+
+# # scalable rendering (large feeders): collapsed graph, feeder sections, precomputed coordinates
+
+# links that bound a feeder section (and that are never folded into a series chain)
+SECTION_EDGE_TYPES = ["switch", "recloser", "fuse", "sectionalizer", "regulator"]
+
+# fill colors of the feeder sections (cycled)
+SECTION_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+
+# distance between two depth levels of the radial layout (px or pt)
+LAYOUT_UNIT = 20.0
+
+# helper function
+def get_length(_obj:dict)->float:
+    if None is _obj["length"]:
+        return 0.0
+    # if
+
+    try:
+        return float(_obj["length"])
+    except ValueError:
+        return 0.0
+    # try-except
+# get_length()
+
+def find_root(_nodes, _obj_dict:dict):
+    # the swing node, if any
+    for node in _nodes:
+        if "bustype SWING;" in _obj_dict[node]["raw"]:
+            return node
+        # if
+    # for
+
+    return None
+# find_root()
+
+def collapse_triplex(_nodes:set, _edges:list, _obj_dict:dict):
+    # triplex nodes connected by triplex links (e.g., the secondary of a center-tap transformer) -> one summary node,
+    # named after the member fed by the rest of the feeder
+    is_triplex = lambda x: x.startswith("triplex")
+
+    adj = {}
+    inner_set = set()
+    for i, edge in enumerate(_edges):
+        f, t = edge["edge"]
+        if is_triplex(edge["obj"]["type"]) and is_triplex(_obj_dict[f]["type"]) and is_triplex(_obj_dict[t]["type"]):
+            adj.setdefault(f, []).append(t)
+            adj.setdefault(t, []).append(f)
+            inner_set.add(i)
+        # if
+    # for
+
+    fed_set = set()
+    for i, edge in enumerate(_edges):
+        if i not in inner_set:
+            fed_set.update(edge["edge"])
+        # if
+    # for
+
+    # summary node of each member
+    rep = {}
+    g_nodes = {}
+    for node in adj:
+        if node in rep:
+            continue
+        # if
+
+        comp = [node]
+        rep[node] = node
+        i = 0
+        while i < len(comp):
+            for n in adj[comp[i]]:
+                if n not in rep:
+                    rep[n] = node
+                    comp.append(n)
+                # if
+            # for
+            i += 1
+        # while
+
+        head = next((n for n in comp if n in fed_set), node)
+        for n in comp:
+            rep[n] = head
+        # for
+        g_nodes[head] = {"count": len(comp), "length": 0.0}
+    # for
+
+    for node in _nodes:
+        if node not in rep:
+            g_nodes[node] = {"count": 1, "length": 0.0}
+        # if
+    # for
+
+    g_edges = []
+    for i, edge in enumerate(_edges):
+        f, t = edge["edge"]
+        if i in inner_set:
+            g_nodes[rep[f]]["length"] += get_length(edge["obj"])
+        else:
+            g_edges.append({
+                "edge": (rep.get(f, f), rep.get(t, t)),
+                "obj": edge["obj"],
+                "count": 1,
+                "length": get_length(edge["obj"])
+            })
+        # if-else
+    # for
+
+    return g_nodes, g_edges
+# collapse_triplex()
+
+def collapse_chains(_g_nodes:dict, _g_edges:list, _keep:set):
+    # series chains (through nodes of two links, none of which bounds a section) -> one summary link
+    adj = {n: [] for n in _g_nodes}
+    for i, edge in enumerate(_g_edges):
+        adj[edge["edge"][0]].append(i)
+        adj[edge["edge"][1]].append(i)
+    # for
+
+    inner_set = set()
+    for node, ids in adj.items():
+        if (2 == len(ids)) and (ids[0] != ids[1]) and (node not in _keep) and (1 == _g_nodes[node]["count"]) \
+                and all(_g_edges[i]["obj"]["type"] not in SECTION_EDGE_TYPES for i in ids):
+            inner_set.add(node)
+        # if
+    # for
+
+    done = [False] * len(_g_edges)
+    g_edges = []
+    for node in _g_nodes:
+        if node in inner_set:
+            continue
+        # if
+
+        for i in adj[node]:
+            if done[i]:
+                continue
+            # if
+            done[i] = True
+
+            first = _g_edges[i]
+            count = first["count"]
+            length = first["length"]
+            cur = first["edge"][1] if node == first["edge"][0] else first["edge"][0]
+            while cur in inner_set:
+                i = adj[cur][1] if i == adj[cur][0] else adj[cur][0]
+                if done[i]:
+                    break
+                # if
+                done[i] = True
+
+                edge = _g_edges[i]
+                count += edge["count"]
+                length += edge["length"]
+                cur = edge["edge"][1] if cur == edge["edge"][0] else edge["edge"][0]
+            # while
+
+            # keep the direction of the first link
+            g_edges.append({
+                "edge": (node, cur) if node == first["edge"][0] else (cur, node),
+                "obj": first["obj"],
+                "count": count,
+                "length": length
+            })
+        # for
+    # for
+
+    # closed loops of inner nodes only are kept as they are
+    for i, edge in enumerate(_g_edges):
+        if not done[i]:
+            g_edges.append(edge)
+            inner_set.difference_update(edge["edge"])
+        # if
+    # for
+
+    g_nodes = {n: v for n, v in _g_nodes.items() if n not in inner_set}
+
+    return g_nodes, g_edges
+# collapse_chains()
+
+def find_sections(_g_nodes:dict, _g_edges:list)->dict:
+    # node -> feeder section (the nodes connected without crossing a switch, recloser, fuse, etc.)
+    adj = {n: [] for n in _g_nodes}
+    for edge in _g_edges:
+        if edge["obj"]["type"] not in SECTION_EDGE_TYPES:
+            adj[edge["edge"][0]].append(edge["edge"][1])
+            adj[edge["edge"][1]].append(edge["edge"][0])
+        # if
+    # for
+
+    sections = {}
+    sec = -1
+    for node in _g_nodes:
+        if node in sections:
+            continue
+        # if
+
+        sec += 1
+        sections[node] = sec
+        stack = [node]
+        while 0 < len(stack):
+            for n in adj[stack.pop()]:
+                if n not in sections:
+                    sections[n] = sec
+                    stack.append(n)
+                # if
+            # for
+        # while
+    # for
+
+    return sections
+# find_sections()
+
+def layout_radial(_g_nodes:dict, _g_edges:list, _root=None)->dict:
+    # radial tree layout of a BFS tree (from the root, then from each unreached node): the depth is the radius,
+    # and each subtree gets an angular wedge proportional to its number of leaves; components are placed side by side
+    adj = {n: [] for n in _g_nodes}
+    for edge in _g_edges:
+        adj[edge["edge"][0]].append(edge["edge"][1])
+        adj[edge["edge"][1]].append(edge["edge"][0])
+    # for
+
+    starts = list(_g_nodes)
+    if None is not _root and _root in _g_nodes:
+        starts.insert(0, _root)
+    # if
+
+    pos = {}
+    x_off = 0.0
+    for start in starts:
+        if start in pos:
+            continue
+        # if
+
+        # BFS tree
+        children = {start: []}
+        bfs = [start]
+        i = 0
+        while i < len(bfs):
+            u = bfs[i]
+            for v in adj[u]:
+                if v not in children:
+                    children[v] = []
+                    children[u].append(v)
+                    bfs.append(v)
+                # if
+            # for
+            i += 1
+        # while
+
+        # number of leaves of each subtree
+        leaves = {}
+        for u in reversed(bfs):
+            leaves[u] = sum(leaves[c] for c in children[u]) or 1
+        # for
+
+        # wedges
+        wedge = {start: (0.0, 2 * math.pi, 0)}
+        max_r = 0
+        comp_pos = {}
+        for u in bfs:
+            a0, a1, r = wedge[u]
+            a = (a0 + a1) / 2
+            comp_pos[u] = (r * math.cos(a), r * math.sin(a))
+            max_r = max(max_r, r)
+
+            for c in children[u]:
+                a = a0 + (a1 - a0) * leaves[c] / leaves[u]
+                wedge[c] = (a0, a, r + 1)
+                a0 = a
+            # for
+        # for
+
+        for u, (x, y) in comp_pos.items():
+            pos[u] = ((x_off + max_r + x) * LAYOUT_UNIT, y * LAYOUT_UNIT)
+        # for
+        x_off += 2 * max_r + 2
+    # for
+
+    return pos
+# layout_radial()
+
+def map_glm_large(_path:str, _collapse:bool=True):
+    # collapsed graph (summary nodes & links), feeder sections, and radial coordinates
+    obj_list, obj_dict, nodes, edges = map_glm(_path)
+    root = find_root(sorted(nodes), obj_dict)
+
+    if _collapse:
+        g_nodes, g_edges = collapse_triplex(nodes, edges, obj_dict)
+        g_nodes, g_edges = collapse_chains(g_nodes, g_edges, {root})
+    else:
+        g_nodes = {n: {"count": 1, "length": 0.0} for n in sorted(nodes)}
+        g_edges = [{"edge": e["edge"], "obj": e["obj"], "count": 1, "length": get_length(e["obj"])} for e in edges]
+    # if-else
+
+    sections = find_sections(g_nodes, g_edges)
+    pos = layout_radial(g_nodes, g_edges, root)
+
+    return g_nodes, g_edges, sections, pos
+# map_glm_large()
+
+# helper function
+def get_summary(_name:str, _g_item:dict, _kind:str)->str:
+    summary = _name
+    if 1 < _g_item["count"]:
+        summary += f" (+{_g_item['count'] - 1} {_kind}"
+        if 0 < _g_item["length"]:
+            summary += f", {int(_g_item['length']):,} ft"
+        # if
+        summary += ")"
+    # if
+
+    return summary
+# get_summary()
+
+def write_svg(_path:str, _g_nodes:dict, _g_edges:list, _sections:dict, _pos:dict):
+    # the map drawn directly from the coordinates (no Graphviz): links colored as in the dot file (summary links are
+    # wider), nodes filled by feeder section (summary nodes are squares); hover for the names
+    if 0 == len(_pos):
+        return False
+    # if
+
+    xs = [p[0] for p in _pos.values()]
+    ys = [p[1] for p in _pos.values()]
+    x0 = min(xs) - LAYOUT_UNIT
+    y0 = min(ys) - LAYOUT_UNIT
+    w = max(xs) - x0 + LAYOUT_UNIT
+    h = max(ys) - y0 + LAYOUT_UNIT
+
+    with open(_path, "w") as file:
+        file.write(f"<svg xmlns=\"http://www.w3.org/2000/svg\" viewBox=\"{x0:.1f} {y0:.1f} {w:.1f} {h:.1f}\" width=\"{w:.0f}\" height=\"{h:.0f}\">\n")
+        file.write("<style>line{stroke-width:2}.bold{stroke-width:4}.dashed{stroke-dasharray:6 3}.sum{stroke-width:6}circle,rect{stroke:black;stroke-width:0.5}</style>\n")
+
+        file.write("<g id=\"links\">\n")
+        for edge in _g_edges:
+            (x1, y1), (x2, y2) = _pos[edge["edge"][0]], _pos[edge["edge"][1]]
+            style, color = get_edge_attrs(edge["obj"])
+            cls = style + (" sum" if 1 < edge["count"] else "")
+            title = escape(get_summary(f"{edge['obj']['type']}: {edge['obj']['name']}", edge, "links"))
+            file.write(f"<line x1=\"{x1:.1f}\" y1=\"{y1:.1f}\" x2=\"{x2:.1f}\" y2=\"{y2:.1f}\" stroke=\"{color}\" class=\"{cls}\"><title>{title}</title></line>\n")
+        # for
+        file.write("</g>\n")
+
+        # one group per feeder section
+        sec_nodes = {}
+        for node in _g_nodes:
+            sec_nodes.setdefault(_sections[node], []).append(node)
+        # for
+
+        for sec, nodes in sec_nodes.items():
+            file.write(f"<g id=\"section_{sec}\" fill=\"{SECTION_COLORS[sec % len(SECTION_COLORS)]}\">\n")
+            for node in nodes:
+                x, y = _pos[node]
+                title = escape(get_summary(node, _g_nodes[node], "triplex objects"))
+                if 1 < _g_nodes[node]["count"]:
+                    file.write(f"<rect x=\"{x - 5:.1f}\" y=\"{y - 5:.1f}\" width=\"10\" height=\"10\"><title>{title}</title></rect>\n")
+                else:
+                    file.write(f"<circle cx=\"{x:.1f}\" cy=\"{y:.1f}\" r=\"4\"><title>{title}</title></circle>\n")
+                # if-else
+            # for
+            file.write("</g>\n")
+        # for
+
+        file.write("</svg>\n")
+    # with
+
+    return True
+# write_svg()
+
+def write_dot_large(_path:str, _g_nodes:dict, _g_edges:list, _sections:dict, _pos:dict=None):
+    # the collapsed graph with a cluster per feeder section, and the coordinates (if given) for `neato -n2`
+    if 0 == len(_g_nodes):
+        return False
+    # if
+
+    with open(_path, "w") as file:
+        file.write("digraph {\n")
+        file.write("\tgraph [overlap=false, splines=false, outputorder=edgesfirst];\n")
+        file.write("\tnode [shape=point, width=0.1];\n")
+        file.write("\tedge [arrowhead=none];\n")
+
+        sec_nodes = {}
+        for node in _g_nodes:
+            sec_nodes.setdefault(_sections[node], []).append(node)
+        # for
+
+        for sec, nodes in sec_nodes.items():
+            file.write(f"\tsubgraph cluster_{sec} {{\n")
+            file.write(f"\t\tnode [color=\"{SECTION_COLORS[sec % len(SECTION_COLORS)]}\"];\n")
+            for node in nodes:
+                attrs = f"tooltip=\"{get_summary(node, _g_nodes[node], 'triplex objects')}\""
+                if 1 < _g_nodes[node]["count"]:
+                    attrs += ", shape=square"
+                # if
+                if None is not _pos:
+                    attrs += f", pos=\"{_pos[node][0]:.1f},{_pos[node][1]:.1f}\""
+                # if
+                file.write(f"\t\t\"{sanitize_for_dot(node)}\" [{attrs}];\n")
+            # for
+            file.write("\t}\n")
+        # for
+
+        for edge in _g_edges:
+            f = sanitize_for_dot(edge["edge"][0])
+            t = sanitize_for_dot(edge["edge"][1])
+            style, color = get_edge_attrs(edge["obj"])
+            tooltip = get_summary(f"{edge['obj']['type']}: {sanitize_for_dot(edge['obj']['name'])}", edge, "links")
+            penwidth = 3 if 1 < edge["count"] else 1
+            file.write(f"\t\"{f}\" -> \"{t}\" [style={style}, color={color}, penwidth={penwidth}, tooltip=\"{tooltip}\"];\n")
+        # for
+
+        file.write("}\n")
+    # with
+
+    return True
+# write_dot_large()
+
+def render_svg_large(_dot_path:str, _layout:str):
+    # neato keeps the precomputed coordinates (-n2); sfdp lays out the collapsed graph by itself
+    if "neato" == _layout:
+        os.system("neato -n2 -Tsvg -O " + _dot_path)
+    else:
+        os.system(_layout + " -Tsvg -O " + _dot_path)
+    # if-else
+# render_svg_large()
+
+def main(_argv:list):
+    # options
+    args = [a for a in _argv[1:] if not a.startswith("--")]
+    layout = "dot"
+    collapse = True
+    for opt in _argv[1:]:
+        if opt.startswith("--layout="):
+            layout = opt[len("--layout="):]
+        elif "--no-collapse" == opt:
+            collapse = False
+        elif opt.startswith("--"):
+            raise Exception(f"unknown option `{opt}`.")
+        # if-elif
+    # for
+
+    # argument validation
+    if len(args) < 2:
+        raise Exception("Usage: python3 glmMap.py model.glm model.dot|model.svg [--layout=dot|python|neato|sfdp] [--no-collapse]")
+    # if
+    if args[1].endswith(".svg") and "dot" == layout:
+        layout = "python"
+    # if
+    if layout not in LAYOUTS:
+        raise Exception(f"unknown layout `{layout}` (one of {LAYOUTS}).")
+    # if
+
+    if "dot" == layout:
+        obj_list, obj_dict, nodes, edges = map_glm(args[0])
+        if write_dot(args[1], nodes, edges, obj_dict):
+            render_svg(args[1])
+        # if
+    else:
+        g_nodes, g_edges, sections, pos = map_glm_large(args[0], collapse)
+        if "python" == layout:
+            write_svg(args[1], g_nodes, g_edges, sections, pos)
+        elif write_dot_large(args[1], g_nodes, g_edges, sections, pos if "neato" == layout else None):
+            render_svg_large(args[1], layout)
+        # if-elif
+    # if-else
+# main()
+
+if __name__ == "__main__":
+    main(sys.argv)
+# if
@@ -0,0 +1,397 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import re
+import xml.etree.ElementTree as ET
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection
+
+# @TODO: It is not good to modify the path. Two options (the 2nd one is better): 1) __init__.py; 2) package, then install via pip
+import sys
+
+sys.path.append("../GlmParser")
+
+from glm_index import GlmIndex
+from glm_topology import GlmTopology
+
+# ==Constant
+# --the classes that are placed on the feeder (a child one, e.g., a meter parented to a node, is at its parent)
+CM_NODE_CLS_LIST = ["node", "meter", "load", "triplex_node", "triplex_meter", "triplex_load", "substation", "capacitor"]
+
+FT_PER_MILE = 5280.0
+FT_PER_UNIT_DICT = {"": 1.0, "ft": 1.0, "in": 1 / 12, "yd": 3.0, "mile": FT_PER_MILE, "mi": FT_PER_MILE, "m": 3.28084, "km": 3280.84}
+RE_LENGTH = re.compile(r"^\s*([-+]?[\d.]+(?:[eE][-+]?\d+)?)\s*([a-z]*)")
+
+# --the base voltages (of the 120 V per-unit values) by the voltage magnitude, as in VoltageData_CircuitMiles.m
+CM_PU_VOLT = 120.0
+CM_SEC_MAX_VOLT = 600.0
+CM_PRIM_MAX_VOLT = 10000.0
+CM_SUBT_MAX_VOLT = 90000.0
+CM_SUBT_VOLT = 115000.0
+
+CM_PHASE_COLOR_DICT = {"A": "tab:blue", "B": "tab:green", "C": "k"}
+
+
+class CircuitMiles:
+    """The circuit miles (i.e., the distance along the feeder from the substation) of all the nodes
+
+    Replaces the MATLAB scripts of 'matlab_scripts/circuit_miles': the links are streamed from the XML output of
+    GLD ('from_xml', via 'iterparse', without loading the whole DOM) or taken from a parsed .glm file ('from_glm'),
+    and the distances of all the nodes are accumulated down the BFS tree (of 'GlmTopology', without the open links)
+    with vectorized pointer jumping. 'plot_volt_profile' draws the voltages of a voltdump file against the circuit miles.
+    """
+
+    @staticmethod
+    def parse_length(len_str):
+        """A length (e.g., '+175 ft', '0.5 mile', or '120') in ft
+        """
+        m_len = RE_LENGTH.match(len_str.lower()) if len_str else None
+        if m_len is None:
+            return 0.0
+        if m_len.group(2) not in FT_PER_UNIT_DICT:
+            print(f"The length unit of '{len_str}' is unknown, and is taken as ft")
+            return float(m_len.group(1))
+        return float(m_len.group(1)) * FT_PER_UNIT_DICT[m_len.group(2)]
+
+    @staticmethod
+    def iter_glm_objs(glm_idx):
+        """The objects of a 'GlmIndex' (or a .glm file), without the open links
+        """
+        if isinstance(glm_idx, str):
+            glm_idx = GlmIndex(glm_idx)
+
+        for cur_obj in glm_idx.obj_list:
+            cur_props = cur_obj["props"]
+            if GlmTopology.is_open(cur_props.get("status")):
+                continue
+            yield {
+                "class": cur_obj["class"],
+                "name": cur_obj["name"],
+                "from": glm_idx.get_name(cur_props["from"]) if "from" in cur_props else None,
+                "to": glm_idx.get_name(cur_props["to"]) if "to" in cur_props else None,
+                "length": cur_props.get("length"),
+                "parent": cur_obj["parent"],
+                "bustype": cur_props.get("bustype", ""),
+                "phases": cur_props.get("phases", ""),
+            }
+
+    @staticmethod
+    def iter_xml_objs(xml_pfn):
+        """Stream the objects (the elements with a 'name' child) of the XML output of GLD, one at a time, without the
+        open links
+        """
+        for _, cur_elem in ET.iterparse(xml_pfn, events=("end",)):
+            if cur_elem.find("name") is None:
+                if cur_elem.tag.endswith("_list"):
+                    cur_elem.clear()
+                continue
+
+            cur_field_dict = {x.tag: (x.text or "").strip() for x in cur_elem}
+            if GlmTopology.is_open(cur_field_dict.get("status")):
+                cur_elem.clear()
+                continue
+            yield {
+                "class": cur_elem.tag,
+                "name": cur_field_dict["name"],
+                "from": cur_field_dict.get("from"),
+                "to": cur_field_dict.get("to"),
+                "length": cur_field_dict.get("length"),
+                "parent": cur_field_dict.get("parent"),
+                "bustype": cur_field_dict.get("bustype", ""),
+                "phases": cur_field_dict.get("phases", ""),
+            }
+            cur_elem.clear()
+
+    @staticmethod
+    def from_glm(glm_idx, root_name=None):
+        """The circuit miles of a 'GlmIndex' (or a .glm file)
+        """
+        return CircuitMiles(CircuitMiles.iter_glm_objs(glm_idx), root_name)
+
+    @staticmethod
+    def from_xml(xml_pfn, root_name=None):
+        """The circuit miles of the XML output of GLD (e.g., '#set savefile=my_xml.xml'; the whole file is fine)
+        """
+        return CircuitMiles(CircuitMiles.iter_xml_objs(xml_pfn), root_name)
+
+    def __init__(self, obj_iter, root_name=None):
+        """Build the topology of the objects (dicts of 'class', 'name', 'from', 'to', 'length', 'parent', 'bustype',
+        and 'phases'), rooted at the given node or at the swing node
+
+        In the XML output, the 'parent' of a node is its upstream link (of FBS), so such a node hangs off that link
+        only (as CalcDistances.m). The other nodes (e.g., all of a .glm file) are connected by the rest of the links,
+        and a child node is at its parent.
+        """
+        link_dict = {}
+        par_dict = {}
+        self.phases_dict = {}
+        swing_name = None
+        for cur_obj in obj_iter:
+            if cur_obj["from"] and cur_obj["to"]:
+                link_dict[cur_obj["name"]] = (
+                    cur_obj["from"], cur_obj["to"], CircuitMiles.parse_length(cur_obj["length"])
+                )
+            elif cur_obj["class"] in CM_NODE_CLS_LIST:
+                self.phases_dict[cur_obj["name"]] = cur_obj["phases"]
+                if cur_obj["parent"]:
+                    par_dict[cur_obj["name"]] = cur_obj["parent"]
+                if swing_name is None and cur_obj["bustype"].upper() == "SWING":
+                    swing_name = cur_obj["name"]
+
+        fm_list = []
+        to_list = []
+        link_list = []
+        len_list = []
+        par_list = []
+
+        def add_edge(fm_str, to_str, link_str, len_val, par_flag):
+            fm_list.append(fm_str)
+            to_list.append(to_str)
+            link_list.append(link_str)
+            len_list.append(len_val)
+            par_list.append(par_flag)
+
+        # --the nodes whose parent is a link with them at one end; an unnamed link is e.g. '(regulator:295)' in the
+        # XML output, but 'regulator:295' as a parent
+        par_link_dict = {}
+        for cur_child, cur_par in par_dict.items():
+            cur_link = cur_par if cur_par in link_dict else f"({cur_par})"
+            if cur_link in link_dict and cur_child in link_dict[cur_link][:2]:
+                par_link_dict[cur_child] = cur_link
+        self.parent_tree_flag = bool(par_link_dict)
+
+        for cur_child, cur_link in par_link_dict.items():
+            cur_fm, cur_to, cur_len = link_dict[cur_link]
+            add_edge(cur_to if cur_child == cur_fm else cur_fm, cur_child, cur_link, cur_len, False)
+
+        # --the other links, unless both ends already hang off their parent links (e.g., a loop of the XML output)
+        par_link_set = set(par_link_dict.values())
+        for cur_link, (cur_fm, cur_to, cur_len) in link_dict.items():
+            if cur_link not in par_link_set and not (cur_fm in par_link_dict and cur_to in par_link_dict):
+                add_edge(cur_fm, cur_to, cur_link, cur_len, False)
+
+        link_end_set = set(fm_list) | set(to_list)
+        for cur_child, cur_par in par_dict.items():
+            if cur_child not in link_end_set and cur_par in self.phases_dict:
+                add_edge(cur_par, cur_child, cur_child, 0.0, True)
+
+        if root_name is None:
+            root_name = swing_name
+        if root_name is None:
+            raise ValueError("No swing node is found; please give the root node")
+        self.root_name = root_name
+
+        self.topo = GlmTopology(fm_list, to_list, link_list, par_list, node_list=list(self.phases_dict))
+        self.len_arr = np.asarray(len_list, dtype=float)
+        self.topo.build_tree(root_name)
+        self.dist_arr = self.calc_distances()
+
+    def calc_distances(self):
+        """The distance (ft) of each node from the root (NaN if not connected), by pointer jumping: each pass adds the
+        distance of the current ancestor and jumps to its ancestor, so log2(depth) vectorized passes are needed
+        """
+        pred_arr = self.topo.pred_arr
+        pred_link_arr = self.topo.pred_link_arr
+        dist_arr = np.where(pred_link_arr >= 0, self.len_arr[np.maximum(pred_link_arr, 0)], 0.0)
+        anc_arr = pred_arr.copy()
+        while True:
+            anc_mask = anc_arr >= 0
+            if not anc_mask.any():
+                break
+            safe_anc_arr = np.where(anc_mask, anc_arr, 0)
+            dist_arr = dist_arr + np.where(anc_mask, dist_arr[safe_anc_arr], 0.0)
+            anc_arr = np.where(anc_mask, anc_arr[safe_anc_arr], -1)
+
+        dist_arr[(pred_arr < 0) & (np.arange(self.topo.num_nodes) != self.topo.root_ind)] = np.nan
+        return dist_arr
+
+    def get_df(self):
+        """A DataFrame of the nodes: the distance (ft & mile), the upstream node, and the phases
+        """
+        pred_arr = self.topo.pred_arr
+        return pd.DataFrame(
+            {
+                "distance_ft": self.dist_arr,
+                "distance_mi": self.dist_arr / FT_PER_MILE,
+                "upstream": [self.topo.node_list[x] if x >= 0 else "" for x in pred_arr],
+                "phases": [self.phases_dict.get(x, "") for x in self.topo.node_list],
+            },
+            index=pd.Index(self.topo.node_list, name="node_name"),
+        )
+
+    @staticmethod
+    def read_voltdump(volt_pfn):
+        """The phase A/B/C voltages of a voltdump file (in the rectangular or the polar mode) as complex columns
+        """
+        with open(volt_pfn, "r") as hf_volt:
+            num_skip_rows = next(i for i, x in enumerate(hf_volt) if not x.startswith("#"))
+        volt_df = pd.read_csv(volt_pfn, skiprows=num_skip_rows, index_col=0)
+
+        cplx_dict = {}
+        for cur_ph in "ABC":
+            if f"volt{cur_ph}_real" in volt_df.columns:
+                cplx_dict[cur_ph] = volt_df[f"volt{cur_ph}_real"].to_numpy() + 1j * volt_df[f"volt{cur_ph}_imag"].to_numpy()
+            else:
+                cplx_dict[cur_ph] = volt_df[f"volt{cur_ph}_mag"].to_numpy() * np.exp(1j * volt_df[f"volt{cur_ph}_angle"].to_numpy())
+        return pd.DataFrame(cplx_dict, index=volt_df.index.astype(str).str.strip())
+
+    def get_pu_volts(self, volt_df, prim_volt=7200.0):
+        """The magnitudes (on 120 V) of the nodes found in the voltdump, with a column per phase (a triplex node has
+        its 1st leg under its own phase, e.g., 'AS' -> 'A'), and whether the node is a primary one
+        """
+        volt_df = volt_df.loc[volt_df.index.isin(self.topo.node_ind_dict)]
+        mag_arr = np.abs(volt_df.to_numpy())
+
+        # --the base voltage, by the first nonzero phase
+        ref_mag_arr = mag_arr[np.arange(len(mag_arr)), np.argmax(mag_arr > 0, axis=1)]
+        base_arr = np.select(
+            [ref_mag_arr < CM_SEC_MAX_VOLT, ref_mag_arr < CM_PRIM_MAX_VOLT, ref_mag_arr < CM_SUBT_MAX_VOLT],
+            [CM_PU_VOLT, prim_volt, CM_SUBT_VOLT / np.sqrt(3)],
+            CM_SUBT_VOLT,
+        )
+        pu_arr = np.where(mag_arr > 0, CM_PU_VOLT * mag_arr / base_arr[:, None], np.nan)
+
+        sec_mask = np.array(["S" in self.phases_dict.get(x, "") for x in volt_df.index])
+        for cur_ind in np.flatnonzero(sec_mask):
+            cur_phases = self.phases_dict[volt_df.index[cur_ind]]
+            cur_leg_pu = pu_arr[cur_ind, 0]
+            pu_arr[cur_ind, :] = np.nan
+            for cur_col, cur_ph in enumerate("ABC"):
+                if cur_ph in cur_phases:
+                    pu_arr[cur_ind, cur_col] = cur_leg_pu
+
+        return pd.DataFrame(pu_arr, index=volt_df.index, columns=list("ABC")), ~sec_mask
+
+    def plot_volt_profile(self, volt_pfn, fig_pfn="", prim_volt=7200.0, prim_only_flag=False, show_flag=True):
+        """Plot the voltages (on 120 V) of a voltdump file against the circuit miles, each node linked to its upstream
+        one (the primary ones solid, the secondary ones dotted)
+        """
+        pu_df, prim_mask = self.get_pu_volts(CircuitMiles.read_voltdump(volt_pfn), prim_volt)
+        node_ind_arr = np.array([self.topo.node_ind_dict[x] for x in pu_df.index], dtype=int)
+        up_ind_arr = self.topo.pred_arr[node_ind_arr]
+
+        # --the rows of the upstream nodes in the voltdump (-1 if not found)
+        row_ind_arr = np.full(self.topo.num_nodes, -1)
+        row_ind_arr[node_ind_arr] = np.arange(len(node_ind_arr))
+        up_row_arr = np.where(up_ind_arr >= 0, row_ind_arr[np.maximum(up_ind_arr, 0)], -1)
+
+        dist_mi_arr = self.dist_arr[node_ind_arr] / FT_PER_MILE
+        up_dist_mi_arr = np.where(up_row_arr >= 0, dist_mi_arr[np.maximum(up_row_arr, 0)], np.nan)
+
+        fig, ax = plt.subplots(figsize=(12, 6))
+        for cur_ph in "ABC":
+            pu_arr = pu_df[cur_ph].to_numpy()
+            up_pu_arr = np.where(up_row_arr >= 0, pu_arr[np.maximum(up_row_arr, 0)], np.nan)
+            for cur_mask, cur_ls in [(prim_mask, "-"), (~prim_mask, ":")]:
+                if cur_ls == ":" and prim_only_flag:
+                    continue
+                pt_mask = cur_mask & ~np.isnan(pu_arr) & ~np.isnan(dist_mi_arr)
+                seg_mask = pt_mask & ~np.isnan(up_pu_arr) & ~np.isnan(up_dist_mi_arr)
+                seg_arr = np.stack(
+                    [
+                        np.column_stack([dist_mi_arr[seg_mask], pu_arr[seg_mask]]),
+                        np.column_stack([up_dist_mi_arr[seg_mask], up_pu_arr[seg_mask]]),
+                    ],
+                    axis=1,
+                )
+                ax.add_collection(LineCollection(seg_arr, colors=CM_PHASE_COLOR_DICT[cur_ph], linestyles=cur_ls, linewidths=0.8))
+                ax.plot(
+                    dist_mi_arr[pt_mask], pu_arr[pt_mask], "o" if cur_ls == "-" else ".",
+                    color=CM_PHASE_COLOR_DICT[cur_ph], markersize=2, label=f"Phase {cur_ph}" if cur_ls == "-" else None,
+                )
+
+        ax.autoscale()
+        ax.set_xlabel("Circuit Miles from Substation")
+        ax.set_ylabel("Voltage Magnitude (120 V base)")
+        ax.set_title("Voltage Magnitudes")
+        ax.legend()
+
+        if fig_pfn:
+            fig.savefig(fig_pfn, bbox_inches="tight")
+        if show_flag:
+            plt.show()
+        else:
+            plt.close(fig)
+
+
+def test_CircuitMiles():
+    import os.path
+    import tempfile
+    import time
+
+    xml_pfn = r"../../IEEE Test Models/123node/IEEE-123.xml"
+    glm_pfn = r"../../IEEE Test Models/123node/IEEE-123.glm"
+
+    # ==The XML output vs. the .glm file (the same lengths)
+    t_st = time.perf_counter()
+    cm_xml = CircuitMiles.from_xml(xml_pfn)
+    print(f"XML: {cm_xml.topo.num_nodes} nodes in {time.perf_counter() - t_st:.3f} s")
+    cm_glm = CircuitMiles.from_glm(glm_pfn)
+    xml_df = cm_xml.get_df()
+    glm_df = cm_glm.get_df()
+    print(xml_df.sort_values("distance_ft").tail())
+
+    cmn_idx = xml_df.index.intersection(glm_df.index)
+    assert len(cmn_idx) > 100
+    assert np.allclose(xml_df.loc[cmn_idx, "distance_ft"], glm_df.loc[cmn_idx, "distance_ft"], equal_nan=True)
+
+    # --the open switches (e.g., 151-300) are not used: 108 is fed via 105-108, and 86 via 76-86
+    assert cm_xml.parent_tree_flag and not cm_glm.parent_tree_flag
+    for cur_df in [xml_df, glm_df]:
+        assert np.isclose(cur_df.loc["108", "distance_ft"], 4475.0)
+        assert cur_df.loc["108", "upstream"] == "105" and cur_df.loc["86", "upstream"] == "76"
+
+    # ==Mixed: the parent links of some nodes only (the others via their links, or at their parent nodes)
+    obj_list = [
+        {"class": "node", "name": "n1", "parent": None, "bustype": "SWING"},
+        {"class": "node", "name": "n2", "parent": "l12"},
+        {"class": "node", "name": "n3", "parent": None},
+        {"class": "node", "name": "n4", "parent": None},
+        {"class": "meter", "name": "m4", "parent": "n4"},
+        {"class": "overhead_line", "name": "l12", "from": "n1", "to": "n2", "length": "100"},
+        {"class": "overhead_line", "name": "l23", "from": "n2", "to": "n3", "length": "200"},
+        {"class": "overhead_line", "name": "l34", "from": "n3", "to": "n4", "length": "0.1 mile"},
+    ]
+    for cur_obj in obj_list:
+        cur_obj.update({x: cur_obj.get(x) for x in ["from", "to", "length"]})
+        cur_obj.update({x: cur_obj.get(x, "") for x in ["bustype", "phases"]})
+    mix_df = CircuitMiles(iter(obj_list)).get_df()
+    assert np.allclose(mix_df.loc[["n1", "n2", "n3", "n4", "m4"], "distance_ft"], [0, 100, 300, 828, 828])
+    assert mix_df.loc["n3", "upstream"] == "n2" and mix_df.loc["m4", "upstream"] == "n4"
+
+    # --each node is one link (or child) farther than its upstream node
+    up_df = glm_df[glm_df["upstream"] != ""]
+    assert (up_df["distance_ft"].to_numpy() >= glm_df.loc[up_df["upstream"], "distance_ft"].to_numpy()).all()
+
+    # ==A made-up voltdump (the voltages drop by 2% per mile), plotted
+    flr_path = tempfile.mkdtemp()
+    volt_pfn = os.path.join(flr_path, "test_voltdump.csv")
+    # --the islands behind the open switches (e.g., 251) are not in the voltdump
+    con_df = glm_df.dropna(subset=["distance_mi"])
+    volt_arr = 2401.78 * (1 - 0.02 * con_df["distance_mi"].to_numpy())
+    with open(volt_pfn, "w") as hf_volt:
+        hf_volt.write("# voltdump for IEEE-123.glm at 2000-01-01 03:00:00 EST\n")
+        hf_volt.write("node_name,voltA_real,voltA_imag,voltB_real,voltB_imag,voltC_real,voltC_imag\n")
+        for cur_name, cur_phases, cur_volt in zip(con_df.index, con_df["phases"], volt_arr):
+            cur_cell_list = []
+            for cur_ph, cur_ang in zip("ABC", [0, -120, 120]):
+                cur_v = cur_volt * np.exp(1j * np.deg2rad(cur_ang)) if cur_ph in cur_phases else 0
+                cur_cell_list += [f"{np.real(cur_v):+.4f}", f"{np.imag(cur_v):+.4f}"]
+            hf_volt.write(f"{cur_name},{','.join(cur_cell_list)}\n")
+
+    pu_df, _ = cm_glm.get_pu_volts(CircuitMiles.read_voltdump(volt_pfn), prim_volt=2401.78)
+    assert np.allclose(pu_df["A"].dropna(), 120 * (1 - 0.02 * glm_df.loc[pu_df["A"].dropna().index, "distance_mi"]))
+
+    fig_pfn = os.path.join(flr_path, "volt_profile.png")
+    cm_glm.plot_volt_profile(volt_pfn, fig_pfn, prim_volt=2401.78, show_flag=False)
+    print(fig_pfn)
+
+
+if __name__ == "__main__":
+    test_CircuitMiles()
@@ -0,0 +1,338 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import io
+import itertools
+import os.path
+import re
+
+import numpy as np
+import pandas as pd
+import scipy.sparse
+import scipy.sparse.linalg
+
+from col_store import COL_STORE_FLR
+
+# @TODO: It is not good to modify the path. Two options (the 2nd one is better): 1) __init__.py; 2) package, then install via pip
+import sys
+
+sys.path.append("../GlmParser")
+
+from glm_index import GlmIndex
+
+# ==Constant
+RE_NR_LOC_HEAD = re.compile(r"^Matrix Index information")
+RE_NR_TS = re.compile(r"^Timestamp:\s*(?P<ts>\d+)\s*-\s*Iteration\s*(?P<iter>\d+)")
+RE_NR_NNZ = re.compile(r"^Matrix Information - non-zero element count\s*=\s*(?P<nnz>\d+)")
+RE_NR_DATA_HEAD = re.compile(r"^Matrix Information - row, column, value")
+# --e.g., '-1.#IND00' (a NaN printed by MSVC)
+RE_NR_IND = re.compile(r"-?1\.#IND0*|-?1\.#QNAN0*")
+
+# --the NR solver puts this (or a larger) value on the diagonals of the swing buses
+NR_SWING_DIAG = 1e9
+
+
+class AdmittanceDump:
+    """The admittance matrix of the NR solver of GLD ('NR_matrix_file' & 'NR_matrix_output_references' of powerflow)
+
+    The dump is a real matrix in the partitioned rectangular form: the rows (& columns) 'start'...'stop' of a bus of
+    n phases are its n imaginary rows, then its n real rows, so each (bus i, bus j) block is [[B, G], [G, -B]]
+    (Y = G + jB). The entries are streamed into a scipy.sparse CSR matrix ('y_mat'), and cached as an .npz file
+    (rebuilt if the dump changes); 'to_complex()' gives the phase-level complex Y-bus, and 'get_bus_df()' maps the
+    buses to the objects of the .glm file.
+    """
+
+    @staticmethod
+    def parse_entries(line_list):
+        """The (row, column, value) arrays of the entry lines
+        """
+        data_str = RE_NR_IND.sub("nan", "".join(line_list))
+        ent_df = pd.read_csv(
+            io.StringIO(data_str), header=None, names=["row", "col", "val"], dtype={"row": np.int32, "col": np.int32, "val": float}
+        )
+        return ent_df["row"].to_numpy(), ent_df["col"].to_numpy(), ent_df["val"].to_numpy()
+
+    @staticmethod
+    def iter_blocks(dump_pfn, chunksize=1000000):
+        """Stream the matrices of a dump (one per powerflow call, or per iteration) with their bus locations
+
+        The bus locations are written on the 1st iteration of each call only, so the last ones are carried over.
+        """
+        loc_list = []
+        loc_flag = False
+        ts_int = None
+        iter_int = None
+        nnz_int = None
+        with open(dump_pfn, "r") as hf_dump:
+            for cur_line in hf_dump:
+                cur_line = cur_line.strip()
+                if RE_NR_LOC_HEAD.match(cur_line):
+                    loc_list = []
+                    loc_flag = True
+                elif RE_NR_TS.match(cur_line):
+                    m_ts = RE_NR_TS.match(cur_line)
+                    ts_int, iter_int = int(m_ts.group("ts")), int(m_ts.group("iter"))
+                    loc_flag = False
+                elif RE_NR_NNZ.match(cur_line):
+                    nnz_int = int(RE_NR_NNZ.match(cur_line).group("nnz"))
+                elif RE_NR_DATA_HEAD.match(cur_line):
+                    # ~~the entries, by chunks
+                    row_list, col_list, val_list = [], [], []
+                    num_left = nnz_int
+                    while num_left > 0:
+                        cur_line_list = list(itertools.islice(hf_dump, min(chunksize, num_left)))
+                        if not cur_line_list:
+                            print(f"The dump ends {num_left} entries short of the matrix at {ts_int} - iteration {iter_int}")
+                            break
+                        num_left -= len(cur_line_list)
+                        cur_row_arr, cur_col_arr, cur_val_arr = AdmittanceDump.parse_entries(cur_line_list)
+                        row_list.append(cur_row_arr)
+                        col_list.append(cur_col_arr)
+                        val_list.append(cur_val_arr)
+
+                    yield {
+                        "timestamp": ts_int,
+                        "iteration": iter_int,
+                        "locations": list(loc_list),
+                        "row": np.concatenate(row_list) if row_list else np.zeros(0, dtype=np.int32),
+                        "col": np.concatenate(col_list) if col_list else np.zeros(0, dtype=np.int32),
+                        "val": np.concatenate(val_list) if val_list else np.zeros(0),
+                    }
+                elif loc_flag and cur_line:
+                    cur_st_str, cur_end_str, cur_name = cur_line.split(",", 2)
+                    loc_list.append((int(cur_st_str), int(cur_end_str), cur_name.strip()))
+
+    @staticmethod
+    def parse(dump_pfn, block_ind=0, chunksize=1000000):
+        """Parse a matrix of a dump (the 1st one by default; -1 for the last one)
+        """
+        if block_ind >= 0:
+            blk_dict = next(itertools.islice(AdmittanceDump.iter_blocks(dump_pfn, chunksize), block_ind, None), None)
+        else:
+            blk_dict = None
+            for blk_dict in AdmittanceDump.iter_blocks(dump_pfn, chunksize):
+                pass
+        if blk_dict is None:
+            raise ValueError(f"The matrix {block_ind} is not found in '{dump_pfn}'")
+
+        row_arr, col_arr, val_arr = blk_dict["row"], blk_dict["col"], blk_dict["val"]
+        num_rows = int(max(row_arr.max(initial=-1), col_arr.max(initial=-1), *[x[1] for x in blk_dict["locations"]])) + 1
+
+        # --the 1st of the repeated entries is kept (as fun_GLD_Matrix_Output_Parse.m does)
+        _, uni_ind_arr = np.unique(row_arr.astype(np.int64) * num_rows + col_arr, return_index=True)
+        if len(uni_ind_arr) < len(row_arr):
+            print(f"{len(row_arr) - len(uni_ind_arr)} repeated entries are dropped")
+            uni_ind_arr.sort()
+            row_arr, col_arr, val_arr = row_arr[uni_ind_arr], col_arr[uni_ind_arr], val_arr[uni_ind_arr]
+        if (val_arr == 0).any():
+            print(f"{(val_arr == 0).sum()} entries are zero (kept as the explicit zeros)")
+
+        y_mat = scipy.sparse.csr_matrix((val_arr, (row_arr, col_arr)), shape=(num_rows, num_rows))
+        return AdmittanceDump(y_mat, blk_dict["locations"], blk_dict["timestamp"], blk_dict["iteration"])
+
+    @staticmethod
+    def get_default_path(dump_pfn, block_ind=0):
+        dump_flr_path, dump_fn = os.path.split(dump_pfn)
+        return os.path.join(dump_flr_path, COL_STORE_FLR, f"{os.path.splitext(dump_fn)[0]}_{block_ind}.npz")
+
+    @staticmethod
+    def is_stale(dump_pfn, npz_pfn):
+        """A cached copy is stale if it is missing, or its dump file has changed since it was saved
+        """
+        if not os.path.exists(npz_pfn):
+            return True
+        dump_stat = os.stat(dump_pfn)
+        with np.load(npz_pfn) as npz_dict:
+            return int(npz_dict["source_size"]) != dump_stat.st_size or float(npz_dict["source_mtime"]) != dump_stat.st_mtime
+
+    @staticmethod
+    def from_dump(dump_pfn, block_ind=0, npz_pfn=""):
+        """Load a matrix of a dump from its cached .npz copy, (re)building the copy if it is missing or stale
+
+        By default, the copy is '<dump folder>/col_store/<dump file name without the suffix>_<block_ind>.npz'.
+        """
+        if not npz_pfn:
+            npz_pfn = AdmittanceDump.get_default_path(dump_pfn, block_ind)
+        if AdmittanceDump.is_stale(dump_pfn, npz_pfn):
+            ad = AdmittanceDump.parse(dump_pfn, block_ind)
+            ad.save(npz_pfn, dump_pfn)
+            return ad
+        return AdmittanceDump.load(npz_pfn)
+
+    @staticmethod
+    def load(npz_pfn):
+        with np.load(npz_pfn) as npz_dict:
+            y_mat = scipy.sparse.csr_matrix(
+                (npz_dict["data"], npz_dict["indices"], npz_dict["indptr"]), shape=tuple(npz_dict["shape"])
+            )
+            loc_list = list(zip(npz_dict["loc_start"].tolist(), npz_dict["loc_stop"].tolist(), npz_dict["loc_name"].tolist()))
+            ts_int = int(npz_dict["timestamp"]) if npz_dict["timestamp"] >= 0 else None
+            iter_int = int(npz_dict["iteration"]) if npz_dict["iteration"] >= 0 else None
+        return AdmittanceDump(y_mat, loc_list, ts_int, iter_int)
+
+    def __init__(self, y_mat, loc_list, timestamp=None, iteration=None):
+        self.y_mat = y_mat
+        self.loc_list = loc_list
+        self.timestamp = timestamp
+        self.iteration = iteration
+
+        self.bus_list = [x[2] for x in loc_list]
+        self.start_arr = np.array([x[0] for x in loc_list], dtype=np.int32)
+        self.stop_arr = np.array([x[1] for x in loc_list], dtype=np.int32)
+        self.num_ph_arr = (self.stop_arr - self.start_arr + 1) // 2
+
+    def save(self, npz_pfn, src_pfn=""):
+        """Save the CSR arrays & the bus locations (and the size & mtime of the dump file, for 'is_stale')
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(npz_pfn)), exist_ok=True)
+        src_stat = os.stat(src_pfn) if src_pfn else None
+        np.savez(
+            npz_pfn,
+            data=self.y_mat.data,
+            indices=self.y_mat.indices,
+            indptr=self.y_mat.indptr,
+            shape=np.array(self.y_mat.shape),
+            loc_start=self.start_arr,
+            loc_stop=self.stop_arr,
+            loc_name=np.array(self.bus_list, dtype=str),
+            timestamp=-1 if self.timestamp is None else self.timestamp,
+            iteration=-1 if self.iteration is None else self.iteration,
+            source_size=-1 if src_stat is None else src_stat.st_size,
+            source_mtime=-1.0 if src_stat is None else src_stat.st_mtime,
+        )
+
+    def get_ph_map(self):
+        """The phase-level index of each row of the dump, and whether the row is an imaginary (upper) one
+        """
+        if not self.loc_list:
+            raise ValueError("The bus locations are not in the dump; please set 'NR_matrix_output_references true'")
+
+        num_rows = self.y_mat.shape[0]
+        ph_ind_arr = np.full(num_rows, -1, dtype=np.int32)
+        imag_row_mask = np.zeros(num_rows, dtype=bool)
+        ph_off_arr = np.concatenate([[0], np.cumsum(self.num_ph_arr)[:-1]])
+        for cur_st, cur_num_ph, cur_ph_off in zip(self.start_arr, self.num_ph_arr, ph_off_arr):
+            ph_ind_arr[cur_st : cur_st + cur_num_ph] = np.arange(cur_ph_off, cur_ph_off + cur_num_ph)
+            ph_ind_arr[cur_st + cur_num_ph : cur_st + 2 * cur_num_ph] = np.arange(cur_ph_off, cur_ph_off + cur_num_ph)
+            imag_row_mask[cur_st : cur_st + cur_num_ph] = True
+        return ph_ind_arr, imag_row_mask
+
+    def to_complex(self):
+        """The phase-level complex Y-bus (CSR), from the upper (imaginary) rows: B on the left, G on the right
+        """
+        ph_ind_arr, imag_row_mask = self.get_ph_map()
+        y_coo = self.y_mat.tocoo()
+        sel_mask = imag_row_mask[y_coo.row] & (ph_ind_arr[y_coo.row] >= 0) & (ph_ind_arr[y_coo.col] >= 0)
+        row_arr, col_arr, val_arr = y_coo.row[sel_mask], y_coo.col[sel_mask], y_coo.data[sel_mask]
+        cplx_val_arr = np.where(imag_row_mask[col_arr], 1j * val_arr, val_arr)
+
+        num_ph = int(self.num_ph_arr.sum())
+        return scipy.sparse.csr_matrix(
+            (cplx_val_arr, (ph_ind_arr[row_arr], ph_ind_arr[col_arr])), shape=(num_ph, num_ph), dtype=complex
+        )
+
+    def get_bus_df(self, glm_idx=None):
+        """The buses (rows & phases of the dump), and their objects in the .glm file ('GlmIndex' or a .glm file)
+        """
+        bus_df = pd.DataFrame(
+            {"start": self.start_arr, "stop": self.stop_arr, "num_phases": self.num_ph_arr},
+            index=pd.Index(self.bus_list, name="bus"),
+        )
+        bus_df["swing"] = [self.y_mat[x, x] >= NR_SWING_DIAG for x in self.start_arr]
+
+        if glm_idx is not None:
+            if isinstance(glm_idx, str):
+                glm_idx = GlmIndex(glm_idx)
+            obj_list = [glm_idx.get_obj(x) if x in glm_idx.by_name else None for x in self.bus_list]
+            bus_df["object"] = [x["name"] if x else None for x in obj_list]
+            bus_df["class"] = [x["class"] if x else None for x in obj_list]
+            bus_df["phases"] = [x["props"].get("phases") if x else None for x in obj_list]
+            if bus_df["object"].isna().any():
+                print(f"{bus_df['object'].isna().sum()} bus(es) are not found in the .glm file")
+        return bus_df
+
+    def get_stats(self):
+        """The structure of the dump: size, nonzeros, density, bandwidth, and the asymmetry of the complex Y-bus
+        """
+        y_coo = self.y_mat.tocoo()
+        y_cplx = self.to_complex() if self.loc_list else None
+        return {
+            "num_rows": self.y_mat.shape[0],
+            "nnz": self.y_mat.nnz,
+            "density": self.y_mat.nnz / max(1, self.y_mat.shape[0] ** 2),
+            "bandwidth": int(np.abs(y_coo.row.astype(np.int64) - y_coo.col).max(initial=0)),
+            "num_buses": len(self.bus_list),
+            "num_swing_rows": int((self.y_mat.diagonal() >= NR_SWING_DIAG).sum()),
+            "max_asym": float(abs(y_cplx - y_cplx.T).max()) if y_cplx is not None and y_cplx.nnz else None,
+        }
+
+    def est_cond(self, drop_swing_flag=True):
+        """An estimate of the 1-norm condition number (via a sparse LU), without the swing rows & columns by default
+        """
+        y_mat = self.y_mat.tocsc()
+        if drop_swing_flag:
+            keep_arr = np.flatnonzero(self.y_mat.diagonal() < NR_SWING_DIAG)
+            y_mat = y_mat[keep_arr][:, keep_arr]
+
+        y_lu = scipy.sparse.linalg.splu(y_mat)
+        inv_op = scipy.sparse.linalg.LinearOperator(
+            y_mat.shape, matvec=y_lu.solve, rmatvec=lambda x: y_lu.solve(x, trans="T"), dtype=float
+        )
+        return scipy.sparse.linalg.onenormest(y_mat) * scipy.sparse.linalg.onenormest(inv_op)
+
+
+def test_AdmittanceDump():
+    import tempfile
+    import time
+
+    dump_pfn = r"../../matlab_scripts/NR_admittance_dump/admittance_dump.txt"
+    glm_pfn = r"../../matlab_scripts/NR_admittance_dump/IEEE_4node_Admittance_Dump.glm"
+
+    # ==The sample dump of the IEEE 4-node system
+    ad = AdmittanceDump.parse(dump_pfn)
+    print(ad.get_bus_df(glm_pfn))
+    print(ad.get_stats())
+    print(f"cond (w/o swing) ~ {ad.est_cond():.3e}")
+    y_cplx = ad.to_complex()
+    print(np.round(y_cplx[9:12, 9:12].toarray(), 4))
+    assert ad.y_mat.shape == (24, 24) and ad.y_mat.nnz == 312
+    assert y_cplx.shape == (12, 12)
+
+    # ==A made-up dump of 5000 3-phase buses (a chain), cached & reloaded
+    flr_path = tempfile.mkdtemp()
+    big_pfn = os.path.join(flr_path, "admittance_dump.txt")
+    rng = np.random.default_rng(0)
+    num_buses = 5000
+    with open(big_pfn, "w") as hf_dump:
+        hf_dump.write("Note: All indices are zero-referenced.\n\nMatrix Index information for this call - start,stop,name\n")
+        hf_dump.write("".join(f"{6 * x},{6 * x + 5},n{x}\n" for x in range(num_buses)))
+        ent_list = []
+        for cur_bus in range(num_buses):
+            for cur_nb in [cur_bus - 1, cur_bus, cur_bus + 1]:
+                if 0 <= cur_nb < num_buses:
+                    cur_blk = rng.uniform(-1, 1, (6, 6)) + (cur_nb == cur_bus) * 20 * np.eye(6)
+                    ent_list.append(
+                        pd.DataFrame({"r": np.repeat(np.arange(6), 6) + 6 * cur_bus, "c": np.tile(np.arange(6), 6) + 6 * cur_nb, "v": cur_blk.ravel()})
+                    )
+        ent_df = pd.concat(ent_list).sort_values(["c", "r"])
+        hf_dump.write(f"\nTimestamp: 946702800 - Iteration 0\nMatrix Information - non-zero element count = {len(ent_df)}\n")
+        hf_dump.write("Matrix Information - row, column, value\n")
+        ent_df.to_csv(hf_dump, header=False, index=False, float_format="%.6f")
+
+    t_st = time.perf_counter()
+    ad = AdmittanceDump.from_dump(big_pfn)
+    t_parse = time.perf_counter() - t_st
+    t_st = time.perf_counter()
+    ad_cached = AdmittanceDump.from_dump(big_pfn)
+    print(f"{ad.y_mat.nnz} entries: parsed & cached in {t_parse:.2f} s, reloaded in {time.perf_counter() - t_st:.3f} s")
+
+    assert (ad.y_mat != ad_cached.y_mat).nnz == 0
+    assert ad_cached.bus_list[-1] == f"n{num_buses - 1}"
+    assert ad.to_complex().shape == (3 * num_buses, 3 * num_buses)
+
+
+if __name__ == "__main__":
+    test_AdmittanceDump()
@@ -0,0 +1,211 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import concurrent.futures
+import os.path
+import pickle
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from col_store import find_result_files
+from extractor_csv import CsvExt
+
+# ==Constant
+BATCH_INDEX_NAMES = ["inverter", "q_pu"]
+
+
+def eval_package_file(csv_pfn, dict_swt=None, store_flag=False):
+    """Package one result file (see 'CsvExt.eval_package_df'), indexed by the Q (p.u.) of its rows
+    """
+    csv_folder_path, csv_file_name = os.path.split(csv_pfn)
+    p = CsvExt(csv_folder_path, csv_file_name, store_flag)
+    p.eval_package_df(dict_swt)
+
+    pkg_df = p.pkg_df.copy()
+    pkg_df.index = pd.Index(p.pv_q_pu_ser.to_numpy(), name=BATCH_INDEX_NAMES[1])
+    return pkg_df
+
+
+# ~~the shared inputs are handed to each pool worker once, instead of once per file
+_pool_dict_swt = None
+_pool_store_flag = False
+
+
+def _init_pool_worker(dict_swt, store_flag):
+    global _pool_dict_swt, _pool_store_flag
+    _pool_dict_swt = dict_swt
+    _pool_store_flag = store_flag
+
+
+def _eval_pool_file(csv_pfn):
+    try:
+        return csv_pfn, eval_package_file(csv_pfn, _pool_dict_swt, _pool_store_flag), None
+    except Exception as err:
+        return csv_pfn, None, f"{type(err).__name__}: {err}"
+
+
+def eval_package_folder(
+    csv_folder_path,
+    dict_swt=None,
+    max_workers=None,
+    store_flag=False,
+    csv_suff=".csv",
+    recursive_flag=False,
+    pickle_pfn="",
+):
+    """Package all the result files of a folder on a process pool, and concatenate them
+
+    The result is indexed by (inverter, Q in p.u.), where the inverter is the name of the file without the suffix.
+    The files that cannot be processed are reported and left out.
+    """
+    csv_pfn_list = find_result_files(csv_folder_path, csv_suff, recursive_flag)
+
+    pkg_df_dict = {}
+    err_dict = {}
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_pool_worker,
+        initargs=(dict_swt, store_flag),
+    ) as pool:
+        for cur_pfn, cur_pkg_df, cur_err in pool.map(_eval_pool_file, csv_pfn_list, chunksize=4):
+            cur_key = os.path.splitext(os.path.relpath(cur_pfn, csv_folder_path))[0]
+            if cur_err is None:
+                pkg_df_dict[cur_key] = cur_pkg_df
+            else:
+                err_dict[cur_key] = cur_err
+
+    for cur_key, cur_err in err_dict.items():
+        print(f"'{cur_key}' is skipped: {cur_err}")
+    if not pkg_df_dict:
+        return pd.DataFrame()
+
+    all_pv_df = pd.concat(pkg_df_dict, names=BATCH_INDEX_NAMES)
+
+    if pickle_pfn:
+        with open(pickle_pfn, "wb") as hf_pkl:
+            pickle.dump(all_pv_df, hf_pkl)
+
+    return all_pv_df
+
+
+def render_file_plots(csv_pfn, plot_list, dict_swt=None, store_flag=False, max_pts=2000, ds_method="lttb", fig_fmt_str=".png"):
+    """Render the plots ('dq_dv', 'price_q', and/or 'dv_swt') of one result file, without showing them
+    """
+    csv_folder_path, csv_file_name = os.path.split(csv_pfn)
+    p = CsvExt(csv_folder_path, csv_file_name, store_flag)
+    p.plot_max_pts = max_pts
+    p.plot_ds_method = ds_method
+
+    p.read_data()
+    p.pre_process()
+    if "dq_dv" in plot_list:
+        p.plot_dq_dv(fig_fmt_str=fig_fmt_str, show_flag=False)
+    if "price_q" in plot_list:
+        p.get_price_q()
+        p.plot_price_q_curve(fig_fmt_str=fig_fmt_str, show_flag=False)
+    if "dv_swt" in plot_list and dict_swt is not None:
+        p.get_dv_swt(dict_swt)
+        p.filter_line_slope()
+        p.plot_dv_swt(fig_fmt_str=fig_fmt_str, show_flag=False)
+
+
+_pool_plot_kwargs = {}
+
+
+def _init_plot_pool_worker(plot_kwargs):
+    global _pool_plot_kwargs
+    _pool_plot_kwargs = plot_kwargs
+
+    # --headless: nothing is shown, and no GUI event loop is needed
+    plt.switch_backend("Agg")
+
+
+def _render_pool_file(csv_pfn):
+    try:
+        render_file_plots(csv_pfn, **_pool_plot_kwargs)
+        return csv_pfn, None
+    except Exception as err:
+        return csv_pfn, f"{type(err).__name__}: {err}"
+
+
+def render_plots_folder(
+    csv_folder_path,
+    plot_list=("dq_dv", "price_q", "dv_swt"),
+    dict_swt=None,
+    max_workers=None,
+    max_pts=2000,
+    ds_method="lttb",
+    fig_fmt_str=".png",
+    store_flag=False,
+    csv_suff=".csv",
+    recursive_flag=False,
+):
+    """Render the plots of all the result files of a folder on a process pool (with the Agg backend)
+
+    The figures are saved next to the result files. The series longer than 'max_pts' are downsampled by
+    'lttb' or 'minmax' (see downsample.py); a raster format (e.g., '.png') is much faster to write than '.svg'.
+    """
+    csv_pfn_list = find_result_files(csv_folder_path, csv_suff, recursive_flag)
+    plot_kwargs = {
+        "plot_list": plot_list,
+        "dict_swt": dict_swt,
+        "store_flag": store_flag,
+        "max_pts": max_pts,
+        "ds_method": ds_method,
+        "fig_fmt_str": fig_fmt_str,
+    }
+
+    num_done = 0
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_plot_pool_worker,
+        initargs=(plot_kwargs,),
+    ) as pool:
+        for cur_pfn, cur_err in pool.map(_render_pool_file, csv_pfn_list, chunksize=4):
+            if cur_err is None:
+                num_done += 1
+            else:
+                print(f"'{cur_pfn}' is skipped: {cur_err}")
+    print(f"The plots of {num_done} (out of {len(csv_pfn_list)}) files are rendered")
+
+
+def test_eval_package_folder():
+    import time
+
+    # ==Param
+    csv_folder_path = r"D:\csv files_UC1SC1_MidTopo"
+    dict_swt = {
+        "RCL2": ["n264462735_1209", "n256860543_1207"],
+        "RCL7": ["n259333341_1212", "n617197553_1209"],
+        "RCL9": ["n439934984_1210", "n256904390_1209"],
+        "RCL11": ["n256834423_1212", "n616009828_1210"]
+    }
+    pickle_pfn = os.path.join(csv_folder_path, r"all_pv_df.pickle")
+
+    # ==Run
+    st_time = time.time()
+    all_pv_df = eval_package_folder(csv_folder_path, dict_swt, pickle_pfn=pickle_pfn)
+    print(f"Time elapsed: {time.time() - st_time} (secs)")
+    print(all_pv_df)
+
+    # --e.g., all the inverters at Q = 0.5 p.u.
+    # print(all_pv_df.xs(0.5, level="q_pu"))
+
+
+def test_render_plots_folder():
+    import time
+
+    csv_folder_path = r"D:\csv files_UC1SC1_MidTopo"
+
+    st_time = time.time()
+    render_plots_folder(csv_folder_path, plot_list=("dq_dv", "price_q"))
+    print(f"Time elapsed: {time.time() - st_time} (secs)")
+
+
+if __name__ == "__main__":
+    test_eval_package_folder()
+    # test_render_plots_folder()
@@ -1,57 +1,41 @@
 # ***************************************
 # Author: Jing Xie
 # Created Date: 2020-8-6
-# Updated Date: 2020-8-6
+# Updated Date: 2026-10-19
 # Email: jing.xie@pnnl.gov
 # ***************************************
 
-import re
-import math
-
-def parse_volt_phasor(volt_ph_str):
-    def get_float_list(ori_str):
-        float_reg = re.compile(r"[-+]?\d+\.?\d*")
-        return float_reg.findall(ori_str)
-
-    try:
-        if volt_ph_str[-1] == 'j':
-            return complex(volt_ph_str)
-        elif volt_ph_str[-1] == 'd':
-            cur_float_list = get_float_list(volt_ph_str)
-            if len(cur_float_list) != 2:
-                raise Exception("Voltage phasor string ends with 'd' but is incorrect.")
-            else:
-                cur_volt_mag = float(cur_float_list[0])
-                cur_volt_ang_rad = math.radians(float(cur_float_list[1]))
-                return complex(cur_volt_mag*math.cos(cur_volt_ang_rad), cur_volt_mag*math.sin(cur_volt_ang_rad))
-        else:
-            raise Exception("Voltage phasor string ends with either 'j' or 'd'.")
-    except IndexError as err:
-        print(f"The input string cannot be empty: {err}")
-    except Exception as err:
-        print(f"The input string has an unknown format: {err}")
-    except:
-        print("Unexpected error:", sys.exc_info()[0])
-        raise
+import numpy as np
+
+from phasor import parse_phasor_arr
 
-def calc_volt_mag_diff(rcl_name_str, a, b, c, d):
-    a_cp = [parse_volt_phasor(cur_item) for cur_item in a]
-    b_cp = [parse_volt_phasor(cur_item) for cur_item in b]
-    c_cp = [parse_volt_phasor(cur_item) for cur_item in c]
-    d_cp = [parse_volt_phasor(cur_item) for cur_item in d]
 
-    from_node_cmp_list = [abs(cur_a) - abs(cur_c) for cur_a, cur_c in zip(a_cp, c_cp)]
+def parse_volt_phasor(volt_ph_list):
+    volt_ph_arr, bad_mask = parse_phasor_arr(volt_ph_list)
+    if bad_mask.any():
+        print(f"The input string has an unknown format: {np.asarray(volt_ph_list, dtype=object)[bad_mask].tolist()}")
+    return volt_ph_arr
+
+def calc_volt_mag_diff(rcl_name_str, a, b, c, d):
+    # --each list is parsed on its own (the lists may differ in length), and compared on their common phases
+    mag_list = [np.abs(parse_volt_phasor(x)) for x in [a, b, c, d]]
+    num_ph = min([len(x) for x in mag_list])
+    if any([len(x) != num_ph for x in mag_list]):
+        print(f'The voltage lists of "{rcl_name_str}" differ in length, only the first {num_ph} phase(s) are compared')
+    a_mag, b_mag, c_mag, d_mag = [x[:num_ph] for x in mag_list]
+
+    from_node_cmp_list = (a_mag - c_mag).tolist()
     print(f'From node of "{rcl_name_str}" voltage magnitude differences (a, b, c phases): {from_node_cmp_list}')
 
-    to_node_cmp_list = [abs(cur_b) - abs(cur_d) for cur_b, cur_d in zip(b_cp, d_cp)]
+    to_node_cmp_list = (b_mag - d_mag).tolist()
     print(to_node_cmp_list)
 
     # print(a_cp)
     # print(b_cp)
-    no_pv_rcl_fmto_list = [abs(cur_a) - abs(cur_b) for cur_a, cur_b in zip(a_cp, b_cp)]
+    no_pv_rcl_fmto_list = (a_mag - b_mag).tolist()
     print(no_pv_rcl_fmto_list)
 
-    with_pv_rcl_fmto_list = [abs(cur_c) - abs(cur_d) for cur_c, cur_d in zip(c_cp, d_cp)]
+    with_pv_rcl_fmto_list = (c_mag - d_mag).tolist()
     print(with_pv_rcl_fmto_list)
 
 def calc_init_topo():
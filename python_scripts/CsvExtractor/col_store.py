@@ -0,0 +1,260 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import json
+import os.path
+import re
+
+import numpy as np
+import pandas as pd
+
+from recorder_io import REC_KIND_DTYPE_DICT, REC_TS_COL, RecorderReader
+
+# ==Constant
+COL_STORE_MANIFEST_FN = "manifest.json"
+COL_STORE_FLR = "col_store"
+
+
+def find_result_files(csv_folder_path, csv_suff=".csv", recursive_flag=False):
+    """Find the result (.csv) files of a sweep, e.g., one multi-recorder file per inverter
+    """
+    csv_pfn_list = []
+    for root, dirs, files in os.walk(csv_folder_path):
+        # --skip the columnar stores
+        dirs[:] = sorted([x for x in dirs if x != COL_STORE_FLR]) if recursive_flag else []
+        for cur_fn in sorted(files):
+            if cur_fn.endswith(csv_suff):
+                csv_pfn_list.append(os.path.join(root, cur_fn))
+    return csv_pfn_list
+
+
+class ColStore:
+    """A columnar store of a recorder file: one .npy per column & a JSON manifest of the objects and properties
+
+    The columns are opened with 'np.load(mmap_mode="r")', so the repeated analyses read only the pages they touch,
+    and do not copy the data.
+    """
+
+    @staticmethod
+    def get_col_fn(col_ind, col_str):
+        return f"{col_ind:04d}_{re.sub(r'[^0-9A-Za-z_.-]+', '_', col_str)}.npy"
+
+    @staticmethod
+    def count_rows(csv_pfn, header_ln, blk_size=1 << 24):
+        """Count the data rows (i.e., the non-empty lines after the header line)
+        """
+        num_lines = 0
+        last_b = b"\n"
+        with open(csv_pfn, "rb") as hf_csv:
+            while True:
+                cur_blk = hf_csv.read(blk_size)
+                if not cur_blk:
+                    break
+                num_lines += cur_blk.count(b"\n")
+                last_b = cur_blk[-1:]
+        if last_b != b"\n":
+            num_lines += 1
+        return num_lines - header_ln - 1
+
+    @staticmethod
+    def convert(csv_pfn, store_flr_path, chunksize=500000):
+        """Convert a recorder file into a columnar store, chunk by chunk
+        """
+        rr = RecorderReader(csv_pfn)
+        num_rows = ColStore.count_rows(csv_pfn, rr.header_ln)
+        os.makedirs(store_flr_path, exist_ok=True)
+
+        col_mm_dict = {}
+        col_info_list = []
+        tz_str = ""
+        st_row = 0
+        for cur_rec_df in rr.iter_chunks(chunksize=chunksize):
+            # --the files are created with the dtypes of the column kinds (decided once, on the 1st chunk)
+            if not col_mm_dict:
+                tz_str = cur_rec_df.attrs.get("tz", "")
+                for cur_ind, cur_col in enumerate(cur_rec_df.columns):
+                    cur_fn = ColStore.get_col_fn(cur_ind, cur_col)
+                    cur_dtype = REC_KIND_DTYPE_DICT[rr.kind_dict[cur_col]]
+                    col_mm_dict[cur_col] = np.lib.format.open_memmap(
+                        os.path.join(store_flr_path, cur_fn),
+                        mode="w+",
+                        dtype=cur_dtype,
+                        shape=(num_rows,),
+                    )
+                    cur_obj_str, _, cur_prop_str = cur_col.rpartition(":")
+                    col_info_list.append(
+                        {
+                            "name": cur_col,
+                            "file": cur_fn,
+                            "dtype": str(cur_dtype),
+                            "object": cur_obj_str,
+                            "property": cur_prop_str,
+                        }
+                    )
+
+            # --a column widened to a phasor one in a later chunk (see 'RecorderReader.iter_chunks') is rewritten as such
+            for cur_ind, cur_col in enumerate(cur_rec_df.columns):
+                cur_dtype = REC_KIND_DTYPE_DICT[rr.kind_dict[cur_col]]
+                if col_mm_dict[cur_col].dtype != cur_dtype:
+                    pre_arr = np.array(col_mm_dict[cur_col][:st_row])
+                    del col_mm_dict[cur_col]
+                    col_mm_dict[cur_col] = np.lib.format.open_memmap(
+                        os.path.join(store_flr_path, col_info_list[cur_ind]["file"]),
+                        mode="w+",
+                        dtype=cur_dtype,
+                        shape=(num_rows,),
+                    )
+                    col_mm_dict[cur_col][:st_row] = pre_arr
+                    col_info_list[cur_ind]["dtype"] = str(cur_dtype)
+
+            cur_num = len(cur_rec_df)
+            for cur_col, cur_mm in col_mm_dict.items():
+                cur_mm[st_row : st_row + cur_num] = cur_rec_df[cur_col].to_numpy()
+            st_row += cur_num
+
+        for cur_mm in col_mm_dict.values():
+            cur_mm.flush()
+        num_rows = min(num_rows, st_row)
+
+        # ==Manifest (written last, so an interrupted conversion is not taken as a store)
+        obj_dict = {}
+        for cur_info in col_info_list:
+            if cur_info["name"] != REC_TS_COL:
+                obj_dict.setdefault(cur_info["object"], []).append(cur_info["property"])
+
+        csv_stat = os.stat(csv_pfn)
+        manifest_dict = {
+            "source": os.path.abspath(csv_pfn),
+            "source_size": csv_stat.st_size,
+            "source_mtime": csv_stat.st_mtime,
+            "num_rows": num_rows,
+            "tz": tz_str,
+            "meta": rr.meta_dict,
+            "columns": col_info_list,
+            "objects": obj_dict,
+        }
+        with open(os.path.join(store_flr_path, COL_STORE_MANIFEST_FN), "w") as hf_manifest:
+            json.dump(manifest_dict, hf_manifest, indent=4)
+
+        return ColStore(store_flr_path)
+
+    @staticmethod
+    def is_stale(csv_pfn, store_flr_path):
+        """A store is stale if it is missing, or its source file has changed since the conversion
+        """
+        manifest_pfn = os.path.join(store_flr_path, COL_STORE_MANIFEST_FN)
+        if not os.path.exists(manifest_pfn):
+            return True
+        with open(manifest_pfn, "r") as hf_manifest:
+            manifest_dict = json.load(hf_manifest)
+        csv_stat = os.stat(csv_pfn)
+        return (
+            manifest_dict.get("source_size") != csv_stat.st_size
+            or manifest_dict.get("source_mtime") != csv_stat.st_mtime
+        )
+
+    @staticmethod
+    def from_csv(csv_pfn, store_flr_path="", chunksize=500000):
+        """Open the store of a recorder file, (re)building it if it is missing or stale
+
+        By default, the store is '<csv folder>/col_store/<csv file name without the suffix>'.
+        """
+        if not store_flr_path:
+            store_flr_path = ColStore.get_default_path(csv_pfn)
+        if ColStore.is_stale(csv_pfn, store_flr_path):
+            return ColStore.convert(csv_pfn, store_flr_path, chunksize)
+        return ColStore(store_flr_path)
+
+    @staticmethod
+    def get_default_path(csv_pfn):
+        csv_flr_path, csv_fn = os.path.split(csv_pfn)
+        return os.path.join(csv_flr_path, COL_STORE_FLR, os.path.splitext(csv_fn)[0])
+
+    @staticmethod
+    def convert_folder(csv_flr_path, csv_suff=".csv", chunksize=500000):
+        """Convert (or refresh) the stores of all the recorder files in a folder (e.g., the results of a sweep)
+        """
+        store_list = []
+        for cur_fn in sorted(os.listdir(csv_flr_path)):
+            cur_pfn = os.path.join(csv_flr_path, cur_fn)
+            if cur_fn.endswith(csv_suff) and os.path.isfile(cur_pfn):
+                store_list.append(ColStore.from_csv(cur_pfn, chunksize=chunksize))
+        return store_list
+
+    def __init__(self, store_flr_path):
+        """Open a store (the columns are mapped on access)
+        """
+        self.store_flr_path = store_flr_path
+        with open(os.path.join(store_flr_path, COL_STORE_MANIFEST_FN), "r") as hf_manifest:
+            self.manifest_dict = json.load(hf_manifest)
+
+        self.col_info_dict = {x["name"]: x for x in self.manifest_dict["columns"]}
+        self.col_list = [x["name"] for x in self.manifest_dict["columns"]]
+        self.num_rows = self.manifest_dict["num_rows"]
+
+    def get_col(self, col_str):
+        """A read-only memory map of a column
+        """
+        col_arr = np.load(os.path.join(self.store_flr_path, self.col_info_dict[col_str]["file"]), mmap_mode="r")
+        return col_arr[: self.num_rows]
+
+    def get_obj_cols(self, obj_str):
+        return [f"{obj_str}:{x}" for x in self.manifest_dict["objects"].get(obj_str, [])]
+
+    def to_df(self, col_list=None):
+        """A DataFrame over the memory-mapped columns (all, or the given ones)
+        """
+        if col_list is None:
+            col_list = self.col_list
+        return pd.DataFrame({x: self.get_col(x) for x in col_list}, copy=False)
+
+
+def test_ColStore():
+    import tempfile
+    import time
+
+    flr_path = tempfile.mkdtemp()
+    csv_pfn = os.path.join(flr_path, "Inv1.csv")
+    num = 300000
+    ts_arr = np.datetime64("2000-01-01 00:00:00") + np.arange(num).astype("timedelta64[s]")
+    with open(csv_pfn, "w") as hf_csv:
+        hf_csv.write("# file...... Inv1.csv\n# interval.. 1\n# timestamp,n1:voltage_A,n2:voltage_A,q_player:value\n")
+        rows_arr = np.char.add(
+            np.char.add(np.char.replace(np.datetime_as_string(ts_arr), "T", " "), " EST,+7200.5-0.25d,+7100-120.5d,"),
+            np.char.mod("%.6g", np.linspace(-1, 1, num)),
+        )
+        # --a phasor column that starts with a real-looking cell
+        rows_arr[0] = "2000-01-01 00:00:00 EST,+7200.5-0.25d,7100,-1"
+        hf_csv.write("\n".join(rows_arr.tolist()) + "\n")
+
+    st_time = time.time()
+    cs = ColStore.from_csv(csv_pfn, chunksize=100000)
+    print(f"Converted in {time.time() - st_time} (secs): {cs.manifest_dict['objects']}")
+
+    st_time = time.time()
+    cs = ColStore.from_csv(csv_pfn)
+    rec_df = cs.to_df()
+    print(f"Reopened in {time.time() - st_time} (secs)")
+    print(rec_df.dtypes, rec_df.tail(2), sep="\n")
+
+    assert len(rec_df) == num
+    assert isinstance(cs.get_col("n1:voltage_A"), np.memmap)
+    assert cs.col_info_dict["n2:voltage_A"]["dtype"] == "complex128"
+    assert np.allclose(np.abs(cs.get_col("n2:voltage_A")), 7100)
+
+    # --a column of real-looking cells in the 1st chunk, widened to a phasor one in a later chunk
+    wide_csv_pfn = os.path.join(flr_path, "Inv2.csv")
+    with open(wide_csv_pfn, "w") as hf_csv:
+        hf_csv.write("# timestamp,n1:voltage_A\n")
+        hf_csv.write("".join([f"2000-01-01 00:00:{x:02d} EST,7200.5\n" for x in range(3)]))
+        hf_csv.write("".join([f"2000-01-01 00:00:{x:02d} EST,+7200.5-0.25d\n" for x in range(3, 10)]))
+    cs = ColStore.from_csv(wide_csv_pfn, chunksize=3)
+    assert cs.col_info_dict["n1:voltage_A"]["dtype"] == "complex128"
+    assert np.allclose(np.abs(cs.get_col("n1:voltage_A")), 7200.5)
+
+
+if __name__ == "__main__":
+    test_ColStore()
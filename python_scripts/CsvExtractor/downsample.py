@@ -0,0 +1,99 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import numpy as np
+
+
+def downsample_minmax(x_arr, y_arr, max_pts):
+    """Indices of the min & max of each bucket (plus the 1st & last points), i.e., at most 'max_pts' points
+
+    The envelope of the series is kept, so the spikes survive the downsampling.
+    """
+    num = len(y_arr)
+    if num <= max_pts or max_pts < 4:
+        return np.arange(num)
+
+    num_bkt = (max_pts - 2) // 2
+    edge_arr = np.linspace(1, num - 1, num_bkt + 1).astype(np.int64)
+    bkt_len = int(np.max(np.diff(edge_arr)))
+
+    # --pad each bucket to the same length, so the min & max are found for all buckets at once
+    ind_mat = edge_arr[:-1, np.newaxis] + np.arange(bkt_len)
+    valid_mat = ind_mat < edge_arr[1:, np.newaxis]
+    ind_mat = np.minimum(ind_mat, num - 2)
+    val_mat = y_arr[ind_mat]
+
+    min_ind_arr = ind_mat[np.arange(num_bkt), np.argmin(np.where(valid_mat, val_mat, np.inf), axis=1)]
+    max_ind_arr = ind_mat[np.arange(num_bkt), np.argmax(np.where(valid_mat, val_mat, -np.inf), axis=1)]
+
+    return np.unique(np.concatenate([[0, num - 1], min_ind_arr, max_ind_arr]))
+
+
+def downsample_lttb(x_arr, y_arr, max_pts):
+    """Indices of the points picked by the Largest-Triangle-Three-Buckets algorithm
+
+    Each bucket keeps the point forming the largest triangle with the point kept in the previous bucket and the
+    average of the next bucket, which preserves the visual shape of the series.
+    """
+    num = len(y_arr)
+    if num <= max_pts or max_pts < 3:
+        return np.arange(num)
+
+    x_arr = np.asarray(x_arr, dtype=float)
+    y_arr = np.asarray(y_arr, dtype=float)
+
+    edge_arr = np.linspace(1, num - 1, max_pts - 1).astype(np.int64)
+    ind_arr = np.zeros(max_pts, dtype=np.int64)
+    ind_arr[-1] = num - 1
+
+    prev_ind = 0
+    for cur_bkt in range(max_pts - 2):
+        cur_st, cur_end = edge_arr[cur_bkt], edge_arr[cur_bkt + 1]
+        nxt_st, nxt_end = cur_end, edge_arr[cur_bkt + 2] if cur_bkt + 2 < len(edge_arr) else num
+        nxt_end = max(nxt_end, nxt_st + 1)
+
+        nxt_x = x_arr[nxt_st:nxt_end].mean()
+        nxt_y = y_arr[nxt_st:nxt_end].mean()
+
+        area_arr = np.abs(
+            (x_arr[prev_ind] - nxt_x) * (y_arr[cur_st:cur_end] - y_arr[prev_ind])
+            - (x_arr[prev_ind] - x_arr[cur_st:cur_end]) * (nxt_y - y_arr[prev_ind])
+        )
+        prev_ind = cur_st + int(np.argmax(area_arr))
+        ind_arr[cur_bkt + 1] = prev_ind
+
+    return ind_arr
+
+
+DOWNSAMPLE_FUNC_DICT = {"minmax": downsample_minmax, "lttb": downsample_lttb}
+
+
+def downsample(x_arr, y_arr, max_pts, method="lttb"):
+    """Downsample a series; returns the kept x & y values
+    """
+    x_arr = np.asarray(x_arr)
+    y_arr = np.asarray(y_arr)
+    ind_arr = DOWNSAMPLE_FUNC_DICT[method](x_arr, y_arr, max_pts)
+    return x_arr[ind_arr], y_arr[ind_arr]
+
+
+def test_downsample():
+    import time
+
+    num = 2000000
+    x_arr = np.arange(num, dtype=float)
+    y_arr = np.sin(x_arr / 1e5) + np.random.default_rng(0).normal(0, 0.01, num)
+    y_arr[123457] = 5.0
+
+    for cur_method in DOWNSAMPLE_FUNC_DICT:
+        st_time = time.time()
+        x_ds_arr, y_ds_arr = downsample(x_arr, y_arr, 2000, cur_method)
+        print(f"{cur_method}: {len(x_ds_arr)} points in {time.time() - st_time} (secs), max: {y_ds_arr.max()}")
+        assert y_ds_arr.max() == 5.0
+
+
+if __name__ == "__main__":
+    test_downsample()
@@ -1,30 +1,40 @@
 # ***************************************
 # Author: Jing Xie
 # Created Date: 2020-5-1
-# Updated Date: 2020-6-1
+# Updated Date: 2026-10-19
 # Email: jing.xie@pnnl.gov
 # ***************************************
 
+import numpy as np
 import pandas as pd
 # import seaborn as sns
 import matplotlib.pyplot as plt
 
-import re
 import os.path
-import sys
-import math
+
+from phasor import parse_phasor_df, parse_phasor_str
+from recorder_io import RecorderReader
+from col_store import ColStore
+from downsample import downsample
 
 
 class CsvExt:
     """Extract data from (.csv) files of results"""
 
-    def __init__(self, csv_folder_path, csv_file_name):
+    def __init__(self, csv_folder_path, csv_file_name, store_flag=False):
         """Init the settings
         """
         # ==CSV
         self.csv_folder_path = csv_folder_path
         self.csv_file_name = csv_file_name
 
+        # ==Columnar store (see 'read_store'), used by the 'eval_*' funcs if enabled
+        self.store_flag = store_flag
+
+        # ==Plots: the long series are downsampled ('lttb' or 'minmax') to this number of points, if set
+        self.plot_max_pts = None
+        self.plot_ds_method = "lttb"
+
         # ==DataFrame
         self.csv_df = None
         self.nd_volt_v_df = None
@@ -49,43 +59,94 @@ class CsvExt:
     def read_csv(
         self,
         csv_pfn="",
-        skiprows_list=[x for x in range(7)],
+        skiprows_list=None,
         skipinitialspace_flag=True,
     ):
         """Get the DataFrame
+
+        The header block is skipped up to the '# timestamp,...' line, unless 'skiprows_list' is given.
+        See 'RecorderReader' for the typed (datetime64/complex128) & chunked reading.
         """
         if not csv_pfn:
             csv_pfn = self.csv_pfn
 
+        if skiprows_list is None:
+            skiprows_list = range(RecorderReader(csv_pfn).header_ln)
+
         self.csv_df = pd.read_csv(
             csv_pfn, skiprows=skiprows_list, skipinitialspace=skipinitialspace_flag
         )
 
-    def pre_process(self, num_nds=8, num_phs=3):
+    def read_store(self, store_flr_path=""):
+        """Get the DataFrame from the columnar store of the csv file (built on the 1st call, or if the file changes)
+
+        The columns are memory-mapped, and the phasors are complex already, so nothing is parsed again.
+        """
+        self.csv_df = ColStore.from_csv(self.csv_pfn, store_flr_path).to_df()
+
+    def read_data(self):
+        if self.store_flag:
+            self.read_store()
+        else:
+            self.read_csv()
+
+    def pre_process(self, num_nds=8, num_phs=3, ref_q_pu=0, ref_volt_mag=None):
         """Get the Selected Data Columns
+
+        The delta V is taken from a reference scenario: the row at Q = 'ref_q_pu' (p.u.) by default, or the given
+        voltage magnitudes 'ref_volt_mag' (one per column, e.g., from a base case without PV).
         """
         #== Q
         self.pv_q_pu_ser = self.csv_df.iloc[:, -1]
         self.pv_q_var_ser = self.csv_df.iloc[:, 1]
         
-        ind_q_zero = pd.Index(self.pv_q_pu_ser).get_loc(0)
-        
         #== V & Delta V
-        self.nd_volt_v_df = self.csv_df.iloc[:, 2 : 2 + num_nds * num_phs]
-        self.nd_volt_mag_v_df = pd.DataFrame()
-        self.nd_delta_volt_mag_v_df = pd.DataFrame()
-        for cur_col in self.nd_volt_v_df.columns:
-            self.nd_volt_v_df[cur_col] = self.nd_volt_v_df[cur_col].apply(lambda x: CsvExt.parse_volt_phasor(x))
-            self.nd_volt_mag_v_df[cur_col] = self.nd_volt_v_df[cur_col].apply(lambda x: abs(x))
-            self.nd_delta_volt_mag_v_df[cur_col] = self.nd_volt_mag_v_df[cur_col].apply(lambda x: x - self.nd_volt_mag_v_df.loc[ind_q_zero,cur_col])
+        self.nd_volt_v_df, nd_volt_bad_df = parse_phasor_df(self.csv_df.iloc[:, 2 : 2 + num_nds * num_phs])
+        if nd_volt_bad_df.any(axis=None):
+            print(f"Malformed voltage phasor(s) in '{self.csv_file_name}': {nd_volt_bad_df.sum().loc[lambda x: x > 0].to_dict()}")
+
+        nd_volt_mag_v_arr = np.abs(self.nd_volt_v_df.to_numpy())
+        if ref_volt_mag is None:
+            ind_q_ref = pd.Index(self.pv_q_pu_ser).get_loc(ref_q_pu)
+            ref_volt_mag = nd_volt_mag_v_arr[ind_q_ref]
+        else:
+            ref_volt_mag = np.asarray(ref_volt_mag, dtype=float)
+
+        self.nd_volt_mag_v_df = pd.DataFrame(
+            nd_volt_mag_v_arr, index=self.nd_volt_v_df.index, columns=self.nd_volt_v_df.columns
+        )
+        self.nd_delta_volt_mag_v_df = pd.DataFrame(
+            nd_volt_mag_v_arr - ref_volt_mag[np.newaxis, :], index=self.nd_volt_v_df.index, columns=self.nd_volt_v_df.columns
+        )
         
-    def plot_dq_dv(self, filter_flag=True, ls_th=1, fig_fmt_str='.svg', fmt_dic = {'fontname':'Times New Roman','size': 16}):        
+    def plot_lines(self, x_ser, y_data):
+        """Plot the column(s) against x, each downsampled to 'plot_max_pts' points (if set)
+        """
+        if not self.plot_max_pts or len(x_ser) <= self.plot_max_pts:
+            plt.plot(x_ser, y_data)
+            return
+
+        y_df = y_data.to_frame() if isinstance(y_data, pd.Series) else y_data
+        for cur_col in y_df.columns:
+            cur_x_arr, cur_y_arr = downsample(x_ser, y_df[cur_col], self.plot_max_pts, self.plot_ds_method)
+            plt.plot(cur_x_arr, cur_y_arr)
+
+    @staticmethod
+    def close_fig(show_flag=True):
+        """Show the figure (blocking), or close it after saving, e.g., in a batch job
+        """
+        if show_flag:
+            plt.show()
+        else:
+            plt.close()
+
+    def plot_dq_dv(self, filter_flag=True, ls_th=1, fig_fmt_str='.svg', fmt_dic = {'fontname':'Times New Roman','size': 16}, show_flag=True):        
         if filter_flag:            
             nd_delta_volt_mag_v_df_ff = self.nd_delta_volt_mag_v_df.loc[:, self.nd_delta_volt_mag_v_df.nunique() > ls_th]
         else:
             nd_delta_volt_mag_v_df_ff = self.nd_delta_volt_mag_v_df.copy()
             
-        plt.plot(self.pv_q_var_ser, nd_delta_volt_mag_v_df_ff)
+        self.plot_lines(self.pv_q_var_ser, nd_delta_volt_mag_v_df_ff)
         
         plt.title(self.csv_file_name, **fmt_dic)
         plt.xlabel(r"Delta Q (var)", **fmt_dic)
@@ -99,10 +160,10 @@ class CsvExt:
         fig_fpn = os.path.join(self.csv_folder_path, fig_fn)
         plt.savefig(fig_fpn,
                     bbox_extra_artists=(lgd,),bbox_inches='tight')
-        plt.show()
+        CsvExt.close_fig(show_flag)
 
     def eval_dq_dv(self):
-        self.read_csv()
+        self.read_data()
         self.pre_process()
         self.plot_dq_dv()
 
@@ -122,8 +183,8 @@ class CsvExt:
                         (self.pv_rating**2 - self.pv_q_var_ser.pow(2)).pow(0.5))
         
 
-    def plot_price_q_curve(self, saved_fig_pref_str = 'price_', fig_fmt_str='.svg', fmt_dic = {'fontname':'Times New Roman','size': 16}):
-        plt.plot(self.pv_q_var_ser/1e3, self.pv_price_dollar_ser)   
+    def plot_price_q_curve(self, saved_fig_pref_str = 'price_', fig_fmt_str='.svg', fmt_dic = {'fontname':'Times New Roman','size': 16}, show_flag=True):
+        self.plot_lines(self.pv_q_var_ser/1e3, self.pv_price_dollar_ser)   
         
         plt.title(self.csv_file_name, **fmt_dic)
         plt.xlabel(r"Delta Q (kVar)", **fmt_dic)
@@ -141,7 +202,7 @@ class CsvExt:
         fig_fn = saved_fig_pref_str + os.path.splitext(self.csv_file_name)[0] + fig_fmt_str
         fig_fpn = os.path.join(self.csv_folder_path, fig_fn)
         plt.savefig(fig_fpn)
-        plt.show()
+        CsvExt.close_fig(show_flag)
         
     # def plot_other_prices(self, dt_h = 1):
     #     pv_price_dollar_by_dt_ser = self.pv_price_dollar_ser * dt_h
@@ -149,7 +210,7 @@ class CsvExt:
         
 
     def eval_price_q(self):
-        self.read_csv()
+        self.read_data()
         self.pre_process()
         self.get_price_q()
         self.plot_price_q_curve()
@@ -171,8 +232,8 @@ class CsvExt:
     def filter_line_slope(self, ls_th=1):
         self.swt_dv_df = self.swt_dv_df.loc[:, self.swt_dv_df.nunique() > ls_th]
 
-    def plot_dv_swt(self, fig_pref_str = 'swt_', fig_fmt_str = '.svg', fmt_dic = {'fontname':'Times New Roman','size': 16}):
-        plt.plot(self.pv_q_var_ser, self.swt_dv_df)
+    def plot_dv_swt(self, fig_pref_str = 'swt_', fig_fmt_str = '.svg', fmt_dic = {'fontname':'Times New Roman','size': 16}, show_flag=True):
+        self.plot_lines(self.pv_q_var_ser, self.swt_dv_df)
         
         plt.title(self.csv_file_name, **fmt_dic)
         plt.xlabel(r"Delta Q (var)", **fmt_dic)
@@ -187,10 +248,10 @@ class CsvExt:
         fig_fpn = os.path.join(self.csv_folder_path, fig_fn)
         plt.savefig(fig_fpn,
                     bbox_extra_artists=(lgd,),bbox_inches='tight')
-        plt.show()
+        CsvExt.close_fig(show_flag)
     
     def eval_swt_dv(self, dict_swt, flag_filter=True):
-        self.read_csv()
+        self.read_data()
         self.pre_process()
         self.get_dv_swt(dict_swt)
         if flag_filter:
@@ -204,7 +265,7 @@ class CsvExt:
         self.pkg_df = pd.concat(cct_list, axis = 1)
         
     def eval_package_df(self, dict_swt = None):
-        self.read_csv()
+        self.read_data()
         self.pre_process()
         self.get_dv_swt(dict_swt)
         self.get_price_q()
@@ -212,30 +273,12 @@ class CsvExt:
     
     @staticmethod
     def parse_volt_phasor(volt_ph_str):
-        def get_float_list(ori_str):
-            float_reg = re.compile(r"[-+]?\d+\.?\d*")
-            return float_reg.findall(ori_str)
-
-        try:
-            if volt_ph_str[-1] == 'j':
-                return complex(volt_ph_str)
-            elif volt_ph_str[-1] == 'd':
-                cur_float_list = get_float_list(volt_ph_str)
-                if len(cur_float_list) != 2:
-                    raise Exception("Voltage phasor string ends with 'd' but is incorrect.")
-                else:
-                    cur_volt_mag = float(cur_float_list[0])
-                    cur_volt_ang_rad = math.radians(float(cur_float_list[1]))
-                    return complex(cur_volt_mag*math.cos(cur_volt_ang_rad), cur_volt_mag*math.sin(cur_volt_ang_rad))
-            else:
-                raise Exception("Voltage phasor string ends with either 'j' or 'd'.")
-        except IndexError as err:
-            print(f"The input string cannot be empty: {err}")
-        except Exception as err:
-            print(f"The input string has an unknown format: {err}")
-        except:
-            print("Unexpected error:", sys.exc_info()[0])
-            raise
+        """Parse one voltage phasor string (see 'parse_phasor_arr' for whole columns)
+        """
+        volt_ph = parse_phasor_str(volt_ph_str)
+        if volt_ph is None:
+            print(f"The input string has an unknown format: {volt_ph_str!r}")
+        return volt_ph
 
 def test_parse_volt_phasor():
     # aa = "+2+22j-2"
@@ -262,6 +305,8 @@ def test_CsvExt():
 
     # ==Create an Instance of CsvExt
     p = CsvExt(csv_folder_path, csv_file_name)
+    # ~~or, read the columnar store (built from the csv file on the 1st run) instead of parsing the csv file
+    # p = CsvExt(csv_folder_path, csv_file_name, store_flag=True)
 
     """
     Demo 01 (extract & plot deltaQ-deltaV curve)
@@ -377,6 +422,11 @@ def test_CsvExt():
     # ==Option 1
     # p.eval_package_df(dict_swt)
     # p.eval_package_df()
+
+    # ==Option 2 (same as Option 0, on a process pool, indexed by inverter & Q)
+    # from batch_ext import eval_package_folder
+
+    # all_pv_df = eval_package_folder(csv_folder_path, dict_swt, pickle_pfn=os.path.join(pickle_fp, pickle_fn))
     
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import math
+import re
+
+import numpy as np
+import pandas as pd
+
+# ==Constant
+# --the suffixes of the GLD complex outputs: rectangular ('j' or 'i'), polar in degrees ('d'), and polar in radians ('r')
+PHASOR_FORM_RECT = (ord("j"), ord("i"))
+PHASOR_FORM_DEG = ord("d")
+PHASOR_FORM_RAD = ord("r")
+
+RE_PHASOR = re.compile(
+    r"^\s*(?P<a>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|[+-]?(?:nan|inf))"
+    r"(?:(?P<b>[+-](?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|[+-](?:nan|inf))(?P<form>[ijdr]))?\s*$",
+    flags=re.IGNORECASE,
+)
+
+# --the character classes used by 'parse_phasor_arr'
+CH_CLS_PAD, CH_CLS_DIGIT, CH_CLS_DOT, CH_CLS_SIGN, CH_CLS_EXP, CH_CLS_FORM, CH_CLS_BLANK, CH_CLS_OTHER = range(8)
+CH_CLS_ARR = np.full(256, CH_CLS_OTHER, dtype=np.uint8)
+CH_CLS_ARR[0] = CH_CLS_PAD
+CH_CLS_ARR[ord("0") : ord("9") + 1] = CH_CLS_DIGIT
+CH_CLS_ARR[ord(".")] = CH_CLS_DOT
+CH_CLS_ARR[[ord("+"), ord("-")]] = CH_CLS_SIGN
+CH_CLS_ARR[[ord("e"), ord("E")]] = CH_CLS_EXP
+CH_CLS_ARR[list(PHASOR_FORM_RECT) + [PHASOR_FORM_DEG, PHASOR_FORM_RAD]] = CH_CLS_FORM
+CH_CLS_ARR[[ord(" "), ord("\t")]] = CH_CLS_BLANK
+
+
+def parse_phasor_str(ph_str):
+    """Parse one phasor string (e.g., '+7199.5-0.1j', '+7200-120.5d', '+7200+2.1r', or a real number)
+
+    Returns None if the string is malformed (or a polar one has a non-finite angle, e.g., '+7200+infd').
+    """
+    m_ph = RE_PHASOR.match(ph_str) if isinstance(ph_str, str) else None
+    if m_ph is None:
+        return None
+
+    a = float(m_ph.group("a"))
+    if m_ph.group("b") is None:
+        return complex(a, 0.0)
+
+    b = float(m_ph.group("b"))
+    form = m_ph.group("form").lower()
+    if form in ("j", "i"):
+        return complex(a, b)
+    if not math.isfinite(b):
+        return None
+    if form == "d":
+        b = math.radians(b)
+    return complex(a * math.cos(b), a * math.sin(b))
+
+
+def parse_phasor_arr(ph_str_arr):
+    """Convert an array (any shape) of phasor strings into a complex128 array & a mask of the malformed cells
+
+    The strings are decoded on their bytes: the form comes from the last character, the split between the two
+    numbers is the sign that neither leads nor follows an exponent, and each half is converted by NumPy. The cells
+    that fail the byte checks (e.g., 'nan', a missing value, or a typo) go through 'parse_phasor_str' one by one;
+    those that still cannot be parsed are NaN and flagged in the mask.
+    """
+    ph_str_arr = np.asarray(ph_str_arr, dtype=object)
+    ori_shape = ph_str_arr.shape
+    ph_str_arr = ph_str_arr.ravel()
+    num = len(ph_str_arr)
+
+    cplx_arr = np.full(num, np.nan + 1j * np.nan, dtype=np.complex128)
+    bad_mask = np.zeros(num, dtype=bool)
+    if num == 0:
+        return cplx_arr.reshape(ori_shape), bad_mask.reshape(ori_shape)
+
+    # ==Bytes (the missing & the non-ASCII values go through the slow path, and are flagged there if malformed)
+    slow_mask = pd.isna(ph_str_arr)
+    try:
+        ph_b_arr = (np.where(slow_mask, "", ph_str_arr) if slow_mask.any() else ph_str_arr).astype("S")
+    except UnicodeEncodeError:
+        slow_mask |= np.fromiter((isinstance(x, str) and not x.isascii() for x in ph_str_arr), dtype=bool, count=num)
+        ph_b_arr = np.where(slow_mask, "", ph_str_arr).astype("S")
+    if ph_b_arr.dtype.itemsize == 0:
+        ph_b_arr = ph_b_arr.astype("S1")
+
+    cls_mat = CH_CLS_ARR[ph_b_arr.view(np.uint8).reshape(num, -1)]
+    if (cls_mat == CH_CLS_BLANK).any():
+        ph_b_arr = np.char.strip(ph_b_arr)
+        cls_mat = CH_CLS_ARR[ph_b_arr.view(np.uint8).reshape(num, -1)]
+    width = ph_b_arr.dtype.itemsize
+    ch_mat = ph_b_arr.view(np.uint8).reshape(num, width)
+    col_arr = np.arange(width)
+    row_arr = np.arange(num)
+
+    # ==Form: the last character
+    len_arr = np.count_nonzero(cls_mat, axis=1)
+    last_arr = ch_mat[row_arr, np.maximum(len_arr - 1, 0)]
+    form_mask = CH_CLS_ARR[last_arr] == CH_CLS_FORM
+
+    # ==Split: the sign that is neither the leading one nor after an exponent
+    sign_mat = cls_mat == CH_CLS_SIGN
+    sign_mat[:, 1:] &= cls_mat[:, :-1] != CH_CLS_EXP
+    sign_mat[:, 0] = False
+    split_arr = np.where(form_mask, np.argmax(sign_mat, axis=1), width)
+
+    # --a complex cell has exactly one split & a form character at its end; a real cell has neither
+    ok_mask = (
+        ~slow_mask
+        & (len_arr > 0)
+        & (np.count_nonzero(sign_mat, axis=1) == form_mask)
+        & (np.count_nonzero(cls_mat >= CH_CLS_FORM, axis=1) == form_mask)
+    )
+
+    # ==Halves: the 1st is cut at the split; the 2nd has the 1st & the form blanked out (NumPy skips the blanks)
+    # --the masks are applied arithmetically on the bytes, which is much faster than 'np.where' on them
+    keep_a_mat = col_arr < split_arr[:, np.newaxis]
+    blank_b_mat = (keep_a_mat | (cls_mat == CH_CLS_FORM)).view(np.uint8)
+    a_mat = ch_mat * keep_a_mat.view(np.uint8)
+    b_mat = ch_mat + (np.uint8(ord(" ")) - ch_mat) * blank_b_mat
+
+    # --the cells without a 2nd half (or to be parsed one by one) are given '0'
+    a_mat[~ok_mask, 0] = ord("0")
+    b_mat[~(ok_mask & form_mask), 0] = ord("0")
+
+    a_b_arr = a_mat.view(f"S{width}").ravel()
+    b_b_arr = b_mat.view(f"S{width}").ravel()
+    try:
+        a_arr = a_b_arr.astype(np.float64)
+        b_arr = b_b_arr.astype(np.float64)
+    except ValueError:
+        # --a cell passed the checks but is not a number (e.g., '1e+2.j'), so it is left to the slow path
+        a_arr = pd.to_numeric(pd.Series(a_b_arr.astype(str)), errors="coerce").to_numpy()
+        b_arr = pd.to_numeric(pd.Series(b_b_arr.astype(str)), errors="coerce").to_numpy()
+        ok_mask &= ~(np.isnan(a_arr) | np.isnan(b_arr))
+
+    # ==Complex
+    b_rad_arr = np.where(last_arr == PHASOR_FORM_DEG, np.deg2rad(b_arr), b_arr)
+    polar_mask = form_mask & ((last_arr == PHASOR_FORM_DEG) | (last_arr == PHASOR_FORM_RAD))
+    cplx_arr[ok_mask] = np.where(
+        polar_mask, a_arr * np.cos(b_rad_arr) + 1j * a_arr * np.sin(b_rad_arr), a_arr + 1j * b_arr
+    )[ok_mask]
+
+    # ==The rest, one by one
+    for cur_ind in np.nonzero(~ok_mask)[0]:
+        cur_cplx = parse_phasor_str(ph_str_arr[cur_ind])
+        if cur_cplx is None:
+            bad_mask[cur_ind] = True
+        else:
+            cplx_arr[cur_ind] = cur_cplx
+
+    return cplx_arr.reshape(ori_shape), bad_mask.reshape(ori_shape)
+
+
+def parse_phasor_df(ph_str_df):
+    """Convert a DataFrame of phasor strings into a complex DataFrame & a DataFrame of the malformed-cell mask
+    """
+    # --the numeric columns (e.g., from a columnar store) are taken as they are
+    num_col_mask = np.array([x.kind in "biufc" for x in ph_str_df.dtypes], dtype=bool)
+    cplx_arr = np.empty(ph_str_df.shape, dtype=np.complex128)
+    bad_mask = np.zeros(ph_str_df.shape, dtype=bool)
+    if num_col_mask.any():
+        cplx_arr[:, num_col_mask] = ph_str_df.loc[:, num_col_mask].to_numpy(dtype=np.complex128)
+    if not num_col_mask.all():
+        cplx_arr[:, ~num_col_mask], bad_mask[:, ~num_col_mask] = parse_phasor_arr(
+            ph_str_df.loc[:, ~num_col_mask].to_numpy(dtype=object)
+        )
+    return (
+        pd.DataFrame(cplx_arr, index=ph_str_df.index, columns=ph_str_df.columns),
+        pd.DataFrame(bad_mask, index=ph_str_df.index, columns=ph_str_df.columns),
+    )
+
+
+def test_parse_phasor_arr():
+    ph_str_list = [
+        "+7199.5-0.1j",
+        "-10.0-60d",
+        "+7200+2.0944r",
+        " +1.5e+03-2.5E-01j ",
+        "120.5",
+        "+7200-120.5d",
+        "nan+nanj",
+        "+7200+infd",
+        "+72oo-1d",
+        "+7200\u2212120d",
+        "",
+        None,
+    ]
+    cplx_arr, bad_mask = parse_phasor_arr(ph_str_list)
+    for cur_str, cur_cplx, cur_bad in zip(ph_str_list, cplx_arr, bad_mask):
+        print(f"{cur_str!r:>24} -> {cur_cplx} {'(malformed)' if cur_bad else ''}")
+        if not cur_bad:
+            cur_ref = parse_phasor_str(cur_str)
+            assert np.isclose(cur_cplx, cur_ref) or (np.isnan(cur_cplx) and np.isnan(cur_ref))
+
+    assert bad_mask.tolist() == [False] * 7 + [True] * 5
+
+    # --the cells that are all missing or non-ASCII
+    assert parse_phasor_arr(["", None])[1].all()
+    assert parse_phasor_arr(["7200\u00b0"])[1].all()
+
+
+def test_parse_phasor_speed():
+    import time
+
+    num = 1000000
+    rng = np.random.default_rng(0)
+    ph_str_arr = np.char.add(
+        np.char.add(np.char.mod("%+.6g", 7200 + rng.normal(0, 10, num)), np.char.mod("%+.6g", rng.normal(0, 100, num))),
+        "d",
+    ).astype(object)
+
+    st_time = time.time()
+    cplx_arr, bad_mask = parse_phasor_arr(ph_str_arr)
+    print(f"{num} phasors in {time.time() - st_time} (secs), {bad_mask.sum()} malformed")
+
+
+if __name__ == "__main__":
+    test_parse_phasor_arr()
+    test_parse_phasor_speed()
@@ -0,0 +1,328 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import os.path
+import re
+
+import numpy as np
+import pandas as pd
+
+from phasor import parse_phasor_arr
+
+# ==Constant
+REC_TS_COL = "timestamp"
+REC_HEADER_MAX_LINES = 100
+
+# --e.g., '# interval.. 1', '# property.. n1:voltage_A'
+RE_REC_META = re.compile(r"^#\s*(?P<key>\w+)\.*\s+(?P<val>.*?)\s*$")
+# --a cell that is a complex number (rectangular or polar), rather than a real one
+RE_REC_PHASOR_CELL = re.compile(r"^\s*[+-]?[\d.]+(?:[eE][+-]?\d+)?[+-][\d.]+(?:[eE][+-]?\d+)?[ijdr]\s*$")
+
+# --the kinds of the columns (see 'RecorderReader.get_col_kinds') & their decoded dtypes
+REC_KIND_TS = "timestamp"
+REC_KIND_PHASOR = "phasor"
+REC_KIND_REAL = "real"
+REC_KIND_DTYPE_DICT = {
+    REC_KIND_TS: np.dtype("datetime64[s]"),
+    REC_KIND_PHASOR: np.dtype(np.complex128),
+    REC_KIND_REAL: np.dtype(np.float64),
+}
+
+
+class RecorderReader:
+    """Read the recorder, multi_recorder, and group_recorder (.csv) files of GLD
+
+    The header block is scanned for the '# timestamp,...' line, so the number of comment lines does not matter.
+    The timestamps are parsed into datetime64, and the phasor columns are decoded into complex128.
+    """
+
+    def __init__(self, csv_pfn):
+        self.csv_pfn = csv_pfn
+
+        # ==Header
+        self.header_ln = None
+        self.col_list = []
+        self.meta_dict = {}
+        self.find_header()
+
+        # ==The kind of each column, decided once (see 'iter_chunks')
+        self.kind_dict = {}
+
+    def find_header(self):
+        """Find the line of the column names, i.e., the last comment line of the header block
+
+        The other comment lines (e.g., '# interval.. 1') are kept in 'meta_dict'.
+        """
+        last_cmt_ln = None
+        last_cmt_str = None
+        with open(self.csv_pfn, "r") as hf_csv:
+            for cur_ln, cur_line in enumerate(hf_csv):
+                if cur_ln >= REC_HEADER_MAX_LINES or not cur_line.startswith("#"):
+                    break
+                cur_line = cur_line.rstrip("\r\n")
+                if re.match(r"^#\s*timestamp\s*,", cur_line):
+                    last_cmt_ln, last_cmt_str = cur_ln, cur_line
+                    break
+                m_meta = RE_REC_META.match(cur_line)
+                if m_meta:
+                    self.meta_dict[m_meta.group("key")] = m_meta.group("val")
+                last_cmt_ln, last_cmt_str = cur_ln, cur_line
+
+        if last_cmt_ln is None:
+            raise ValueError(f"No header is found in '{self.csv_pfn}'!")
+
+        self.header_ln = last_cmt_ln
+        self.col_list = [x.strip() for x in last_cmt_str.lstrip("#").split(",")]
+        self.col_list[0] = REC_TS_COL
+
+    def get_usecols(self, prop_list=None):
+        """The columns to be read: the timestamp & the given properties (all, if not given)
+        """
+        if prop_list is None:
+            return list(self.col_list)
+
+        unknown_list = [x for x in prop_list if x not in self.col_list]
+        if unknown_list:
+            raise KeyError(f"Unknown column(s) in '{self.csv_pfn}': {unknown_list}")
+        return [REC_TS_COL] + [x for x in self.col_list if x in prop_list and x != REC_TS_COL]
+
+    @staticmethod
+    def parse_ts(ts_ser):
+        """Parse the GLD timestamps (e.g., '2000-01-01 00:00:00 EST') into datetime64[s]
+
+        Returns the timestamps & the timezone suffix (of the 1st row).
+        """
+        ts_b_arr = np.char.strip(ts_ser.to_numpy(dtype=object).astype("S"))
+        tz_str = ""
+        if len(ts_b_arr):
+            tok_list = ts_b_arr[0].decode().split()
+            if len(tok_list) > 2:
+                tz_str = tok_list[-1]
+
+        # --fast path: the rows are of the same length & with the same suffix (as GLD writes them)
+        width = ts_b_arr.dtype.itemsize
+        tz_sfx_b = f" {tz_str}".encode() if tz_str else b""
+        if (
+            len(ts_b_arr)
+            and np.all(np.char.str_len(ts_b_arr) == width)
+            and np.all(np.char.endswith(ts_b_arr, tz_sfx_b))
+        ):
+            ts_cut_arr = (
+                ts_b_arr.view("S1").reshape(len(ts_b_arr), width)[:, : width - len(tz_sfx_b)].copy().view(
+                    f"S{width - len(tz_sfx_b)}"
+                ).ravel()
+            )
+            try:
+                return ts_cut_arr.astype("U").astype("datetime64[s]"), tz_str
+            except ValueError:
+                pass
+
+        ts_ser = pd.Series(ts_b_arr.astype("U"))
+        if tz_str:
+            ts_ser = ts_ser.str.replace(r"\s+[A-Za-z]\S*$", "", regex=True)
+        ts_arr = pd.to_datetime(ts_ser, format="ISO8601").to_numpy().astype("datetime64[s]")
+        return ts_arr, tz_str
+
+    @staticmethod
+    def parse_real(val_ser):
+        """Parse a column of real numbers; returns the values & the mask of the malformed cells
+        """
+        try:
+            val_arr = val_ser.to_numpy(dtype=object).astype("S").astype(np.float64)
+            return val_arr, np.zeros(len(val_arr), dtype=bool)
+        except ValueError:
+            val_arr = pd.to_numeric(val_ser, errors="coerce").to_numpy(dtype=float)
+            bad_mask = np.isnan(val_arr) & ~val_ser.str.contains("nan", case=False, na=False).to_numpy()
+            return val_arr, bad_mask
+
+    @staticmethod
+    def get_col_kinds(raw_df, phasor_flag=True):
+        """The kind of each (string) column: a column is a phasor one if any of its non-empty cells is a complex number
+        """
+        kind_dict = {}
+        for cur_col in raw_df.columns:
+            if cur_col == REC_TS_COL:
+                kind_dict[cur_col] = REC_KIND_TS
+                continue
+
+            kind_dict[cur_col] = REC_KIND_REAL
+            if not phasor_flag:
+                continue
+
+            # --only the cells ending with a form character are matched against the pattern (up to the 1st match)
+            cur_ser = raw_df[cur_col]
+            cur_str_arr = np.char.rstrip(cur_ser[cur_ser.notna() & (cur_ser != "")].to_numpy(dtype=str))
+            cur_cand_mask = np.zeros(len(cur_str_arr), dtype=bool)
+            for cur_form_str in "ijdr":
+                cur_cand_mask |= np.char.endswith(cur_str_arr, cur_form_str)
+            if any(RE_REC_PHASOR_CELL.match(x) for x in cur_str_arr[cur_cand_mask]):
+                kind_dict[cur_col] = REC_KIND_PHASOR
+        return kind_dict
+
+    @staticmethod
+    def decode_cols(raw_df, phasor_flag=True, kind_dict=None):
+        """Convert the (string) columns: the timestamp to datetime64, the phasors to complex128, the others to float64
+
+        The kinds of the columns are scanned from 'raw_df', unless given (e.g., the ones of the 1st chunk of a file).
+        Returns the DataFrame & the number of malformed cells of each column.
+        """
+        if kind_dict is None:
+            kind_dict = RecorderReader.get_col_kinds(raw_df, phasor_flag)
+
+        col_dict = {}
+        tz_str = None
+        bad_dict = {}
+        for cur_col in raw_df.columns:
+            cur_ser = raw_df[cur_col]
+            if cur_col == REC_TS_COL:
+                col_dict[cur_col], tz_str = RecorderReader.parse_ts(cur_ser)
+                continue
+
+            if kind_dict[cur_col] == REC_KIND_PHASOR:
+                cur_arr, cur_bad_mask = parse_phasor_arr(cur_ser.to_numpy(dtype=object))
+            else:
+                cur_arr, cur_bad_mask = RecorderReader.parse_real(cur_ser)
+            col_dict[cur_col] = cur_arr
+            if cur_bad_mask.any():
+                bad_dict[cur_col] = int(cur_bad_mask.sum())
+
+        # --built at once, as a wide file (e.g., a group_recorder) has thousands of columns
+        rec_df = pd.DataFrame(col_dict, index=raw_df.index)
+        if tz_str is not None:
+            rec_df.attrs["tz"] = tz_str
+        return rec_df, bad_dict
+
+    def read_raw(self, prop_list=None, chunksize=None):
+        """Read the columns as strings (a DataFrame, or an iterator of DataFrames if 'chunksize' is given)
+        """
+        usecols_list = self.get_usecols(prop_list)
+        return pd.read_csv(
+            self.csv_pfn,
+            header=None,
+            names=self.col_list,
+            skiprows=self.header_ln + 1,
+            usecols=usecols_list,
+            dtype=str,
+            skipinitialspace=True,
+            comment="#",
+            chunksize=chunksize,
+            na_filter=False,
+        )
+
+    def read(self, prop_list=None, phasor_flag=True):
+        """Read the whole file (or the given properties only)
+        """
+        raw_df = self.read_raw(prop_list)
+        self.kind_dict = RecorderReader.get_col_kinds(raw_df, phasor_flag)
+        rec_df, bad_dict = RecorderReader.decode_cols(raw_df, phasor_flag, self.kind_dict)
+        if bad_dict:
+            print(f"Malformed cell(s) in '{self.csv_pfn}': {bad_dict}")
+        return rec_df
+
+    def iter_chunks(self, prop_list=None, chunksize=100000, phasor_flag=True):
+        """Iterate over the file by chunks of rows, so a large file is never loaded as a whole
+
+        The kinds of the columns are scanned from the 1st chunk ('kind_dict'), and kept for all the chunks, except
+        that a real column with malformed cells in a later chunk is re-scanned there, and widened to a phasor one
+        (from that chunk on) if it holds complex numbers.
+        """
+        self.kind_dict = {}
+        for cur_raw_df in self.read_raw(prop_list, chunksize):
+            if not self.kind_dict:
+                self.kind_dict = RecorderReader.get_col_kinds(cur_raw_df, phasor_flag)
+            cur_rec_df, cur_bad_dict = RecorderReader.decode_cols(cur_raw_df, phasor_flag, self.kind_dict)
+
+            # --the real columns that turn out to be phasor ones
+            cur_wide_list = [x for x in cur_bad_dict if self.kind_dict[x] == REC_KIND_REAL] if phasor_flag else []
+            if cur_wide_list:
+                cur_kind_dict = RecorderReader.get_col_kinds(cur_raw_df[cur_wide_list], phasor_flag)
+                cur_wide_list = [x for x in cur_wide_list if cur_kind_dict[x] == REC_KIND_PHASOR]
+            if cur_wide_list:
+                print(
+                    f"Column(s) of '{self.csv_pfn}' widened to phasors (rows from {cur_raw_df.index[0]}): {cur_wide_list}"
+                )
+                self.kind_dict.update({x: REC_KIND_PHASOR for x in cur_wide_list})
+                cur_wide_df, cur_wide_bad_dict = RecorderReader.decode_cols(
+                    cur_raw_df[cur_wide_list], phasor_flag, self.kind_dict
+                )
+                for cur_col in cur_wide_list:
+                    cur_rec_df[cur_col] = cur_wide_df[cur_col]
+                    cur_bad_dict.pop(cur_col)
+                cur_bad_dict.update(cur_wide_bad_dict)
+            if cur_bad_dict:
+                print(f"Malformed cell(s) in '{self.csv_pfn}' (rows from {cur_raw_df.index[0]}): {cur_bad_dict}")
+            yield cur_rec_df
+
+    def read_prop(self, prop_str, chunksize=1000000, phasor_flag=True):
+        """Pull one property (with the timestamps) out of a file of any size, chunk by chunk
+        """
+        ts_list = []
+        val_list = []
+        for cur_rec_df in self.iter_chunks([prop_str], chunksize, phasor_flag):
+            ts_list.append(cur_rec_df[REC_TS_COL].to_numpy())
+            val_list.append(cur_rec_df[prop_str].to_numpy())
+        if not ts_list:
+            return np.array([], dtype="datetime64[s]"), np.array([])
+        return np.concatenate(ts_list), np.concatenate(val_list)
+
+
+def test_RecorderReader():
+    import tempfile
+
+    csv_pfn = os.path.join(tempfile.mkdtemp(), "mr.csv")
+    num = 200000
+    ts_arr = np.datetime64("2000-01-01 00:00:00") + np.arange(num).astype("timedelta64[s]")
+    with open(csv_pfn, "w") as hf_csv:
+        hf_csv.write(
+            "# file...... mr.csv\n# date...... Mon Oct 19 00:00:00 2026\n# user...... x\n# host...... x\n"
+            "# interval.. 1\n# limit..... 0\n# property.. n1:voltage_A, q_player:value\n"
+            "# timestamp,n1:voltage_A,q_player:value\n"
+        )
+        rows_arr = np.char.add(
+            np.char.add(np.char.replace(np.datetime_as_string(ts_arr), "T", " "), " EST,+7200.5-0.25d,"),
+            np.char.mod("%.6g", np.linspace(-1, 1, num)),
+        )
+        hf_csv.write("\n".join(rows_arr.tolist()) + "\n")
+
+    import time
+
+    rr = RecorderReader(csv_pfn)
+    print(rr.header_ln, rr.col_list, rr.meta_dict)
+
+    st_time = time.time()
+    rec_df = rr.read()
+    print(f"Read in {time.time() - st_time} (secs)")
+    print(rec_df.dtypes, rec_df.attrs, rec_df.head(2), sep="\n")
+
+    st_time = time.time()
+    ts_arr, volt_arr = rr.read_prop("n1:voltage_A", chunksize=50000)
+    print(f"One property read by chunks in {time.time() - st_time} (secs): {len(ts_arr)} rows, {volt_arr.dtype}")
+    assert np.allclose(np.abs(volt_arr), 7200.5)
+
+    # --a phasor column that starts with an empty (or a real-looking) cell is still a phasor one in every chunk
+    with open(csv_pfn, "w") as hf_csv:
+        hf_csv.write("# timestamp,n1:voltage_A\n")
+        hf_csv.write("2000-01-01 00:00:00 EST,\n2000-01-01 00:00:01 EST,7200\n")
+        hf_csv.write("".join([f"2000-01-01 00:00:{x:02d} EST,+7200.5-0.25d\n" for x in range(2, 10)]))
+    rr = RecorderReader(csv_pfn)
+    chunk_df_list = list(rr.iter_chunks(chunksize=3))
+    print(rr.kind_dict)
+    assert rr.kind_dict["n1:voltage_A"] == REC_KIND_PHASOR
+    assert all(x["n1:voltage_A"].dtype == np.complex128 for x in chunk_df_list)
+
+    # --a column of real-looking cells in the 1st chunk is widened to a phasor one in a later chunk
+    with open(csv_pfn, "w") as hf_csv:
+        hf_csv.write("# timestamp,n1:voltage_A\n")
+        hf_csv.write("".join([f"2000-01-01 00:00:{x:02d} EST,7200.5\n" for x in range(3)]))
+        hf_csv.write("".join([f"2000-01-01 00:00:{x:02d} EST,+7200.5-0.25d\n" for x in range(3, 10)]))
+    rr = RecorderReader(csv_pfn)
+    ts_arr, volt_arr = rr.read_prop("n1:voltage_A", chunksize=3)
+    assert rr.kind_dict["n1:voltage_A"] == REC_KIND_PHASOR
+    assert volt_arr.dtype == np.complex128 and np.allclose(np.abs(volt_arr), 7200.5)
+
+
+if __name__ == "__main__":
+    test_RecorderReader()
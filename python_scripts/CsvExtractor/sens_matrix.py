@@ -0,0 +1,321 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import json
+import os.path
+import re
+
+import numpy as np
+import scipy.sparse
+
+from col_store import COL_STORE_FLR, COL_STORE_MANIFEST_FN, ColStore, find_result_files
+
+# ==Constant
+SENS_STORE_FN = "sens_dvdq"
+SENS_COEF_LIST = ["dvdq", "d2vdq2", "rmse_lin", "rmse_quad"]
+# --the least number of (distinct) Q points of a fit, i.e., the number of the quadratic coefficients
+SENS_MIN_ROWS = 3
+# --the Q property of an inverter (e.g., the 1st one of the multi-recorders of GldSmn)
+SENS_Q_PROP = "VA_Out.imag"
+# --the results folder of one (inverter, Q) scenario of GldSmn, e.g., 'Inv_S1_-0.5'
+RE_SENS_SCN_FLR = re.compile(r"^(?P<inv>.+)_(?P<q>[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)$")
+
+
+class SensMatrix:
+    """Fit the voltage sensitivities to the Q of each inverter (dV/dQ), for all node phases at once
+
+    Each inverter of a sweep gives one column of the matrices: its result file (e.g., one multi-recorder file per
+    inverter, with Q ramped by a player), or the files of its (inverter, Q) folders (e.g., the qlist & adaptive sweeps
+    of GldSmn, see 'get_inv_key'). For each inverter, the voltage magnitudes of all the node phases are fitted by the
+    linear (V = v0 + s1 * Q) & the quadratic (V = v0 + s1 * Q + s2 * Q^2) least squares in one 'lstsq' call, and
+    'd2vdq2' is the 2nd derivative (2 * s2).
+
+    The Q is the column of the Q property (e.g., 'Inv_S1:VA_Out.imag', in VAr) of a file; a file without it (e.g.,
+    a recorder of a node) takes the Q of its (inverter, Q) folder instead (in p.u., see 'get_scn_q').
+    """
+
+    @staticmethod
+    def get_inv_key(rel_pfn):
+        """The inverter of a result file (the path relative to the sweep folder)
+
+        A file under an (inverter, Q) folder (e.g., 'Inv_S1_-0.5/Inv_S1.csv') belongs to the inverter of the folder;
+        otherwise, the inverter is the name of the file without the suffix.
+        """
+        flr_str, fn_str = os.path.split(rel_pfn)
+        m_scn = RE_SENS_SCN_FLR.match(os.path.basename(flr_str))
+        if m_scn is not None:
+            return os.path.join(os.path.dirname(flr_str), m_scn.group("inv"))
+        return os.path.splitext(rel_pfn)[0]
+
+    @staticmethod
+    def get_scn_q(rel_pfn):
+        """The Q (p.u.) of the (inverter, Q) folder of a result file, or None
+        """
+        m_scn = RE_SENS_SCN_FLR.match(os.path.basename(os.path.dirname(rel_pfn)))
+        return float(m_scn.group("q")) if m_scn is not None else None
+
+    @staticmethod
+    def get_q_col(store, q_prop_str=SENS_Q_PROP, inv_str=""):
+        """The column of the Q property (of the given inverter, if there are several), or None
+        """
+        q_col_list = [x for x in store.col_list if x.rpartition(":")[2] == q_prop_str]
+        for cur_col in q_col_list:
+            if cur_col.rpartition(":")[0] == inv_str:
+                return cur_col
+        return q_col_list[0] if q_col_list else None
+
+    @staticmethod
+    def fit_file(store, q_prop_str=SENS_Q_PROP, volt_key_str="voltage"):
+        """Fit one result file; returns the node phases & their (dvdq, d2vdq2, rmse_lin, rmse_quad) coefficients
+        """
+        return SensMatrix.fit_stores([store], q_prop_str, volt_key_str)
+
+    @staticmethod
+    def fit_stores(store_list, q_prop_str=SENS_Q_PROP, volt_key_str="voltage", scn_q_list=None, inv_str=""):
+        """Fit the rows of the result files of one inverter together (the node phases recorded in all of them)
+
+        The Q of the rows is the Q column of each file, or (if any file has none) the folder Q of each file
+        ('scn_q_list'). The node phases of a recorder are named after its target (e.g., 'n1:voltage_A').
+        """
+        volt_col_list = [x for x in store_list[0].col_list if volt_key_str in x]
+        for cur_store in store_list[1:]:
+            cur_col_set = set(cur_store.col_list)
+            volt_col_list = [x for x in volt_col_list if x in cur_col_set]
+
+        q_col_list = [SensMatrix.get_q_col(x, q_prop_str, inv_str) for x in store_list]
+        if all(x is not None for x in q_col_list):
+            q_arr = np.concatenate(
+                [np.asarray(x.get_col(y), dtype=float) for x, y in zip(store_list, q_col_list)]
+            )
+        elif scn_q_list is not None and all(x is not None for x in scn_q_list):
+            q_arr = np.concatenate([np.full(x.num_rows, y) for x, y in zip(store_list, scn_q_list)])
+        else:
+            raise KeyError(f"No '{q_prop_str}' column, and no Q in the folder name")
+
+        volt_mag_mat = np.vstack(
+            [np.abs(np.column_stack([x.get_col(y) for y in volt_col_list])) for x in store_list]
+        )
+
+        # --drop the rows with missing values
+        valid_mask = np.isfinite(q_arr) & np.all(np.isfinite(volt_mag_mat), axis=1)
+        q_arr = q_arr[valid_mask]
+        volt_mag_mat = volt_mag_mat[valid_mask]
+
+        # --the quadratic fit is underdetermined with fewer points
+        if len(np.unique(q_arr)) < SENS_MIN_ROWS:
+            raise ValueError(
+                f"{len(q_arr)} valid row(s) of {len(np.unique(q_arr))} distinct Q value(s), "
+                f"at least {SENS_MIN_ROWS} are needed"
+            )
+
+        # --the Q is scaled for the conditioning of the quadratic fit
+        q_scale = np.max(np.abs(q_arr)) if len(q_arr) and np.max(np.abs(q_arr)) > 0 else 1.0
+        q_n_arr = q_arr / q_scale
+
+        lin_x_mat = np.column_stack([np.ones_like(q_n_arr), q_n_arr])
+        quad_x_mat = np.column_stack([np.ones_like(q_n_arr), q_n_arr, q_n_arr**2])
+
+        lin_coef_mat = np.linalg.lstsq(lin_x_mat, volt_mag_mat, rcond=None)[0]
+        quad_coef_mat = np.linalg.lstsq(quad_x_mat, volt_mag_mat, rcond=None)[0]
+
+        rmse_lin_arr = np.sqrt(np.mean((lin_x_mat @ lin_coef_mat - volt_mag_mat) ** 2, axis=0))
+        rmse_quad_arr = np.sqrt(np.mean((quad_x_mat @ quad_coef_mat - volt_mag_mat) ** 2, axis=0))
+
+        coef_mat = np.vstack(
+            [lin_coef_mat[1] / q_scale, 2 * quad_coef_mat[2] / q_scale**2, rmse_lin_arr, rmse_quad_arr]
+        )
+
+        tgt_str = store_list[0].manifest_dict["meta"].get("target", "")
+        row_list = [f"{tgt_str}:{x}" if tgt_str and ":" not in x else x for x in volt_col_list]
+        return row_list, coef_mat
+
+    def __init__(self):
+        self.row_list = []
+        self.inv_list = []
+        self.coef_dict = {}
+
+    def build(
+        self, csv_folder_path, q_prop_str=SENS_Q_PROP, volt_key_str="voltage", csv_suff=".csv", recursive_flag=True
+    ):
+        """Fit all the result files of a sweep folder (the same file of the (inverter, Q) folders of an inverter
+        together), and align the node phases across the inverters
+
+        A node phase not recorded for an inverter is NaN in its column.
+        """
+        grp_rel_pfn_dict = {}
+        for cur_pfn in find_result_files(csv_folder_path, csv_suff, recursive_flag):
+            cur_rel_pfn = os.path.relpath(cur_pfn, csv_folder_path)
+            cur_grp_key = (SensMatrix.get_inv_key(cur_rel_pfn), os.path.basename(cur_rel_pfn))
+            grp_rel_pfn_dict.setdefault(cur_grp_key, []).append(cur_rel_pfn)
+
+        fit_dict = {}
+        for (cur_inv_str, cur_fn), cur_rel_pfn_list in grp_rel_pfn_dict.items():
+            try:
+                cur_row_list, cur_coef_mat = SensMatrix.fit_stores(
+                    [ColStore.from_csv(os.path.join(csv_folder_path, x)) for x in cur_rel_pfn_list],
+                    q_prop_str,
+                    volt_key_str,
+                    [SensMatrix.get_scn_q(x) for x in cur_rel_pfn_list],
+                    os.path.basename(cur_inv_str),
+                )
+            except (ValueError, KeyError, IndexError) as err:
+                print(f"'{cur_fn}' of '{cur_inv_str}' is skipped: {err}")
+                continue
+
+            # ~~the node phases of the files of an inverter (the 1st file wins for a repeated one)
+            if cur_inv_str in fit_dict:
+                pre_row_list, pre_coef_mat = fit_dict[cur_inv_str]
+                new_mask = ~np.isin(cur_row_list, pre_row_list)
+                cur_row_list = pre_row_list + [x for x, y in zip(cur_row_list, new_mask) if y]
+                cur_coef_mat = np.hstack([pre_coef_mat, cur_coef_mat[:, new_mask]])
+            fit_dict[cur_inv_str] = (cur_row_list, cur_coef_mat)
+
+        self.inv_list = list(fit_dict)
+        self.row_list = list(dict.fromkeys([y for x in fit_dict.values() for y in x[0]]))
+        row_ind_dict = {x: i for i, x in enumerate(self.row_list)}
+
+        self.coef_dict = {x: np.full((len(self.row_list), len(self.inv_list)), np.nan) for x in SENS_COEF_LIST}
+        for cur_inv_ind, (cur_row_list, cur_coef_mat) in enumerate(fit_dict.values()):
+            cur_row_ind_arr = np.array([row_ind_dict[x] for x in cur_row_list], dtype=np.int64)
+            for cur_coef_ind, cur_coef_str in enumerate(SENS_COEF_LIST):
+                self.coef_dict[cur_coef_str][cur_row_ind_arr, cur_inv_ind] = cur_coef_mat[cur_coef_ind]
+
+    def to_sparse(self, coef_str="dvdq", tol=1e-9):
+        """The matrix as a CSR matrix, dropping the entries not larger than 'tol' (and the missing ones)
+        """
+        coef_mat = np.nan_to_num(self.coef_dict[coef_str], nan=0.0)
+        coef_mat[np.abs(coef_mat) <= tol] = 0.0
+        return scipy.sparse.csr_matrix(coef_mat)
+
+    def save(self, store_flr_path, sparse_tol=None):
+        """Save the matrices (.npy each) & a JSON manifest of the rows (node phases) and the columns (inverters)
+
+        With 'sparse_tol', the 'dvdq' matrix is also saved in the CSR form (data, indices, indptr).
+        """
+        os.makedirs(store_flr_path, exist_ok=True)
+        file_dict = {}
+        for cur_coef_str, cur_coef_mat in self.coef_dict.items():
+            file_dict[cur_coef_str] = f"{cur_coef_str}.npy"
+            np.save(os.path.join(store_flr_path, file_dict[cur_coef_str]), cur_coef_mat)
+
+        if sparse_tol is not None:
+            dvdq_csr = self.to_sparse("dvdq", sparse_tol)
+            for cur_attr_str in ["data", "indices", "indptr"]:
+                file_dict[f"dvdq_csr_{cur_attr_str}"] = f"dvdq_csr_{cur_attr_str}.npy"
+                np.save(os.path.join(store_flr_path, file_dict[f"dvdq_csr_{cur_attr_str}"]), getattr(dvdq_csr, cur_attr_str))
+
+        manifest_dict = {
+            "rows": self.row_list,
+            "columns": self.inv_list,
+            "shape": [len(self.row_list), len(self.inv_list)],
+            "files": file_dict,
+            "sparse_tol": sparse_tol,
+        }
+        with open(os.path.join(store_flr_path, COL_STORE_MANIFEST_FN), "w") as hf_manifest:
+            json.dump(manifest_dict, hf_manifest, indent=4)
+
+    @staticmethod
+    def load(store_flr_path, sparse_flag=False):
+        """Open the saved matrices (memory-mapped); the 'dvdq' one as a CSR matrix if 'sparse_flag' is set
+        """
+        with open(os.path.join(store_flr_path, COL_STORE_MANIFEST_FN), "r") as hf_manifest:
+            manifest_dict = json.load(hf_manifest)
+
+        sm = SensMatrix()
+        sm.row_list = manifest_dict["rows"]
+        sm.inv_list = manifest_dict["columns"]
+
+        file_dict = manifest_dict["files"]
+        sm.coef_dict = {
+            x: np.load(os.path.join(store_flr_path, file_dict[x]), mmap_mode="r") for x in SENS_COEF_LIST if x in file_dict
+        }
+        if sparse_flag and "dvdq_csr_data" in file_dict:
+            sm.coef_dict["dvdq"] = scipy.sparse.csr_matrix(
+                tuple(
+                    np.load(os.path.join(store_flr_path, file_dict[f"dvdq_csr_{x}"]))
+                    for x in ["data", "indices", "indptr"]
+                ),
+                shape=tuple(manifest_dict["shape"]),
+            )
+        return sm
+
+    @staticmethod
+    def get_default_path(csv_folder_path):
+        return os.path.join(csv_folder_path, COL_STORE_FLR, SENS_STORE_FN)
+
+
+def test_SensMatrix():
+    import tempfile
+
+    # ==A made-up sweep: 3 inverters, 4 nodes (3 phases each), V = 7200 + s1 * Q + s2 * Q^2
+    rng = np.random.default_rng(0)
+    flr_path = tempfile.mkdtemp()
+    num = 201
+    q_arr = np.linspace(-1000, 1000, num)
+    s1_mat = rng.uniform(0, 5e-3, (12, 3))
+    s2_mat = rng.uniform(-1e-6, 1e-6, (12, 3))
+    col_list = [f"n{x // 3}:voltage_{'ABC'[x % 3]}" for x in range(12)]
+
+    def write_rec_file(rec_pfn, inv_ind, cur_q_arr):
+        volt_mat = 7200 + cur_q_arr[:, np.newaxis] * s1_mat[:, inv_ind] + cur_q_arr[:, np.newaxis] ** 2 * s2_mat[:, inv_ind]
+        os.makedirs(os.path.dirname(rec_pfn), exist_ok=True)
+        with open(rec_pfn, "w") as hf_csv:
+            hf_csv.write(f"# file...... {os.path.basename(rec_pfn)}\n# timestamp,Inv_S{inv_ind}:VA_Out.imag,{','.join(col_list)}\n")
+            for cur_row in range(len(cur_q_arr)):
+                hf_csv.write(
+                    f"2000-01-01 00:{cur_row // 60:02d}:{cur_row % 60:02d} EST,{cur_q_arr[cur_row]},"
+                    + ",".join([f"{x:+.10g}-30d" for x in volt_mat[cur_row]])
+                    + "\n"
+                )
+
+    for cur_inv in range(3):
+        write_rec_file(os.path.join(flr_path, f"Inv_S{cur_inv}.csv"), cur_inv, q_arr)
+
+    sm = SensMatrix()
+    sm.build(flr_path)
+    print(sm.inv_list, len(sm.row_list))
+    assert np.allclose(sm.coef_dict["dvdq"], s1_mat, atol=1e-7)
+    assert np.allclose(sm.coef_dict["d2vdq2"], 2 * s2_mat, atol=1e-9)
+
+    store_flr_path = SensMatrix.get_default_path(flr_path)
+    sm.save(store_flr_path, sparse_tol=1e-3)
+    sm_ld = SensMatrix.load(store_flr_path, sparse_flag=True)
+    print(sm_ld.coef_dict["dvdq"].nnz, "non-zeros of", np.prod(sm_ld.coef_dict["dvdq"].shape))
+
+    # ==The (inverter, Q) folders of a qlist/adaptive sweep, e.g., 'Inv_S0_-0.5/Inv_S0.csv' (one Q per folder)
+    flr_path = tempfile.mkdtemp()
+    for cur_inv, cur_q_pu_list in enumerate([[-1.0, -0.5, 0.0, 0.5, 1.0], [-1.0, -0.25, 0.25, 1.0], [-1.0, 1.0]]):
+        for cur_q_pu in cur_q_pu_list:
+            cur_rec_pfn = os.path.join(flr_path, f"Inv_S{cur_inv}_{cur_q_pu}", f"Inv_S{cur_inv}.csv")
+            write_rec_file(cur_rec_pfn, cur_inv, np.full(2, cur_q_pu * 1000))
+
+    sm = SensMatrix()
+    sm.build(flr_path)
+    print(sm.inv_list, len(sm.row_list))
+    # --the inverter with 2 Q points only is skipped
+    assert sm.inv_list == ["Inv_S0", "Inv_S1"]
+    assert np.allclose(sm.coef_dict["dvdq"], s1_mat[:, :2], atol=1e-7)
+    assert np.allclose(sm.coef_dict["d2vdq2"], 2 * s2_mat[:, :2], atol=1e-9)
+
+    # ==A node recorder (no Q column) in each folder: fitted on the folder Q (p.u.)
+    for cur_inv, cur_q_pu_list in enumerate([[-1.0, -0.5, 0.0, 0.5, 1.0], [-1.0, -0.25, 0.25, 1.0]]):
+        for cur_q_pu in cur_q_pu_list:
+            cur_q_var = cur_q_pu * 1000
+            cur_volt_arr = 7200 + cur_q_var * s1_mat[:3, cur_inv] + cur_q_var**2 * s2_mat[:3, cur_inv]
+            with open(os.path.join(flr_path, f"Inv_S{cur_inv}_{cur_q_pu}", "n9_volt.csv"), "w") as hf_csv:
+                hf_csv.write("# file...... n9_volt.csv\n# target.... n9\n# timestamp,voltage_A,voltage_B,voltage_C\n")
+                hf_csv.write("2000-01-01 00:00:00 EST," + ",".join([f"{x:+.10g}-30d" for x in cur_volt_arr]) + "\n")
+
+    sm = SensMatrix()
+    sm.build(flr_path)
+    n9_row_ind_list = [sm.row_list.index(f"n9:voltage_{x}") for x in "ABC"]
+    assert len(sm.row_list) == 15 and sm.inv_list == ["Inv_S0", "Inv_S1"]
+    assert np.allclose(sm.coef_dict["dvdq"][n9_row_ind_list], s1_mat[:3, :2] * 1000, atol=1e-4)
+    assert np.allclose(sm.coef_dict["d2vdq2"][n9_row_ind_list], 2 * s2_mat[:3, :2] * 1e6, atol=1e-4)
+
+
+if __name__ == "__main__":
+    test_SensMatrix()
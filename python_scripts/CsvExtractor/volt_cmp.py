@@ -0,0 +1,264 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from col_store import ColStore
+from recorder_io import REC_TS_COL, RecorderReader
+
+# ==Constant
+VOLT_CMP_INDEX_NAMES = ["object", "phase"]
+# --e.g., 'voltage_A', 'voltage_12', 'voltage_AB'
+RE_VOLT_PROP = re.compile(r"^voltage_?(?P<ph>\w+)$")
+
+
+class VoltCmp:
+    """Compare the node voltages of two result sets (e.g., without & with PV, or two topologies)
+
+    The voltage columns of each set are aligned by (object, phase), so the magnitude, angle, and from-to drop
+    differences of all the nodes are computed as NumPy arrays at once (set 'b' minus set 'a').
+    """
+
+    @staticmethod
+    def get_volt_cols(col_list, meta_dict):
+        """The voltage columns of a file & their (object, phase) keys
+
+        The column of a multi_recorder is 'object:property'; the ones of a recorder are its properties (the object
+        is the 'target' in the header); and the ones of a group_recorder are the objects (of the one 'property').
+        """
+        tgt_str = meta_dict.get("target", "")
+        grp_prop_str = meta_dict.get("property", "")
+
+        volt_col_list = []
+        key_list = []
+        for cur_col in col_list:
+            if cur_col == REC_TS_COL:
+                continue
+            cur_obj_str, _, cur_prop_str = cur_col.rpartition(":")
+            if not cur_obj_str:
+                if tgt_str:
+                    cur_obj_str, cur_prop_str = tgt_str, cur_col
+                else:
+                    cur_obj_str, cur_prop_str = cur_col, grp_prop_str
+            m_volt = RE_VOLT_PROP.match(cur_prop_str)
+            if m_volt is None:
+                continue
+            volt_col_list.append(cur_col)
+            key_list.append((cur_obj_str, m_volt.group("ph")))
+        return volt_col_list, key_list
+
+    @staticmethod
+    def read_row(rr, col_list, row_ind=-1, chunksize=100000):
+        """One row (e.g., the last one) of the given columns, read chunk by chunk
+        """
+        num_read = 0
+        tail_df = None
+        for cur_rec_df in rr.iter_chunks(col_list, chunksize):
+            if row_ind >= 0:
+                if row_ind < num_read + len(cur_rec_df):
+                    return cur_rec_df.iloc[row_ind - num_read]
+                num_read += len(cur_rec_df)
+            else:
+                tail_df = cur_rec_df if tail_df is None else pd.concat([tail_df, cur_rec_df])
+                tail_df = tail_df.iloc[row_ind:]
+
+        if tail_df is None or len(tail_df) < -row_ind:
+            raise IndexError(f"Row {row_ind} is out of the range of '{rr.csv_pfn}'")
+        return tail_df.iloc[0]
+
+    @staticmethod
+    def read_volt(csv_pfn_list, row_ind=-1, store_flag=False):
+        """The voltage phasors (one row of each file, the last one by default) as a complex Series by (object, phase)
+
+        The files of a set (e.g., several multi-recorders) are merged; the 1st one wins for a repeated column.
+        The files are read as they are, unless 'store_flag' is set (the columnar stores are built or reused,
+        see 'ColStore.from_csv').
+        """
+        if isinstance(csv_pfn_list, str):
+            csv_pfn_list = [csv_pfn_list]
+
+        key_list = []
+        val_list = []
+        for cur_pfn in csv_pfn_list:
+            if store_flag:
+                store = ColStore.from_csv(cur_pfn)
+                cur_col_list, cur_key_list = VoltCmp.get_volt_cols(store.col_list, store.manifest_dict["meta"])
+                cur_val_list = [store.get_col(x)[row_ind] for x in cur_col_list]
+            else:
+                rr = RecorderReader(cur_pfn)
+                cur_col_list, cur_key_list = VoltCmp.get_volt_cols(rr.col_list, rr.meta_dict)
+                cur_val_list = []
+                if cur_col_list:
+                    cur_val_list = VoltCmp.read_row(rr, cur_col_list, row_ind)[cur_col_list].tolist()
+
+            if not cur_col_list:
+                print(f"No voltage column is found in '{cur_pfn}'")
+            key_list += cur_key_list
+            val_list += cur_val_list
+
+        if not key_list:
+            raise ValueError(f"No voltage column is found in {csv_pfn_list}")
+
+        volt_ser = pd.Series(
+            np.asarray(val_list, dtype=complex),
+            index=pd.MultiIndex.from_tuples(key_list, names=VOLT_CMP_INDEX_NAMES),
+        )
+        return volt_ser[~volt_ser.index.duplicated()]
+
+    def __init__(self, csv_pfn_list_a, csv_pfn_list_b, row_ind=-1, store_flag=False):
+        self.volt_a_ser = VoltCmp.read_volt(csv_pfn_list_a, row_ind, store_flag)
+        self.volt_b_ser = VoltCmp.read_volt(csv_pfn_list_b, row_ind, store_flag)
+
+        self.cmp_df = None
+        self.drop_df = None
+
+    def cmp_nodes(self):
+        """The magnitude (V & %) and angle (deg) differences of the (object, phase) pairs found in both sets
+        """
+        volt_a_ser, volt_b_ser = self.volt_a_ser.align(self.volt_b_ser, join="inner")
+        num_only = len(self.volt_a_ser) + len(self.volt_b_ser) - 2 * len(volt_a_ser)
+        if num_only:
+            print(f"{num_only} (object, phase) pair(s) are found in one set only, and are left out")
+
+        volt_a_arr = volt_a_ser.to_numpy()
+        volt_b_arr = volt_b_ser.to_numpy()
+        mag_a_arr = np.abs(volt_a_arr)
+        mag_b_arr = np.abs(volt_b_arr)
+
+        self.cmp_df = pd.DataFrame(
+            {
+                "mag_a": mag_a_arr,
+                "mag_b": mag_b_arr,
+                "mag_diff": mag_b_arr - mag_a_arr,
+                "mag_diff_pct": (mag_b_arr - mag_a_arr) / np.where(mag_a_arr > 0, mag_a_arr, np.nan) * 100,
+                "ang_a": np.angle(volt_a_arr, deg=True),
+                "ang_b": np.angle(volt_b_arr, deg=True),
+                # --the angle of b relative to a, wrapped into (-180, 180]
+                "ang_diff": np.angle(volt_b_arr * np.conj(volt_a_arr), deg=True),
+            },
+            index=volt_a_ser.index,
+        )
+        return self.cmp_df
+
+    def cmp_drops(self, dict_link):
+        """The from-to voltage magnitude drops of the given links (e.g., {'RCL11': [from node, to node]}), per phase
+
+        Only the phases found at both ends are compared.
+        """
+        if self.cmp_df is None:
+            self.cmp_nodes()
+
+        fm_df = self.cmp_df.loc[self.cmp_df.index.get_level_values(0).isin([x[0] for x in dict_link.values()])]
+        to_df = self.cmp_df.loc[self.cmp_df.index.get_level_values(0).isin([x[1] for x in dict_link.values()])]
+
+        link_fm_to_df = pd.DataFrame(
+            [[k, v[0], v[1]] for k, v in dict_link.items()], columns=["link", "from_node", "to_node"]
+        )
+        fm_to_df = link_fm_to_df.merge(
+            fm_df[["mag_a", "mag_b"]].reset_index(), left_on="from_node", right_on="object"
+        ).merge(
+            to_df[["mag_a", "mag_b"]].reset_index(),
+            left_on=["to_node", "phase"],
+            right_on=["object", "phase"],
+            suffixes=("_fm", "_to"),
+        )
+
+        self.drop_df = pd.DataFrame(
+            {
+                "from_node": fm_to_df["from_node"].to_numpy(),
+                "to_node": fm_to_df["to_node"].to_numpy(),
+                "drop_a": (fm_to_df["mag_a_fm"] - fm_to_df["mag_a_to"]).to_numpy(),
+                "drop_b": (fm_to_df["mag_b_fm"] - fm_to_df["mag_b_to"]).to_numpy(),
+            },
+            index=pd.MultiIndex.from_arrays([fm_to_df["link"], fm_to_df["phase"]], names=["link", "phase"]),
+        )
+        self.drop_df["drop_diff"] = self.drop_df["drop_b"] - self.drop_df["drop_a"]
+        return self.drop_df
+
+    def print_summary(self):
+        """Print the statistics of the differences (and the nodes of the largest ones)
+        """
+        if self.cmp_df is None:
+            self.cmp_nodes()
+
+        stat_col_list = ["mag_diff", "mag_diff_pct", "ang_diff"]
+        abs_df = self.cmp_df[stat_col_list].abs()
+        stat_df = pd.DataFrame(
+            {
+                "mean": self.cmp_df[stat_col_list].mean(),
+                "rms": np.sqrt((self.cmp_df[stat_col_list] ** 2).mean()),
+                "max_abs": abs_df.max(),
+                "at": [abs_df[x].idxmax() if abs_df[x].notna().any() else None for x in stat_col_list],
+            }
+        )
+        print(f"Voltage differences (b - a) of {len(self.cmp_df)} (object, phase) pairs:")
+        print(stat_df.to_string())
+
+        if self.drop_df is not None and len(self.drop_df):
+            print("From-to drop differences (b - a):")
+            print(self.drop_df.to_string())
+
+    def write_csv(self, csv_pfn, drop_csv_pfn=""):
+        """Write the full difference table (and the drop table, if computed & a path is given)
+        """
+        if self.cmp_df is None:
+            self.cmp_nodes()
+        self.cmp_df.to_csv(csv_pfn)
+        if drop_csv_pfn and self.drop_df is not None:
+            self.drop_df.to_csv(drop_csv_pfn)
+
+
+def test_VoltCmp():
+    import os.path
+    import tempfile
+
+    # ==Two made-up multi-recorder files of 1000 nodes: set 'b' raises the magnitudes & shifts the angles
+    rng = np.random.default_rng(0)
+    flr_path = tempfile.mkdtemp()
+    num_nds = 1000
+    mag_arr = rng.uniform(6900, 7300, (num_nds, 3))
+    ang_arr = np.array([0, -120, 120]) + rng.uniform(-5, 5, (num_nds, 3))
+    col_list = [f"n{x // 3}:voltage_{'ABC'[x % 3]}" for x in range(num_nds * 3)]
+
+    csv_pfn_dict = {}
+    for cur_set, cur_dmag, cur_dang in [("a", 0.0, 0.0), ("b", 20.0, 0.5)]:
+        csv_pfn_dict[cur_set] = os.path.join(flr_path, f"volt_{cur_set}.csv")
+        cur_cell_list = [f"{x:+.6f}{y:+.6f}d" for x, y in zip((mag_arr + cur_dmag).ravel(), (ang_arr + cur_dang).ravel())]
+        with open(csv_pfn_dict[cur_set], "w") as hf_csv:
+            hf_csv.write(f"# file...... volt_{cur_set}.csv\n# timestamp,{','.join(col_list)}\n")
+            hf_csv.write(f"2000-01-01 00:00:00 EST,{','.join(cur_cell_list)}\n")
+
+    vc = VoltCmp(csv_pfn_dict["a"], csv_pfn_dict["b"])
+    cmp_df = vc.cmp_nodes()
+    vc.cmp_drops({"RCL11": ["n1", "n2"], "RCL9": ["n10", "n11"]})
+    vc.print_summary()
+    vc.write_csv(os.path.join(flr_path, "volt_cmp.csv"), os.path.join(flr_path, "volt_drop_cmp.csv"))
+
+    assert np.allclose(cmp_df["mag_diff"], 20.0, atol=1e-4)
+    assert np.allclose(cmp_df["ang_diff"], 0.5, atol=1e-4)
+    assert np.allclose(vc.drop_df["drop_diff"], 0.0, atol=1e-4)
+
+    # --the inputs are only read (no 'col_store' folder), unless the stores are asked for
+    assert not os.path.exists(os.path.join(flr_path, "col_store"))
+    vc_store = VoltCmp(csv_pfn_dict["a"], csv_pfn_dict["b"], store_flag=True)
+    assert np.allclose(vc_store.cmp_nodes()["mag_diff"], cmp_df["mag_diff"])
+
+    # ==A plain recorder (the object is the 'target' in the header), in 2 rows
+    rec_pfn = os.path.join(flr_path, "n1_volt.csv")
+    with open(rec_pfn, "w") as hf_csv:
+        hf_csv.write("# file...... n1_volt.csv\n# target.... n1\n# property.. voltage_A,voltage_B\n")
+        hf_csv.write("# timestamp,voltage_A,voltage_B\n")
+        hf_csv.write("2000-01-01 00:00:00 EST,+7200+0d,+7200-120d\n2000-01-01 00:00:01 EST,+7100+0d,+7100-120d\n")
+    rec_volt_ser = VoltCmp.read_volt(rec_pfn)
+    assert list(rec_volt_ser.index) == [("n1", "A"), ("n1", "B")]
+    assert np.allclose(np.abs(rec_volt_ser), 7100) and np.isclose(np.abs(VoltCmp.read_volt(rec_pfn, 0)["n1", "A"]), 7200)
+
+
+if __name__ == "__main__":
+    test_VoltCmp()
@@ -0,0 +1,366 @@
+#! /usr/bin/env python3
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+"""
+A stand-in for the gridlabd executable, used to test & benchmark the orchestration layer (e.g., GldSmn,
+simple_gld_runs.py, and autotest/validate.py) without the simulator.
+
+It reads the glm file (with the '#include' files), finds the recorder, multi_recorder, and group_recorder
+objects, and writes their files with the GLD header block and a configurable number of rows. The runtime
+and the failure rate are configurable as well.
+
+Usage:
+    python fake_gridlabd.py [--verbose] [--profile] [-D fake_rows=1000] model.glm
+    python fake_gridlabd.py --install <folder>    (puts a 'gridlabd' wrapper into the folder, e.g., one on the PATH)
+    python fake_gridlabd.py --demo    (runs the stand-in repeatedly & reports the per-run statistics)
+
+Settings (a '-D' definition overrides the environment variable):
+    FAKE_GLD_ROWS (fake_rows): number of rows per recorder, capped by the 'limit' of the recorder (default: 100)
+    FAKE_GLD_RUNTIME_SEC (fake_runtime_sec): simulated runtime (default: 0)
+    FAKE_GLD_RUNTIME_JITTER (fake_runtime_jitter): relative jitter of the runtime (default: 0)
+    FAKE_GLD_FAIL_RATE (fake_fail_rate): probability of a failed run (default: 0)
+    FAKE_GLD_SEED (fake_seed): seed of the random generator (default: none)
+"""
+
+import datetime
+import getpass
+import math
+import os.path
+import random
+import re
+import socket
+import stat
+import sys
+import time
+
+# ==Constant
+FAKE_GLD_SETTING_DIC = {
+    "fake_rows": ("FAKE_GLD_ROWS", int, 100),
+    "fake_runtime_sec": ("FAKE_GLD_RUNTIME_SEC", float, 0.0),
+    "fake_runtime_jitter": ("FAKE_GLD_RUNTIME_JITTER", float, 0.0),
+    "fake_fail_rate": ("FAKE_GLD_FAIL_RATE", float, 0.0),
+    "fake_seed": ("FAKE_GLD_SEED", int, None),
+}
+REC_CLS_LIST = ["recorder", "multi_recorder", "group_recorder"]
+
+DEFAULT_START_STR = "2000-01-01 00:00:00"
+DEFAULT_TZ_STR = "EST"
+NOMINAL_VOLT_V = 7200.0
+
+
+def read_glm(glm_pfn, depth=0):
+    """Read a glm file with its '#include' files, and remove the comments
+    """
+    if depth > 32:
+        raise RecursionError("The '#include' files are nested too deep (cyclic?)")
+
+    with open(glm_pfn, "r") as hf_glm:
+        glm_str = hf_glm.read()
+    glm_str = re.sub(r"//.*", "", glm_str)
+
+    glm_flr_path = os.path.dirname(os.path.abspath(glm_pfn))
+    glpath_list = [x for x in os.environ.get("GLPATH", "").split(os.pathsep) if x]
+
+    def repl_include(m_inc):
+        inc_fn = m_inc.group(1).strip().strip('"<>')
+        for cur_flr_path in [os.getcwd(), glm_flr_path] + glpath_list:
+            cur_inc_pfn = os.path.join(cur_flr_path, inc_fn)
+            if os.path.exists(cur_inc_pfn):
+                return read_glm(cur_inc_pfn, depth + 1)
+        print(f"WARNING [INIT] : include file '{inc_fn}' is not found", file=sys.stderr)
+        return ""
+
+    return re.sub(r"^\s*#include\s+(.*)$", repl_include, glm_str, flags=re.MULTILINE)
+
+
+def find_objs(glm_str, cls_list):
+    """Find the objects of the given classes (nested objects included) & their properties
+    """
+    obj_list = []
+    for m_obj in re.finditer(r"object\s+({})\b[^{{;]*{{".format("|".join(cls_list)), glm_str):
+        # --match the braces
+        depth = 1
+        cur_ind = m_obj.end()
+        while cur_ind < len(glm_str) and depth:
+            if glm_str[cur_ind] == "{":
+                depth += 1
+            elif glm_str[cur_ind] == "}":
+                depth -= 1
+            cur_ind += 1
+        body_str = glm_str[m_obj.end() : cur_ind - 1]
+
+        # --the properties at the top level of the object only
+        body_top_str = re.sub(r"object\s+\w+[^{;]*{.*}", "", body_str, flags=re.DOTALL)
+        obj_dic = {"class": m_obj.group(1)}
+        for m_prop in re.finditer(r"(\w[\w.]*)\s+([^;]+?)\s*;", body_top_str):
+            obj_dic[m_prop.group(1)] = m_prop.group(2).strip().strip('"')
+        obj_list.append(obj_dic)
+    return obj_list
+
+
+def find_parent_names(glm_str):
+    """Map the position of each nested recorder to the name of its enclosing object
+    """
+    name_list = []
+    for m_obj in re.finditer(r"object\s+(\w+)\b[^{;]*{", glm_str):
+        if m_obj.group(1) in REC_CLS_LIST:
+            # ~~the enclosing object is the last opened, unclosed object
+            depth = 0
+            cur_ind = m_obj.start() - 1
+            while cur_ind >= 0:
+                if glm_str[cur_ind] == "}":
+                    depth += 1
+                elif glm_str[cur_ind] == "{":
+                    if depth == 0:
+                        break
+                    depth -= 1
+                cur_ind -= 1
+            parent_name = None
+            if cur_ind >= 0:
+                m_name = re.search(r"\bname\s+([^;\s]+)\s*;", glm_str[cur_ind:m_obj.start()])
+                if m_name:
+                    parent_name = m_name.group(1)
+            name_list.append(parent_name)
+    return name_list
+
+
+def get_clock(glm_str):
+    m_clock = re.search(r"clock\s*{([^}]*)}", glm_str)
+    start_str = DEFAULT_START_STR
+    tz_str = DEFAULT_TZ_STR
+    start_tok_list = []
+    if m_clock:
+        m_start = re.search(r"starttime\s+'?\"?([^;'\"]+)", m_clock.group(1))
+        if m_start:
+            start_tok_list = m_start.group(1).strip().split()
+            start_str = " ".join(start_tok_list[:2])
+            if len(start_tok_list) > 2:
+                tz_str = start_tok_list[2]
+        m_tz = re.search(r"timezone\s+([^;]+);", m_clock.group(1))
+        if m_tz and len(start_tok_list) <= 2:
+            tz_str = m_tz.group(1).strip().split("+")[0].split("-")[0][:3]
+    return datetime.datetime.strptime(start_str, "%Y-%m-%d %H:%M:%S"), tz_str
+
+
+def fake_value_str(prop_str, ite, num_rows, rng):
+    """A plausible value of a property, following the name of the property
+    """
+    prop_nm = prop_str.split(":")[-1].lower()
+    frac = ite / max(num_rows - 1, 1)
+
+    if prop_nm.rsplit(".", 1)[-1] in ("real", "imag", "mag", "ang", "arg"):
+        return f"{100 * math.cos(frac) + rng.gauss(0, 1e-2):.6g}"
+    if prop_nm.startswith("voltage") or prop_nm.startswith("measured_voltage"):
+        mag = NOMINAL_VOLT_V * (1.0 + 0.02 * math.sin(2 * math.pi * frac) + rng.gauss(0, 1e-4))
+        ang = {"a": 0.0, "b": -120.0, "c": 120.0}.get(prop_nm[-1], 0.0) + rng.gauss(0, 0.05)
+        return f"{mag:+.6g}{ang:+.6g}d"
+    if prop_nm.startswith("current") or prop_nm.startswith("power") or prop_nm.endswith("_out"):
+        return f"{100 * math.cos(frac):+.6g}{10 * math.sin(frac):+.6g}j"
+    if prop_nm == "value":
+        return f"{-1.0 + 2.0 * frac:.6g}"
+    return f"{rng.uniform(0, 1):.6g}"
+
+
+def write_rec_file(rec_dic, parent_name, num_rows, t0, tz_str, rng):
+    rec_pfn = rec_dic.get("file") or f"{rec_dic.get('parent', parent_name or 'recorder')}.csv"
+    interval_sec = int(float(rec_dic.get("interval", "1").split()[0]))
+    if interval_sec <= 0:
+        interval_sec = 1
+    limit = int(float(rec_dic.get("limit", "0")))
+    if limit > 0:
+        num_rows = min(num_rows, limit)
+
+    prop_list = [x.strip() for x in rec_dic.get("property", "").split(",") if x.strip()]
+    target_str = rec_dic.get("parent", parent_name or "")
+    if rec_dic["class"] == "recorder":
+        col_list = prop_list
+    elif rec_dic["class"] == "group_recorder":
+        col_list = [f"obj{x}" for x in range(4)]
+    else:
+        col_list = [x if ":" in x else f"{target_str}:{x}" for x in prop_list]
+
+    # ==Header block
+    header_list = [
+        f"# file...... {rec_pfn}",
+        f"# date...... {time.strftime('%a %b %d %H:%M:%S %Y')}",
+        f"# user...... {getpass.getuser()}",
+        f"# host...... {socket.gethostname()}",
+    ]
+    if rec_dic["class"] == "recorder":
+        header_list += [f"# target.... {target_str}", "# trigger... (none)"]
+    header_list += [f"# interval.. {interval_sec}", f"# limit..... {limit}"]
+    if rec_dic["class"] != "recorder":
+        header_list.append(f"# property.. {rec_dic.get('property', '')}")
+    header_list.append("# timestamp," + ",".join(col_list))
+
+    # ==Rows
+    rec_flr_path = os.path.dirname(rec_pfn)
+    if rec_flr_path:
+        os.makedirs(rec_flr_path, exist_ok=True)
+    with open(rec_pfn, "w") as hf_rec:
+        hf_rec.write("\n".join(header_list) + "\n")
+        row_list = []
+        for cur_ite in range(num_rows):
+            cur_t = t0 + datetime.timedelta(seconds=cur_ite * interval_sec)
+            row_list.append(
+                f"{cur_t.strftime('%Y-%m-%d %H:%M:%S')} {tz_str},"
+                + ",".join([fake_value_str(x, cur_ite, num_rows, rng) for x in col_list])
+            )
+            if len(row_list) >= 10000:
+                hf_rec.write("\n".join(row_list) + "\n")
+                row_list = []
+        if row_list:
+            hf_rec.write("\n".join(row_list) + "\n")
+    return rec_pfn
+
+
+def get_settings(define_list):
+    setting_dic = {}
+    define_dic = dict([x.split("=", 1) for x in define_list if "=" in x])
+    for cur_key, (cur_env, cur_type, cur_default) in FAKE_GLD_SETTING_DIC.items():
+        cur_val = define_dic.get(cur_key, os.environ.get(cur_env))
+        setting_dic[cur_key] = cur_default if cur_val in (None, "") else cur_type(cur_val)
+    return setting_dic
+
+
+def install_wrapper(dst_flr_path):
+    """Put a 'gridlabd' wrapper (and 'gridlabd.bat' on Windows) into a folder
+    """
+    os.makedirs(dst_flr_path, exist_ok=True)
+    self_pfn = os.path.abspath(__file__)
+    if os.name == "nt":
+        wrapper_pfn = os.path.join(dst_flr_path, "gridlabd.bat")
+        with open(wrapper_pfn, "w") as hf_wrapper:
+            hf_wrapper.write(f'@"{sys.executable}" "{self_pfn}" %*\n')
+    else:
+        wrapper_pfn = os.path.join(dst_flr_path, "gridlabd")
+        with open(wrapper_pfn, "w") as hf_wrapper:
+            hf_wrapper.write(f'#!/bin/sh\nexec "{sys.executable}" "{self_pfn}" "$@"\n')
+        os.chmod(wrapper_pfn, os.stat(wrapper_pfn).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    print(f"The fake gridlabd wrapper is installed as '{wrapper_pfn}'")
+    return wrapper_pfn
+
+
+def main(argv):
+    # ==Arguments (the unknown gridlabd options are accepted & ignored)
+    verbose_flag = profile_flag = False
+    define_list = []
+    glm_pfn_list = []
+    arg_ite = 1
+    while arg_ite < len(argv):
+        cur_arg = argv[arg_ite]
+        if cur_arg == "--install":
+            install_wrapper(argv[arg_ite + 1])
+            return 0
+        elif cur_arg in ("--verbose", "-v"):
+            verbose_flag = True
+        elif cur_arg == "--profile":
+            profile_flag = True
+        elif cur_arg in ("-D", "--define"):
+            arg_ite += 1
+            define_list.append(argv[arg_ite])
+        elif cur_arg in ("-o", "--output"):
+            arg_ite += 1
+        elif cur_arg.startswith("-"):
+            pass
+        else:
+            glm_pfn_list.append(cur_arg)
+        arg_ite += 1
+
+    if not glm_pfn_list:
+        print("ERROR [INIT] : no model file is given", file=sys.stderr)
+        return 1
+
+    setting_dic = get_settings(define_list)
+    rng = random.Random(setting_dic["fake_seed"])
+
+    st_time = time.time()
+
+    # ==Load
+    try:
+        glm_str = "\n".join([read_glm(x) for x in glm_pfn_list])
+    except OSError as err:
+        print(f"ERROR [INIT] : {err}", file=sys.stderr)
+        return 1
+    rec_list = find_objs(glm_str, REC_CLS_LIST)
+    parent_name_list = find_parent_names(glm_str)
+    num_objects = len(re.findall(r"\bobject\s+\w+", glm_str))
+    t0, tz_str = get_clock(glm_str)
+    if verbose_flag:
+        print(f"Model loaded: {num_objects} objects, {len(rec_list)} recorders", file=sys.stderr)
+    load_sec = time.time() - st_time
+
+    # ==Simulate
+    runtime_sec = setting_dic["fake_runtime_sec"] * (
+        1.0 + rng.uniform(-1, 1) * setting_dic["fake_runtime_jitter"]
+    )
+    if runtime_sec > 0:
+        time.sleep(runtime_sec)
+
+    if rng.random() < setting_dic["fake_fail_rate"]:
+        print("ERROR [powerflow] : Newton-Raphson method did not converge (fake failure)", file=sys.stderr)
+        return 2
+
+    # ==Outputs
+    for cur_rec_dic, cur_parent_name in zip(rec_list, parent_name_list):
+        cur_rec_pfn = write_rec_file(cur_rec_dic, cur_parent_name, setting_dic["fake_rows"], t0, tz_str, rng)
+        if verbose_flag:
+            print(f"VERBOSE [{cur_rec_dic['class']}] : '{cur_rec_pfn}' is written", file=sys.stderr)
+
+    if verbose_flag:
+        print(f"NR: {rng.randint(2, 6)} iterations", file=sys.stderr)
+
+    if profile_flag:
+        total_sec = time.time() - st_time
+        print("Core profiler results")
+        print("======================")
+        print(f"Total objects          {num_objects:8d} objects")
+        print(f"Total time             {total_sec:8.3f} seconds")
+        print(f"  Core time            {total_sec - runtime_sec:8.3f} seconds")
+        print(f"  Model time           {max(runtime_sec, 0):8.3f} seconds")
+        print(f"  Model load time      {load_sec:8.3f} seconds")
+        print(f"Simulation rate        {setting_dic['fake_rows'] / max(total_sec, 1e-9):8.0f} x realtime")
+    return 0
+
+
+def test_fake_gridlabd():
+    """Benchmark the pipeline overhead: run the stand-in repeatedly & report the per-run statistics
+    """
+    import tempfile
+
+    from run_stats import run_instrumented
+
+    flr_path = tempfile.mkdtemp(prefix="fake_gld_")
+    glm_pfn = os.path.join(flr_path, "main.glm")
+    with open(glm_pfn, "w") as hf_glm:
+        hf_glm.write(
+            "clock { starttime '2000-01-01 00:00:00 EST'; stoptime '2000-01-01 01:00:00 EST'; }\n"
+            "object node { name n1; phases ABCN; nominal_voltage 7200;\n"
+            "  object recorder { property voltage_A,voltage_B,voltage_C; file n1_volt.csv; interval 1; };\n"
+            "}\n"
+            "object multi_recorder { property n1:voltage_A, q_player:value; file mr.csv; interval 1; }\n"
+        )
+
+    num_runs = 10
+    st_time = time.time()
+    for _ in range(num_runs):
+        stats_dic, _ = run_instrumented(
+            [sys.executable, os.path.abspath(__file__), "--verbose", "--profile", "-D", "fake_rows=1000", glm_pfn],
+            cwd=flr_path,
+            echo_flag=False,
+        )
+    print(f"{num_runs} runs in {time.time() - st_time} (secs), the last one: {stats_dic}")
+
+    with open(os.path.join(flr_path, "mr.csv")) as hf_mr:
+        print("".join(hf_mr.readlines()[:10]))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--demo"]:
+        test_fake_gridlabd()
+    else:
+        sys.exit(main(sys.argv))
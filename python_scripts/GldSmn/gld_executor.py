@@ -0,0 +1,608 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import argparse
+import concurrent.futures
+import hashlib
+import hmac
+import io
+import json
+import os.path
+import queue
+import secrets
+import shutil
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+
+from run_stats import run_instrumented
+
+# ==Constant
+MSG_HEADER_FMT = "!II"  # (length of the json header, length of the binary payload)
+MSG_HEADER_SIZE = struct.calcsize(MSG_HEADER_FMT)
+WORKER_WAIT_SEC = 0.2
+# --the return code of a bundle that could not be run (e.g., an exception, or its workers kept disconnecting)
+BUNDLE_FAILED_RC = -1
+# --the number of times a bundle is handed out before it is reported as failed
+BUNDLE_MAX_TRIES = 3
+RESULT_POLL_SEC = 1.0
+# --the shared token of the TCP coordinator & workers (if not given on the command line)
+TOKEN_ENV_VAR = "GLD_EXECUTOR_TOKEN"
+
+"""
+Scenario bundles & results
+
+A scenario bundle is a dict with the keys:
+    'scn_key': the scenario key (see 'SweepManifest.get_scn_key'),
+    'files': {relative path: contents}, the files (e.g., the rendered inverter glm) written over the model folder,
+    'main_glm': the relative path of the main glm file,
+    'gld_exe': the GLD executable (used by the local executors only; a TCP worker runs its own, see 'TcpWorker'),
+    'out_suff': the suffix of the output files (e.g., '.csv'),
+    'gld_opts': (optional) the GLD command line options, e.g., ['--verbose', '--profile'].
+The model folder itself is shared by all bundles and is sent as a gzipped tar archive (see 'pack_folder').
+
+A result is a dict with the keys 'scn_key', 'returncode', 'elapsed_sec', 'output' (the tail of the GLD outputs), 'host',
+'stats' (see 'run_stats.run_instrumented'), and 'out_tgz' (the gzipped tar archive of the output files).
+A bundle that could not be run has the return code 'BUNDLE_FAILED_RC', the reason in 'error', no 'stats', and an
+empty 'out_tgz' (see 'get_failed_result').
+"""
+
+
+def pack_folder(flr_path, excl_suff_list=(), excl_path_list=()):
+    """Pack a folder into a gzipped tar archive (bytes)
+    """
+    excl_abs_path_list = [os.path.abspath(x) for x in excl_path_list]
+
+    def filter_tarinfo(tarinfo):
+        cur_abs_pfn = os.path.abspath(os.path.join(flr_path, tarinfo.name))
+        if any(cur_abs_pfn == x or cur_abs_pfn.startswith(x + os.sep) for x in excl_abs_path_list):
+            return None
+        if tarinfo.isfile() and tarinfo.name.endswith(tuple(excl_suff_list)):
+            return None
+        return tarinfo
+
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as hf_tar:
+        hf_tar.add(flr_path, arcname=".", filter=filter_tarinfo)
+    return buf.getvalue()
+
+
+def pack_files(flr_path, rel_pfn_list):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as hf_tar:
+        for cur_rel_pfn in rel_pfn_list:
+            hf_tar.add(os.path.join(flr_path, cur_rel_pfn), arcname=cur_rel_pfn)
+    return buf.getvalue()
+
+
+def unpack_bytes(tgz_bytes, dst_flr_path):
+    with tarfile.open(fileobj=io.BytesIO(tgz_bytes), mode="r:gz") as hf_tar:
+        hf_tar.extractall(dst_flr_path, filter="data")
+
+
+def list_files(flr_path, suff_str):
+    rel_pfn_set = set()
+    for root, _, files in os.walk(flr_path):
+        for cur_fn in files:
+            if cur_fn.endswith(suff_str):
+                rel_pfn_set.add(os.path.relpath(os.path.join(root, cur_fn), flr_path))
+    return rel_pfn_set
+
+
+def get_run_pfn(run_flr_path, rel_pfn):
+    """The path of a bundle file under the run folder (the paths outside of it are refused)
+    """
+    run_abs_path = os.path.abspath(run_flr_path)
+    cur_abs_pfn = os.path.abspath(os.path.join(run_abs_path, rel_pfn))
+    if os.path.commonpath([run_abs_path, cur_abs_pfn]) != run_abs_path:
+        raise ValueError(f"The bundle file '{rel_pfn}' is outside of the run folder!")
+    return cur_abs_pfn
+
+
+def run_bundle(base_tgz, bundle, tmp_root_path=None, gld_exe=None):
+    """Run one scenario bundle in a fresh copy of the model folder and pack its outputs
+
+    The given 'gld_exe' takes the place of the one in the bundle (e.g., the executable configured on a TCP worker).
+    """
+    if gld_exe is None:
+        gld_exe = bundle["gld_exe"]
+
+    run_flr_path = tempfile.mkdtemp(prefix=f"gld_{bundle['scn_key']}_", dir=tmp_root_path)
+    try:
+        # --model folder & the files of this scenario
+        unpack_bytes(base_tgz, run_flr_path)
+        for cur_rel_pfn, cur_str in bundle["files"].items():
+            with open(get_run_pfn(run_flr_path, cur_rel_pfn), "w") as hf_cur:
+                hf_cur.write(cur_str)
+        pre_out_set = list_files(run_flr_path, bundle["out_suff"])
+
+        # --run
+        stats_dic, out_line_list = run_instrumented(
+            [gld_exe] + bundle.get("gld_opts", []) + [bundle["main_glm"]],
+            cwd=run_flr_path,
+            echo_flag=False,
+        )
+
+        # --outputs (the files created by this run only)
+        out_rel_pfn_list = sorted(list_files(run_flr_path, bundle["out_suff"]) - pre_out_set)
+        stats_dic["out_bytes"] = sum(
+            [os.path.getsize(os.path.join(run_flr_path, x)) for x in out_rel_pfn_list]
+        )
+        stats_dic["num_out_files"] = len(out_rel_pfn_list)
+        stats_dic["scn_key"] = bundle["scn_key"]
+        stats_dic["host"] = socket.gethostname()
+
+        return {
+            "scn_key": bundle["scn_key"],
+            "returncode": stats_dic["returncode"],
+            "elapsed_sec": stats_dic["wall_sec"],
+            "output": "\n".join(out_line_list)[-4096:],
+            "host": stats_dic["host"],
+            "stats": stats_dic,
+            "out_tgz": pack_files(run_flr_path, out_rel_pfn_list),
+        }
+    finally:
+        shutil.rmtree(run_flr_path, ignore_errors=True)
+
+
+def get_failed_result(bundle, err_msg):
+    """The result of a bundle that could not be run
+    """
+    return {
+        "scn_key": bundle["scn_key"],
+        "returncode": BUNDLE_FAILED_RC,
+        "elapsed_sec": 0.0,
+        "output": "",
+        "host": socket.gethostname(),
+        "stats": None,
+        "out_tgz": b"",
+        "error": err_msg,
+    }
+
+
+def try_run_bundle(base_tgz, bundle, tmp_root_path=None, gld_exe=None):
+    """Run a bundle (see 'run_bundle'); an exception is turned into a failed result
+    """
+    try:
+        return run_bundle(base_tgz, bundle, tmp_root_path, gld_exe)
+    except Exception as err:
+        return get_failed_result(bundle, f"{type(err).__name__}: {err}")
+
+
+"""
+Executors
+"""
+
+
+class GldExecutor:
+    """Interface of the executors: run a list of scenario bundles & yield the results as they finish"""
+
+    def __init__(self, base_tgz):
+        self.base_tgz = base_tgz
+        self.base_hash = hashlib.sha256(base_tgz).hexdigest()
+
+    def run_bundles(self, bundle_list):
+        raise NotImplementedError
+
+
+class SerialExecutor(GldExecutor):
+    """Run the bundles one by one in the current process"""
+
+    def run_bundles(self, bundle_list):
+        for cur_bundle in bundle_list:
+            yield try_run_bundle(self.base_tgz, cur_bundle)
+
+
+# ~~the model archive is handed to each pool worker once, instead of once per bundle
+_pool_base_tgz = None
+
+
+def _init_pool_worker(base_tgz):
+    global _pool_base_tgz
+    _pool_base_tgz = base_tgz
+
+
+def _run_pool_bundle(bundle):
+    return run_bundle(_pool_base_tgz, bundle)
+
+
+class LocalPoolExecutor(GldExecutor):
+    """Run the bundles on a local process pool"""
+
+    def __init__(self, base_tgz, max_workers=None):
+        super().__init__(base_tgz)
+        self.max_workers = max_workers
+
+    def run_bundles(self, bundle_list):
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_pool_worker,
+            initargs=(self.base_tgz,),
+        ) as pool:
+            future_dict = {pool.submit(_run_pool_bundle, x): x for x in bundle_list}
+            for cur_future in concurrent.futures.as_completed(future_dict):
+                # --e.g., a bundle file outside of the run folder, or a broken pool
+                try:
+                    yield cur_future.result()
+                except Exception as err:
+                    yield get_failed_result(future_dict[cur_future], f"{type(err).__name__}: {err}")
+
+
+"""
+TCP work queue
+"""
+
+
+def send_msg(sock, header_dic, payload=b""):
+    header_bytes = json.dumps(header_dic).encode("utf-8")
+    sock.sendall(struct.pack(MSG_HEADER_FMT, len(header_bytes), len(payload)) + header_bytes + payload)
+
+
+def recv_exact(sock, num_bytes):
+    buf = bytearray()
+    while len(buf) < num_bytes:
+        chunk = sock.recv(min(num_bytes - len(buf), 1 << 20))
+        if not chunk:
+            raise ConnectionError("The connection is closed by the peer!")
+        buf += chunk
+    return bytes(buf)
+
+
+def check_token(header_dic, token):
+    return hmac.compare_digest(str(header_dic.get("token", "")).encode("utf-8"), token.encode("utf-8"))
+
+
+def recv_msg(sock):
+    header_len, payload_len = struct.unpack(MSG_HEADER_FMT, recv_exact(sock, MSG_HEADER_SIZE))
+    header_dic = json.loads(recv_exact(sock, header_len).decode("utf-8"))
+    payload = recv_exact(sock, payload_len) if payload_len else b""
+    return header_dic, payload
+
+
+class TcpCoordinator(GldExecutor):
+    """Hand out the scenario bundles to the TCP workers (see 'TcpWorker') & collect the results
+
+    Messages (json header + binary payload):
+        worker -> coordinator: {'type': 'get', 'base_hash': ..., 'token': ...}
+                               {'type': 'result', 'token': ..., ...result without 'out_tgz'} + out_tgz
+        coordinator -> worker: {'type': 'job', 'bundle': ..., 'base_hash': ..., 'token': ...} + the model archive
+                               (if the worker does not have it yet)
+                               {'type': 'wait'}, {'type': 'stop'}
+    Every message of a worker carries the shared token ('token', or the environment variable 'GLD_EXECUTOR_TOKEN';
+    a random one is generated if neither is set); a connection with a wrong token is dropped.
+    A bundle taken by a worker that disconnects before returning the result is put back into the queue, up to
+    'max_tries' times in all; then it is reported as failed. The remaining bundles are reported as failed as well,
+    if no worker is connected for 'no_worker_sec', or no result comes in for 'result_timeout_sec' (if given).
+    """
+
+    def __init__(
+        self,
+        base_tgz,
+        host="127.0.0.1",
+        port=0,
+        token=None,
+        max_tries=BUNDLE_MAX_TRIES,
+        no_worker_sec=60.0,
+        result_timeout_sec=None,
+    ):
+        super().__init__(base_tgz)
+        self.host = host
+        self.port = port
+        self.token = token or os.environ.get(TOKEN_ENV_VAR) or secrets.token_hex(16)
+        self.max_tries = max_tries
+        self.no_worker_sec = no_worker_sec
+        self.result_timeout_sec = result_timeout_sec
+
+        self.server = None
+        self.job_queue = None
+        self.result_queue = None
+        self.try_dict = {}
+        self.num_workers = 0
+        self.worker_lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """Start listening (the port is assigned by the OS, if 0 is given)
+        """
+        coordinator = self
+
+        class WorkerHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                coordinator.handle_worker(self.request)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self.server = socketserver.ThreadingTCPServer((self.host, self.port), WorkerHandler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        print(f"Coordinator is listening on {self.host}:{self.port} (token: {self.token})")
+
+    def shutdown(self):
+        self.stop_event.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def handle_worker(self, sock):
+        cur_bundle = None
+        auth_flag = False
+        try:
+            while True:
+                header_dic, payload = recv_msg(sock)
+                if not check_token(header_dic, self.token):
+                    print("A worker with a wrong token is dropped!")
+                    return
+                if not auth_flag:
+                    auth_flag = True
+                    with self.worker_lock:
+                        self.num_workers += 1
+
+                if header_dic["type"] == "result":
+                    header_dic.pop("token")
+                    header_dic["out_tgz"] = payload
+                    self.result_queue.put(header_dic)
+                    cur_bundle = None
+
+                elif header_dic["type"] == "get":
+                    if self.stop_event.is_set():
+                        send_msg(sock, {"type": "stop"})
+                        return
+                    try:
+                        cur_bundle = self.job_queue.get_nowait()
+                    except (queue.Empty, AttributeError):
+                        send_msg(sock, {"type": "wait"})
+                        continue
+                    self.try_dict[cur_bundle["scn_key"]] = self.try_dict.get(cur_bundle["scn_key"], 0) + 1
+
+                    base_payload = b"" if header_dic.get("base_hash") == self.base_hash else self.base_tgz
+                    send_msg(
+                        sock,
+                        {"type": "job", "bundle": cur_bundle, "base_hash": self.base_hash, "token": self.token},
+                        base_payload,
+                    )
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            if auth_flag:
+                with self.worker_lock:
+                    self.num_workers -= 1
+
+            # --requeue the unfinished bundle (or give up on it, e.g., if it keeps killing its workers)
+            if cur_bundle is not None and self.job_queue is not None:
+                num_tries = self.try_dict.get(cur_bundle["scn_key"], 0)
+                if num_tries < self.max_tries:
+                    self.job_queue.put(cur_bundle)
+                else:
+                    self.result_queue.put(
+                        get_failed_result(cur_bundle, f"The workers disconnected in all the {num_tries} tries")
+                    )
+
+    def run_bundles(self, bundle_list):
+        if self.server is None:
+            self.start()
+
+        self.job_queue = queue.Queue()
+        self.result_queue = queue.Queue()
+        self.try_dict = {}
+        pending_dict = {}
+        for cur_bundle in bundle_list:
+            self.job_queue.put(cur_bundle)
+            pending_dict[cur_bundle["scn_key"]] = cur_bundle
+
+        last_worker_time = last_result_time = time.time()
+        while pending_dict:
+            try:
+                cur_result = self.result_queue.get(timeout=RESULT_POLL_SEC)
+            except queue.Empty:
+                cur_time = time.time()
+                if self.num_workers:
+                    last_worker_time = cur_time
+
+                err_msg = None
+                if cur_time - last_worker_time > self.no_worker_sec:
+                    err_msg = f"No worker is connected for {self.no_worker_sec} (secs)"
+                elif self.result_timeout_sec is not None and cur_time - last_result_time > self.result_timeout_sec:
+                    err_msg = f"No result comes in for {self.result_timeout_sec} (secs)"
+                if err_msg is None:
+                    continue
+
+                # --abort: the remaining bundles are not handed out anymore
+                print(f"The sweep is aborted: {err_msg}")
+                self.job_queue = None
+                for cur_bundle in pending_dict.values():
+                    yield get_failed_result(cur_bundle, err_msg)
+                return
+
+            # --e.g., a late result of a bundle already reported as failed
+            if pending_dict.pop(cur_result["scn_key"], None) is None:
+                continue
+            last_result_time = time.time()
+            yield cur_result
+
+
+class TcpWorker:
+    """Take the scenario bundles from a 'TcpCoordinator', run them locally, and return the results
+
+    The bundles are run with the GLD executable configured here ('gld_exe'), never the one sent in the bundle.
+    """
+
+    def __init__(self, host, port, gld_exe, token=None, tmp_root_path=None):
+        self.host = host
+        self.port = port
+        self.gld_exe = gld_exe
+        self.token = token or os.environ.get(TOKEN_ENV_VAR)
+        if not self.token:
+            raise ValueError(f"The shared token is not given (see '--token' or '{TOKEN_ENV_VAR}')!")
+        self.tmp_root_path = tmp_root_path
+
+        self.base_tgz = None
+        self.base_hash = None
+
+    def serve(self, max_idle_sec=None):
+        """Keep working until the coordinator says 'stop' (or nothing is handed out for 'max_idle_sec')
+        """
+        with socket.create_connection((self.host, self.port)) as sock:
+            idle_st_time = time.time()
+            while True:
+                send_msg(sock, {"type": "get", "base_hash": self.base_hash, "token": self.token})
+                header_dic, payload = recv_msg(sock)
+
+                if header_dic["type"] == "stop":
+                    return
+                elif header_dic["type"] == "wait":
+                    if max_idle_sec is not None and time.time() - idle_st_time > max_idle_sec:
+                        return
+                    time.sleep(WORKER_WAIT_SEC)
+                    continue
+
+                # --job
+                if not check_token(header_dic, self.token):
+                    raise ConnectionError("The coordinator sent a wrong token!")
+                if payload:
+                    self.base_tgz = payload
+                    self.base_hash = header_dic["base_hash"]
+
+                cur_result = try_run_bundle(self.base_tgz, header_dic["bundle"], self.tmp_root_path, self.gld_exe)
+                out_tgz = cur_result.pop("out_tgz")
+                send_msg(sock, dict(cur_result, type="result", token=self.token), out_tgz)
+                idle_st_time = time.time()
+
+
+def run_tcp_workers(host, port, gld_exe, token=None, num_workers=1, max_idle_sec=None):
+    """Start a number of worker processes on this node
+    """
+    # ~~the token is passed via the environment, so it does not show up in the process list
+    env_dic = dict(os.environ)
+    if token:
+        env_dic[TOKEN_ENV_VAR] = token
+
+    proc_list = [
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "worker", host, str(port), "--gld-exe", gld_exe]
+            + ([] if max_idle_sec is None else ["--max-idle-sec", str(max_idle_sec)]),
+            env=env_dic,
+        )
+        for _ in range(num_workers)
+    ]
+    return proc_list
+
+
+def test_executors():
+    """Run a few bundles with a stand-in 'GLD' on localhost
+    """
+    # ==Model folder
+    model_flr_path = tempfile.mkdtemp(prefix="gld_model_")
+    with open(os.path.join(model_flr_path, "main.glm"), "w") as hf_glm:
+        hf_glm.write('#include "inv.glm"\n')
+    with open(os.path.join(model_flr_path, "fake_gld.py"), "w") as hf_exe:
+        hf_exe.write(
+            "import sys, re\n"
+            "q = re.search(r'Q_Out (\\S+);', open('inv.glm').read()).group(1)\n"
+            "open('out.csv', 'w').write(f'# timestamp,Q_Out\\n2000-01-01 00:00:00 EST,{q}\\n')\n"
+        )
+    # --a 'GLD' that kills the worker running it
+    with open(os.path.join(model_flr_path, "kill_worker.py"), "w") as hf_exe:
+        hf_exe.write("import os\nos.kill(os.getppid(), 9)\n")
+
+    base_tgz = pack_folder(model_flr_path)
+    bundle_list = [
+        {
+            "scn_key": f"inv1_{x}",
+            "files": {"inv.glm": f"object inverter {{ name inv1; Q_Out {x}; }}\n"},
+            "main_glm": "fake_gld.py",
+            "gld_exe": "not-used-by-the-tcp-workers",
+            "out_suff": ".csv",
+        }
+        for x in [-1.0, 0.0, 1.0]
+    ]
+
+    # ==Local pool
+    local_bundle_list = [dict(x, gld_exe=sys.executable) for x in bundle_list]
+    for cur_result in LocalPoolExecutor(base_tgz, max_workers=2).run_bundles(local_bundle_list):
+        print(cur_result["scn_key"], cur_result["returncode"], len(cur_result["out_tgz"]))
+
+    # --an exception of a bundle is a failed result, and the other bundles go on
+    esc_bundle = dict(local_bundle_list[0], scn_key="escaped", files={"../escaped.glm": ""})
+    rc_dict = {
+        x["scn_key"]: x["returncode"]
+        for x in LocalPoolExecutor(base_tgz, max_workers=2).run_bundles(local_bundle_list + [esc_bundle])
+    }
+    assert rc_dict == {"inv1_-1.0": 0, "inv1_0.0": 0, "inv1_1.0": 0, "escaped": BUNDLE_FAILED_RC}
+
+    # ==TCP (coordinator & workers on localhost)
+    coord = TcpCoordinator(base_tgz, max_tries=2, no_worker_sec=2.0)
+    coord.start()
+    # --a worker with a wrong token is dropped (& gives up once the connection is closed)
+    bad_worker_proc = run_tcp_workers(coord.host, coord.port, sys.executable, token="wrong", max_idle_sec=5)[0]
+    proc_list = run_tcp_workers(coord.host, coord.port, sys.executable, coord.token, num_workers=2, max_idle_sec=5)
+    # --the bundle that kills its workers is reported as failed after 2 tries (i.e., both workers are gone)
+    kill_bundle = dict(bundle_list[0], scn_key="kill_worker", main_glm="kill_worker.py")
+    for cur_result in coord.run_bundles(bundle_list + [kill_bundle]):
+        if cur_result["scn_key"] == kill_bundle["scn_key"]:
+            assert cur_result["returncode"] == BUNDLE_FAILED_RC
+            print(cur_result["scn_key"], cur_result["error"])
+            continue
+        assert cur_result["returncode"] == 0
+        cur_dst_path = os.path.join(model_flr_path, "results", cur_result["scn_key"])
+        unpack_bytes(cur_result["out_tgz"], cur_dst_path)
+        with open(os.path.join(cur_dst_path, "out.csv")) as hf_csv:
+            print(cur_result["scn_key"], cur_result["host"], hf_csv.read().splitlines()[-1])
+    for cur_proc in proc_list:
+        cur_proc.wait()
+    bad_worker_proc.wait()
+
+    # --no worker is left: the sweep is aborted (instead of waiting forever)
+    rc_list = [x["returncode"] for x in coord.run_bundles(bundle_list)]
+    assert rc_list == [BUNDLE_FAILED_RC] * len(bundle_list)
+    coord.shutdown()
+
+    # --the bundle files cannot be written outside of the run folder
+    try:
+        run_bundle(base_tgz, dict(local_bundle_list[0], files={"../escaped.glm": ""}))
+    except ValueError as err:
+        print(err)
+    else:
+        raise AssertionError("A bundle file outside of the run folder is written!")
+
+    shutil.rmtree(model_flr_path)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Run GLD scenario bundles handed out by a TcpCoordinator")
+    arg_sub_parsers = arg_parser.add_subparsers(dest="cmd")
+
+    arg_worker_parser = arg_sub_parsers.add_parser("worker")
+    arg_worker_parser.add_argument("host")
+    arg_worker_parser.add_argument("port", type=int)
+    arg_worker_parser.add_argument("--gld-exe", default="gridlabd", help="the local GLD executable")
+    arg_worker_parser.add_argument("--token", default=None, help=f"the shared token (default: ${TOKEN_ENV_VAR})")
+    arg_worker_parser.add_argument("--num-workers", type=int, default=1)
+    arg_worker_parser.add_argument("--max-idle-sec", type=float, default=None)
+    arg_worker_parser.add_argument("--tmp-path", default=None)
+
+    args = arg_parser.parse_args()
+    if args.cmd == "worker":
+        if args.num_workers > 1:
+            run_proc_list = run_tcp_workers(
+                args.host, args.port, args.gld_exe, args.token, args.num_workers, args.max_idle_sec
+            )
+            for cur_proc in run_proc_list:
+                cur_proc.wait()
+        else:
+            try:
+                TcpWorker(args.host, args.port, args.gld_exe, args.token, args.tmp_path).serve(args.max_idle_sec)
+            except ConnectionError:
+                pass
+    else:
+        test_executors()
@@ -0,0 +1,309 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import datetime
+import os.path
+
+import numpy as np
+import pandas as pd
+
+# ==Constant
+PLAYER_TS_UNIT_SEC = "s"
+PLAYER_TS_UNIT_SUBSEC = "us"
+
+# relative timestamps (e.g., '+1s', '+15m', '+0.5') are offsets from the previous row
+PLAYER_REL_UNIT_DIC = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+class GldPlayer:
+    """Generate, write, and read the GLD player (.player) files with NumPy arrays"""
+
+    @staticmethod
+    def gen_player_arrays(
+        st_datetime_str,
+        num,
+        v0,
+        dv=1e-2,
+        dt_sec=1,
+        datetime_mask=r"%Y-%m-%d %H:%M:%S",
+        val_decimals=None,
+    ):
+        """Build the timestamp (datetime64) & value (float64) columns of a ramp player
+        """
+        # ==Time
+        # --sub-second steps are kept at the microsecond resolution
+        ts_unit = PLAYER_TS_UNIT_SEC if float(dt_sec).is_integer() else PLAYER_TS_UNIT_SUBSEC
+        t0 = np.datetime64(datetime.datetime.strptime(st_datetime_str, datetime_mask), ts_unit)
+        dt = np.timedelta64(int(round(dt_sec * (1 if ts_unit == "s" else 1e6))), ts_unit)
+
+        ite_arr = np.arange(num, dtype=np.int64)
+        ts_arr = t0 + ite_arr * dt
+
+        # ==Value
+        # --keeps the rounding rule of the original 'GldSmn.gen_player_str'
+        if val_decimals is None:
+            val_decimals = len(str(abs(dv)))
+        val_arr = np.round(v0 + ite_arr * dv, val_decimals)
+
+        return ts_arr, val_arr
+
+    @staticmethod
+    def fmt_ts_arr(ts_arr, tz="EST"):
+        """Format a datetime64 array as GLD timestamp strings (e.g., '2000-01-01 00:00:00 EST')
+        """
+        ts_str_arr = np.char.replace(np.datetime_as_string(ts_arr), "T", " ")
+
+        # --same as 'str(datetime)' in the original 'GldSmn.gen_player_str': no fraction on the whole seconds
+        if ts_arr.dtype != np.dtype("datetime64[s]"):
+            ts_str_arr = np.char.replace(ts_str_arr, ".000000", "")
+        if tz:
+            ts_str_arr = np.char.add(ts_str_arr, f" {tz}")
+        return ts_str_arr
+
+    @staticmethod
+    def fmt_val_arr(val_arr, val_fmt=None):
+        if val_fmt is None:
+            # --NumPy prints the shortest round-trip repr, same as 'str(float)'
+            return np.asarray(val_arr, dtype=float).astype(str)
+        return np.char.mod(val_fmt, val_arr)
+
+    @staticmethod
+    def fmt_player_rows(ts_arr, val_arr, tz="EST", val_fmt=None):
+        """Format the player columns into the rows of strings, e.g., '2000-01-01 00:00:00 EST,1.0'
+
+        By default ('val_fmt=None'), the values are written as 'str(float)' (e.g., '-1.0'), as the original
+        'GldSmn.gen_player_str' did; otherwise, with the given %-format (e.g., '%.10g').
+        """
+        rows_arr = GldPlayer.fmt_ts_arr(ts_arr, tz)
+
+        val_arr = np.asarray(val_arr)
+        if val_arr.ndim == 1:
+            val_arr = val_arr[:, np.newaxis]
+
+        for cur_ite in range(val_arr.shape[1]):
+            rows_arr = np.char.add(
+                np.char.add(rows_arr, ","), GldPlayer.fmt_val_arr(val_arr[:, cur_ite], val_fmt)
+            )
+        return rows_arr
+
+    @staticmethod
+    def write_player(file_pn, ts_arr, val_arr, tz="EST", val_fmt=None):
+        """Write the player columns with a single write call
+        """
+        rows_arr = GldPlayer.fmt_player_rows(ts_arr, val_arr, tz, val_fmt)
+
+        with open(file_pn, "w") as hf_player:
+            if len(rows_arr):
+                hf_player.write("\n".join(rows_arr.tolist()) + "\n")
+
+    @staticmethod
+    def gen_player_str(
+        st_datetime_str,
+        num,
+        v0,
+        dv=1e-2,
+        dt_sec=1,
+        tz="EST",
+        datetime_mask=r"%Y-%m-%d %H:%M:%S",
+        val_fmt=None,
+    ):
+        """Same as 'gen_player_arrays', but returns the contents of the player file as a string
+        """
+        ts_arr, val_arr = GldPlayer.gen_player_arrays(
+            st_datetime_str, num, v0, dv, dt_sec, datetime_mask
+        )
+        rows_arr = GldPlayer.fmt_player_rows(ts_arr, val_arr, tz, val_fmt)
+
+        if not len(rows_arr):
+            return ""
+        return "\n".join(rows_arr.tolist()) + "\n"
+
+    @staticmethod
+    def split_tz(ts_str_ser):
+        """Split the (optional) timezone suffix from the timestamp strings
+
+        Both the abbreviations (e.g., 'EST', 'PDT', 'UTC') and the numeric offsets (e.g., '+08:00')
+        are recognized. The timestamp itself is returned without the suffix.
+        """
+        re_tz_str = r"^\s*(?P<ts>.*?)(?:\s+(?P<tz>[A-Za-z]{1,5}[0-9]*[A-Za-z]{0,4}|[+-]\d{2}:?\d{2}))?\s*$"
+
+        # --fast path: a player file normally uses one suffix (or none) on every row
+        tz0_df = ts_str_ser.iloc[:1].str.extract(re_tz_str)
+        tz0 = tz0_df["tz"].iloc[0]
+        if isinstance(tz0, str):
+            tz_sfx_str = f" {tz0}"
+            if ts_str_ser.str.endswith(tz_sfx_str).all():
+                return (
+                    ts_str_ser.str.slice(0, -len(tz_sfx_str)).str.rstrip(),
+                    pd.Series(tz0, index=ts_str_ser.index),
+                )
+        elif not ts_str_ser.str.contains(r"[A-Za-z]|\d\s+[+-]\d", regex=True).any():
+            return ts_str_ser, pd.Series(np.nan, index=ts_str_ser.index, dtype=object)
+
+        # --mixed suffixes
+        tz_ext_df = ts_str_ser.str.extract(re_tz_str)
+        return tz_ext_df["ts"], tz_ext_df["tz"]
+
+    @staticmethod
+    def parse_rel_ts(rel_str_ser):
+        """Convert the relative timestamps (e.g., '+30s', '+1.5m') into the offsets in microseconds
+        """
+        rel_ext_df = rel_str_ser.str.extract(r"^\+\s*(?P<val>[\d.]+)\s*(?P<unit>[smhd]?)$")
+        if rel_ext_df["val"].isna().any():
+            raise ValueError("The relative timestamp(s) in the player file cannot be parsed!")
+
+        unit_sec_ser = rel_ext_df["unit"].map(PLAYER_REL_UNIT_DIC)
+        return np.round(rel_ext_df["val"].astype(float).to_numpy() * unit_sec_ser.to_numpy() * 1e6).astype(np.int64)
+
+    @staticmethod
+    def read_player(file_pn, loop=0, st_datetime_str=None):
+        """Read a player file into the timestamp (datetime64[us]) & value (float64) arrays
+
+        1) The comments (lines starting with '#') are ignored;
+        2) Relative timestamps (e.g., '+1s') are accumulated from the previous row. If the file starts with
+           a relative timestamp, 'st_datetime_str' is used as the reference;
+        3) The 'loop' property of the player object is applied by repeating the contents, see 'expand_loop'.
+
+        Returns the timestamps, the values (1-D for single-valued players, otherwise 2-D), and the list
+        of distinct timezone suffixes found in the file.
+        """
+        player_df = pd.read_csv(
+            file_pn,
+            header=None,
+            comment="#",
+            skipinitialspace=True,
+            dtype={0: str},
+        )
+        if player_df.empty:
+            return np.array([], dtype="datetime64[us]"), np.array([], dtype=float), []
+
+        # ==Time
+        ts_str_ser, tz_ser = GldPlayer.split_tz(player_df[0].str.strip())
+        tz_list = list(tz_ser.dropna().unique())
+
+        rel_mask = ts_str_ser.str.startswith("+").to_numpy()
+
+        ts_us_arr = np.zeros(len(ts_str_ser), dtype=np.int64)
+        if (~rel_mask).any():
+            ts_us_arr[~rel_mask] = (
+                pd.to_datetime(ts_str_ser[~rel_mask], format="ISO8601").to_numpy().astype("datetime64[us]").astype(np.int64)
+            )
+
+        if rel_mask.any():
+            rel_us_arr = np.zeros(len(ts_str_ser), dtype=np.int64)
+            rel_us_arr[rel_mask] = GldPlayer.parse_rel_ts(ts_str_ser[rel_mask])
+
+            # --the 1st row is resolved against the given reference
+            if rel_mask[0]:
+                if st_datetime_str is None:
+                    raise ValueError("The player file starts with a relative timestamp, but no reference is given!")
+                ts_us_arr[0] = (
+                    np.datetime64(pd.Timestamp(st_datetime_str).to_datetime64(), "us").astype(np.int64)
+                    + rel_us_arr[0]
+                )
+                rel_us_arr[0] = 0
+
+            # --each relative row = (the last absolute row) + (the cumulative offsets since then)
+            abs_mask = ~rel_mask
+            abs_mask[0] = True
+            last_abs_ind_arr = np.maximum.accumulate(np.where(abs_mask, np.arange(len(abs_mask)), 0))
+
+            rel_cum_arr = np.cumsum(rel_us_arr)
+            ts_us_arr = ts_us_arr[last_abs_ind_arr] + rel_cum_arr - rel_cum_arr[last_abs_ind_arr]
+
+        ts_arr = ts_us_arr.astype("datetime64[us]")
+
+        # ==Value
+        val_arr = player_df.iloc[:, 1:].to_numpy(dtype=float)
+        if val_arr.shape[1] == 1:
+            val_arr = val_arr[:, 0]
+
+        # ==Loop
+        if loop:
+            ts_arr, val_arr = GldPlayer.expand_loop(ts_arr, val_arr, loop)
+
+        return ts_arr, val_arr, tz_list
+
+    @staticmethod
+    def expand_loop(ts_arr, val_arr, loop):
+        """Repeat the player contents 'loop' more times (i.e., 'loop + 1' passes in total)
+
+        Each pass is shifted by the span of the file plus its last step, so the rows stay evenly spaced
+        across the pass boundaries.
+        """
+        if loop <= 0 or len(ts_arr) == 0:
+            return ts_arr, val_arr
+
+        if len(ts_arr) > 1:
+            period = (ts_arr[-1] - ts_arr[0]) + (ts_arr[-1] - ts_arr[-2])
+        else:
+            period = np.timedelta64(0, "us")
+        if period <= np.timedelta64(0, "us"):
+            raise ValueError("The player file cannot be looped without a positive time span!")
+
+        num_pass = loop + 1
+        shift_arr = np.repeat(np.arange(num_pass, dtype=np.int64), len(ts_arr)) * period
+
+        ts_lp_arr = np.tile(ts_arr, num_pass) + shift_arr
+        val_lp_arr = np.tile(val_arr, (num_pass,) + (1,) * (val_arr.ndim - 1))
+        return ts_lp_arr, val_lp_arr
+
+
+def test_gen_player():
+    import tempfile
+
+    player_pfn = os.path.join(tempfile.mkdtemp(prefix="gld_player_"), "inv_q_all.player")
+
+    ts_arr, val_arr = GldPlayer.gen_player_arrays("2019-07-29 12:00:00", 201, -1.0)
+    GldPlayer.write_player(player_pfn, ts_arr, val_arr)
+
+    ts_rd_arr, val_rd_arr, tz_list = GldPlayer.read_player(player_pfn)
+    print(tz_list, ts_rd_arr[[0, -1]], val_rd_arr[[0, -1]])
+
+    assert np.array_equal(ts_arr.astype("datetime64[us]"), ts_rd_arr)
+    assert np.allclose(val_arr, val_rd_arr)
+
+    # --the rows of the original 'GldSmn.gen_player_str'
+    player_str = GldPlayer.gen_player_str("2019-07-29 12:00:00", 3, -1.0)
+    assert player_str.splitlines() == [
+        "2019-07-29 12:00:00 EST,-1.0",
+        "2019-07-29 12:00:01 EST,-0.99",
+        "2019-07-29 12:00:02 EST,-0.98",
+    ]
+    player_str = GldPlayer.gen_player_str("2000-01-01 00:00:00", 3, 1.0, dt_sec=0.5)
+    assert player_str.splitlines()[:2] == ["2000-01-01 00:00:00 EST,1.0", "2000-01-01 00:00:00.500000 EST,1.01"]
+
+
+def test_read_player_loop():
+    player_pfn = "loop_test.player"
+    with open(player_pfn, "w") as hf_player:
+        hf_player.write("# relative timestamps\n2000-01-01 00:00:00 EST,1.0\n+1m,2.0\n+1m,3.0\n")
+
+    ts_arr, val_arr, _ = GldPlayer.read_player(player_pfn, loop=2)
+    print(np.datetime_as_string(ts_arr), val_arr)
+
+    assert len(ts_arr) == 9
+    assert np.all(np.diff(ts_arr) == np.timedelta64(60, "s"))
+
+    os.remove(player_pfn)
+
+
+def test_large_player():
+    import tempfile
+    import time
+
+    st_time = time.time()
+    ts_arr, val_arr = GldPlayer.gen_player_arrays(
+        "2000-01-01 00:00:00", 600003, -1.0, dt_sec=40e-6
+    )
+    GldPlayer.write_player(os.path.join(tempfile.mkdtemp(prefix="gld_player_"), "luan.player"), ts_arr, val_arr)
+    print(f"Time elapsed: {time.time() - st_time} (secs)")
+
+
+if __name__ == "__main__":
+    test_gen_player()
+    test_read_player_loop()
+    # test_large_player()
@@ -0,0 +1,285 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import collections
+import os.path
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+# ==Constant
+# --gridlabd '--verbose' & '--profile' outputs
+RE_GLD_STATS_DIC = {
+    "num_objects": r"Total objects\s*[.:]*\s*([\d,]+)",
+    "gld_total_sec": r"Total time\s*[.:]*\s*([\d.]+)\s*s",
+    "gld_core_sec": r"Core time\s*[.:]*\s*([\d.]+)\s*s",
+    "gld_model_sec": r"Model time\s*[.:]*\s*([\d.]+)\s*s",
+    "gld_sim_rate": r"Simulation rate\s*[.:]*\s*([\d.]+)",
+}
+RE_GLD_ITE_LIST = [
+    r"(\d+)\s+iterations?",
+    r"iterations?\s*(?:count)?\s*[=:]\s*(\d+)",
+]
+RE_GLD_NOT_CONV = r"(?:did not|failed to|unable to)\s+converge"
+RE_GLD_LOAD_DONE = r"(?:model|file)\b.*\bloaded|load(?:ing)? (?:complete|done)|starting simulation|initializing objects"
+# --the number of the last output lines kept by 'run_instrumented' (e.g., for the error reports)
+RUN_OUT_TAIL_LINES = 200
+
+RUN_STATS_COL_LIST = [
+    "scn_key",
+    "st_time",
+    "wall_sec",
+    "first_output_sec",
+    "load_sec",
+    "user_cpu_sec",
+    "sys_cpu_sec",
+    "max_rss_kb",
+    "returncode",
+    "out_bytes",
+    "num_out_files",
+    "num_objects",
+    "num_not_conv",
+    "num_ite_msgs",
+    "sum_ite",
+    "max_ite",
+    "gld_total_sec",
+    "gld_core_sec",
+    "gld_model_sec",
+    "gld_sim_rate",
+    "host",
+]
+
+
+def init_gld_stats():
+    """The initial convergence & iteration statistics (see 'parse_gld_line')
+    """
+    return {
+        "num_not_conv": 0,
+        "num_ite_msgs": 0,
+        "sum_ite": 0,
+        "max_ite": 0,
+        "load_sec": None,
+    }
+
+
+def parse_gld_line(stats_dic, cur_sec, cur_line):
+    """Update the convergence & iteration statistics (and the profiler results) with one gridlabd output line
+
+    'cur_sec' is the arrival time of the line since the process start.
+    """
+    if re.search(RE_GLD_NOT_CONV, cur_line, flags=re.IGNORECASE):
+        stats_dic["num_not_conv"] += 1
+
+    for cur_re in RE_GLD_ITE_LIST:
+        cur_m = re.search(cur_re, cur_line, flags=re.IGNORECASE)
+        if cur_m:
+            cur_ite = int(cur_m.group(1))
+            stats_dic["num_ite_msgs"] += 1
+            stats_dic["sum_ite"] += cur_ite
+            stats_dic["max_ite"] = max(stats_dic["max_ite"], cur_ite)
+            break
+
+    # --the model load phase ends at the last 'loaded' message before the simulation starts
+    if re.search(RE_GLD_LOAD_DONE, cur_line, flags=re.IGNORECASE):
+        stats_dic["load_sec"] = cur_sec
+
+    for cur_key, cur_re in RE_GLD_STATS_DIC.items():
+        cur_m = re.search(cur_re, cur_line)
+        if cur_m:
+            stats_dic[cur_key] = float(cur_m.group(1).replace(",", ""))
+
+
+def parse_gld_output(out_line_list):
+    """Extract the convergence & iteration statistics (and the profiler results) from the gridlabd outputs
+
+    'out_line_list' holds the (arrival time since the process start, line) pairs.
+    """
+    stats_dic = init_gld_stats()
+    for cur_sec, cur_line in out_line_list:
+        parse_gld_line(stats_dic, cur_sec, cur_line)
+    return stats_dic
+
+
+def get_out_size(flr_path, suff_str=".csv", st_time=None):
+    """Total size & number of the output files (modified after 'st_time', if given) in a folder
+    """
+    out_bytes = 0
+    num_out_files = 0
+    if not flr_path or not os.path.isdir(flr_path):
+        return out_bytes, num_out_files
+
+    for root, _, files in os.walk(flr_path):
+        for cur_fn in files:
+            if not cur_fn.endswith(suff_str):
+                continue
+            cur_stat = os.stat(os.path.join(root, cur_fn))
+            if st_time is not None and cur_stat.st_mtime < st_time:
+                continue
+            out_bytes += cur_stat.st_size
+            num_out_files += 1
+    return out_bytes, num_out_files
+
+
+def run_instrumented(cmd_list, cwd=None, shell=False, echo_flag=True, tail_num=RUN_OUT_TAIL_LINES):
+    """Run a command & record its wall time, CPU time, peak RSS, and outputs
+
+    The stdout & stderr are drained by the threads while the process runs, so each line is tagged with
+    its arrival time and parsed as it arrives; only the last 'tail_num' lines are kept (and returned). On POSIX,
+    the process is reaped by 'os.wait4', which gives the resource usage (the same fields as 'resource.getrusage')
+    of that child only. 'os.wait4' is not available on Windows, where the CPU time & peak RSS are not recorded.
+    """
+    out_tail_deque = collections.deque(maxlen=tail_num)
+    out_stats_dic = init_gld_stats()
+    first_output_sec = None
+    out_lock = threading.Lock()
+
+    st_time = time.time()
+    st_perf = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd_list,
+        cwd=cwd,
+        shell=shell,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+
+    def drain(hf_pipe, hf_echo):
+        nonlocal first_output_sec
+        for cur_line in hf_pipe:
+            cur_line = cur_line.rstrip("\n")
+            with out_lock:
+                cur_sec = time.perf_counter() - st_perf
+                if first_output_sec is None:
+                    first_output_sec = cur_sec
+                parse_gld_line(out_stats_dic, cur_sec, cur_line)
+                out_tail_deque.append(cur_line)
+            if echo_flag:
+                hf_echo.write(cur_line + "\n")
+        hf_pipe.close()
+
+    thread_list = [
+        threading.Thread(target=drain, args=(proc.stdout, sys.stdout), daemon=True),
+        threading.Thread(target=drain, args=(proc.stderr, sys.stderr), daemon=True),
+    ]
+    for cur_thread in thread_list:
+        cur_thread.start()
+
+    user_cpu_sec = sys_cpu_sec = max_rss_kb = None
+    if hasattr(os, "wait4"):
+        _, status, rusage = os.wait4(proc.pid, 0)
+        returncode = os.waitstatus_to_exitcode(status)
+        proc.returncode = returncode
+
+        user_cpu_sec = rusage.ru_utime
+        sys_cpu_sec = rusage.ru_stime
+        # ~~kilobytes on Linux, bytes on macOS
+        max_rss_kb = rusage.ru_maxrss / 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    else:
+        returncode = proc.wait()
+
+    wall_sec = time.perf_counter() - st_perf
+    for cur_thread in thread_list:
+        cur_thread.join()
+
+    stats_dic = {
+        "st_time": st_time,
+        "wall_sec": wall_sec,
+        "first_output_sec": first_output_sec,
+        "user_cpu_sec": user_cpu_sec,
+        "sys_cpu_sec": sys_cpu_sec,
+        "max_rss_kb": max_rss_kb,
+        "returncode": returncode,
+    }
+    stats_dic.update(out_stats_dic)
+
+    return stats_dic, list(out_tail_deque)
+
+
+class RunStatsLog:
+    """Keep the per-run statistics in a SQLite table ('run_stats')"""
+
+    def __init__(self, db_pfn):
+        self.db_pfn = db_pfn
+
+        self.conn = sqlite3.connect(db_pfn, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_stats ("
+            "run_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            + ", ".join([f"{x} {'TEXT' if x in ('scn_key', 'host') else 'REAL'}" for x in RUN_STATS_COL_LIST])
+            + ")"
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def add_record(self, stats_dic):
+        col_list = [x for x in RUN_STATS_COL_LIST if x in stats_dic]
+        self.conn.execute(
+            f"INSERT INTO run_stats ({', '.join(col_list)}) VALUES ({', '.join(['?'] * len(col_list))})",
+            [stats_dic[x] for x in col_list],
+        )
+        self.conn.commit()
+
+    def get_slowest(self, num=10):
+        cur = self.conn.execute(
+            "SELECT scn_key, wall_sec, user_cpu_sec, sys_cpu_sec, max_rss_kb, out_bytes, num_not_conv, max_ite "
+            "FROM run_stats ORDER BY wall_sec DESC LIMIT ?",
+            (num,),
+        )
+        return [dict(zip([x[0] for x in cur.description], row)) for row in cur.fetchall()]
+
+    def disp_summary(self):
+        cur = self.conn.execute(
+            "SELECT COUNT(*), SUM(wall_sec), AVG(wall_sec), MAX(wall_sec), "
+            "SUM(user_cpu_sec + sys_cpu_sec), MAX(max_rss_kb), SUM(out_bytes), SUM(num_not_conv) FROM run_stats"
+        )
+        num, sum_wall, avg_wall, max_wall, sum_cpu, max_rss, sum_out, sum_not_conv = cur.fetchone()
+        print(
+            f"Runs: {num}, wall time: {sum_wall} (secs) in total, {avg_wall} (secs) on average, {max_wall} (secs) at most; "
+            f"CPU time: {sum_cpu} (secs); peak RSS: {max_rss} (KB); outputs: {sum_out} (bytes); "
+            f"non-converged messages: {sum_not_conv}"
+        )
+
+
+def test_run_instrumented():
+    db_pfn = "test_run_stats.sqlite"
+    if os.path.exists(db_pfn):
+        os.remove(db_pfn)
+
+    cmd_list = [
+        sys.executable,
+        "-c",
+        "import time; print('Model loaded'); x = bytearray(50 * 2**20); time.sleep(0.2); "
+        "print('NR: 5 iterations'); print('Newton-Raphson did not converge')",
+    ]
+    stats_dic, _ = run_instrumented(cmd_list, echo_flag=False)
+    stats_dic["scn_key"] = "demo"
+    print(stats_dic)
+
+    # ==A long output: all the lines are parsed, the last ones are kept
+    cmd_list = [sys.executable, "-c", "for i in range(100000): print(f'NR: {i % 7 + 1} iterations')"]
+    cur_stats_dic, out_tail_list = run_instrumented(cmd_list, echo_flag=False, tail_num=10)
+    assert cur_stats_dic["num_ite_msgs"] == 100000 and cur_stats_dic["max_ite"] == 7
+    assert len(out_tail_list) == 10 and out_tail_list[-1] == f"NR: {99999 % 7 + 1} iterations"
+
+    stats_log = RunStatsLog(db_pfn)
+    stats_log.add_record(stats_dic)
+    stats_log.disp_summary()
+    print(stats_log.get_slowest())
+    stats_log.close()
+
+    os.remove(db_pfn)
+
+
+if __name__ == "__main__":
+    test_run_instrumented()
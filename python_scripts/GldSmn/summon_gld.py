@@ -1,23 +1,33 @@
 # ***************************************
 # Author: Jing Xie
 # Created Date: 2020-4-13
-# Updated Date: 2020-8-5
+# Updated Date: 2026-10-19
 # Email: jing.xie@pnnl.gov
 # ***************************************
 
 import os.path
+import re
 import subprocess
 import shutil
 import pathlib
-import datetime
 import time
 
 # @TODO: It is not good to modify the path. Two options (the 2nd one is better): 1) __init__.py; 2) package, then install via pip
 import sys
 
+import numpy as np
+import pandas as pd
+
 sys.path.append("../GlmParser")
+sys.path.append("../CsvExtractor")
 
-from parse_glm import GlmParser
+from parse_glm import GlmParser, REC_CLS_LIST
+from recorder_io import RecorderReader
+from player_io import GldPlayer
+from sweep_manifest import SweepManifest
+from sweep_planner import AdaptiveQPlanner
+import gld_executor
+from run_stats import RunStatsLog, get_out_size, run_instrumented
 
 
 class GldSmn:
@@ -56,17 +66,52 @@ class GldSmn:
         datetime_mask=r"%Y-%m-%d %H:%M:%S",
     ):
         # @TODO: use pytz for timezone information
-        t0 = datetime.datetime.strptime(st_datetime_str, datetime_mask)
-
-        player_str = ''
-        for cur_ite in range(num):
-            cur_t = t0 + datetime.timedelta(0, cur_ite * dt_sec)
-            #print(cur_t)
-            cur_t_str = f"{cur_t.strftime(datetime_mask)} {tz}"
-            #print(cur_t_str)
-            cur_val = round(v0 + cur_ite*dv, len(str(abs(dv))))
-            player_str += f"{cur_t} {tz},{cur_val}\n"
-        return player_str
+        return GldPlayer.gen_player_str(
+            st_datetime_str, num, v0, dv, dt_sec, tz, datetime_mask
+        )
+
+    @staticmethod
+    def gen_player_file(
+        file_pn,
+        st_datetime_str,
+        num,
+        v0,
+        dv=1e-2,
+        dt_sec=1,
+        tz="EST",
+        datetime_mask=r"%Y-%m-%d %H:%M:%S",
+    ):
+        """Generate & write a player file without building the whole string in between
+        """
+        if os.path.exists(file_pn):
+            os.remove(file_pn)
+            print("The old '{}' file is deleted!".format(file_pn))
+
+        ts_arr, val_arr = GldPlayer.gen_player_arrays(
+            st_datetime_str, num, v0, dv, dt_sec, datetime_mask
+        )
+        GldPlayer.write_player(file_pn, ts_arr, val_arr, tz)
+        print("The new '{}' file is created!".format(file_pn))
+
+    @staticmethod
+    def gen_mr_str(mr_file_fn, mr_prop_str, mr_interval=1):
+        return (
+            f"//==Multi-Recorder\n"
+            f"object multi_recorder {{\n"
+            f"\tinterval {mr_interval};\n"
+            f"\tproperty {mr_prop_str};\n"
+            f"\tfile {mr_file_fn};\n"
+            f"}}\n"
+        )
+
+    @staticmethod
+    def read_mr_volt_mag(mr_pfn):
+        """Voltage magnitudes (of the 'voltage' columns) at the last timestamp of a multi-recorder file
+        """
+        rr = RecorderReader(mr_pfn)
+        volt_col_list = [x for x in rr.col_list if "voltage" in x]
+        rec_df = rr.read(volt_col_list)
+        return np.abs(rec_df[volt_col_list].iloc[-1].to_numpy(dtype=complex))
 
     def __init__(
         self,
@@ -77,6 +122,8 @@ class GldSmn:
         stor_csv_path,
         gld_exe_fn=r"gridlabd.exe",
         gld_csv_suff=r".csv",
+        direct_output_flag=True,
+        move_leftover_flag=None,
     ):
         """Init the settings
         """
@@ -93,15 +140,77 @@ class GldSmn:
         self.gld_csv_suff = gld_csv_suff
         self.stor_csv_path = stor_csv_path
 
+        # ==Output
+        # --write the recorder files directly into the results folder (see 'render_rec_files')
+        self.direct_output_flag = direct_output_flag
+        # --look for the leftover files after each run, e.g., from the recorders in the main or an included glm (by
+        # default, only if there are such recorders, since walking the GLD output folder per run is what the
+        # redirection avoids; see 'has_other_recs')
+        self.move_leftover_flag = move_leftover_flag
+
+        # ==Sweep manifest (see 'prep_manifest')
+        self.manifest = None
+
+        # ==Executor (see 'prep_executor'); the runs are local & sequential if not given
+        self.executor = None
+        self.executor_bundle_list = []
+        self.executor_scn_dict = {}
+
+        # ==Per-run statistics (see 'prep_run_stats')
+        self.run_stats_log = None
+        self.gld_opt_list = []
+        self.cur_scn_key = None
+        self.cur_run_stats = None
+
         # ==Preprocess
         self.glm_pfn = os.path.join(glm_path, glm_fn)
 
-    def run_gld(self, arg_shell=True):
+    def run_gld(self, arg_shell=None):
         """Run the gld
+
+        The argv list goes through the shell on Windows only (by default); on POSIX, 'shell=True' with a list
+        would run the executable without its arguments.
         """
-        subprocess.run(
-            [self.gld_exe_fn, self.glm_pfn], cwd=self.gld_path, shell=arg_shell
+        if arg_shell is None:
+            arg_shell = os.name == "nt"
+
+        if self.run_stats_log is not None:
+            self.cur_run_stats, _ = run_instrumented(
+                [self.gld_exe_fn] + self.gld_opt_list + [self.glm_pfn],
+                cwd=self.gld_path,
+                shell=arg_shell,
+            )
+            return self.cur_run_stats["returncode"]
+
+        cp = subprocess.run(
+            [self.gld_exe_fn] + self.gld_opt_list + [self.glm_pfn], cwd=self.gld_path, shell=arg_shell
+        )
+        return cp.returncode
+
+    def prep_run_stats(self, run_stats_pfn="", verbose_flag=True):
+        """Record the wall time, CPU time, peak RSS, output size, and solver statistics of each run
+        """
+        if not run_stats_pfn:
+            run_stats_pfn = os.path.join(self.stor_csv_path, "run_stats.sqlite")
+        pathlib.Path(run_stats_pfn).parent.mkdir(parents=True, exist_ok=True)
+        self.run_stats_log = RunStatsLog(run_stats_pfn)
+
+        # --the convergence & iteration messages, and the profiler results
+        if verbose_flag:
+            self.gld_opt_list = ["--verbose", "--profile"]
+
+    def log_run_stats(self, results_flr_pfn):
+        if self.run_stats_log is None or self.cur_run_stats is None:
+            return
+
+        out_bytes, num_out_files = get_out_size(
+            results_flr_pfn, self.gld_csv_suff, self.cur_run_stats["st_time"]
+        )
+        self.cur_run_stats.update(
+            {"scn_key": self.cur_scn_key, "out_bytes": out_bytes, "num_out_files": num_out_files}
         )
+        self.run_stats_log.add_record(self.cur_run_stats)
+        self.cur_run_stats = None
 
     def prep_rslts_flr(self, dst_flr_path):
         if os.path.exists(dst_flr_path):
@@ -121,10 +230,24 @@ class GldSmn:
             except Exception as e:
                 print("Failed to delete %s. Reason: %s" % (file_path, e))
 
+    @staticmethod
+    def move_file(src_pfn, dst_pfn):
+        """Rename the file when both paths are on the same filesystem, otherwise copy & delete
+        """
+        try:
+            os.replace(src_pfn, dst_pfn)
+        except OSError:
+            shutil.move(src_pfn, dst_pfn)
+
     def move_rslts_files(self, dst_flr_path):
         """Move files
         """
-        for root, _, files in os.walk(self.gld_csv_path):
+        skip_path_set = {os.path.abspath(dst_flr_path), os.path.abspath(self.stor_csv_path)}
+        for root, dirs, files in os.walk(self.gld_csv_path):
+            # --skip the results folder(s), if placed under the GLD output folder
+            dirs[:] = [
+                x for x in dirs if os.path.abspath(os.path.join(root, x)) not in skip_path_set
+            ]
             for cur_fn in files:
                 if cur_fn.endswith(self.gld_csv_suff):
                     src_pfn = os.path.join(root, cur_fn)
@@ -133,7 +256,58 @@ class GldSmn:
                     pathlib.Path(cur_dst_path).mkdir(parents=True, exist_ok=True)
                     cur_dst_pfn = os.path.join(cur_dst_path, cur_fn)
 
-                    shutil.move(src_pfn, cur_dst_pfn)
+                    GldSmn.move_file(src_pfn, cur_dst_pfn)
+
+    def render_rec_files(self, glm_str, dst_flr_path):
+        """Point the recorder/multi_recorder files in the rendered glm string to the results folder
+        """
+        if not self.direct_output_flag:
+            return glm_str
+
+        glm_mod_str, _ = self.gp.redirect_rec_files(glm_str, dst_flr_path)
+        return glm_mod_str
+
+    def has_other_recs(self):
+        """Whether a glm loaded by the run, other than the rendered inverter glm (i.e., the main glm & its '#include'
+        files), has a recorder-type object, whose file is written into the GLD output folder
+        """
+        re_rec_obj = re.compile(r"\bobject\s+(?:{})\b".format("|".join(REC_CLS_LIST)))
+        re_include = re.compile(r"^\s*#include\s+(.*)$", re.MULTILINE)
+
+        inv_glm_abs_pfn = os.path.abspath(self.inv_glm_dst_pfn)
+        seen_set = set()
+        todo_list = [os.path.abspath(self.glm_pfn)]
+        while todo_list:
+            cur_pfn = todo_list.pop()
+            if cur_pfn in seen_set or cur_pfn == inv_glm_abs_pfn or not os.path.isfile(cur_pfn):
+                continue
+            seen_set.add(cur_pfn)
+
+            with open(cur_pfn, "r") as hf_glm:
+                cur_str = self.gp.del_cmts(hf_glm.read() + "\n")
+            if re_rec_obj.search(cur_str):
+                return True
+
+            # --the included files are looked up under the GLD folder, then next to the including file
+            for cur_inc_fn in re_include.findall(cur_str):
+                cur_inc_fn = cur_inc_fn.strip().strip('"<>')
+                for cur_flr_path in [self.gld_path, os.path.dirname(cur_pfn)]:
+                    cur_inc_pfn = os.path.abspath(os.path.join(cur_flr_path, cur_inc_fn))
+                    if os.path.isfile(cur_inc_pfn):
+                        todo_list.append(cur_inc_pfn)
+                        break
+        return False
+
+    def collect_leftover_files(self, dst_flr_path):
+        """Move the result files that are not written to the results folder directly
+        """
+        if self.move_leftover_flag is None:
+            self.move_leftover_flag = self.has_other_recs()
+            if self.move_leftover_flag:
+                print("The main glm (or an included one) has recorders, whose files are moved after each run")
+
+        if self.move_leftover_flag:
+            self.move_rslts_files(dst_flr_path)
 
     def move_csv_files(self, dst_flr_path=""):
         """Save the result file(s) into a single folder
@@ -188,6 +362,145 @@ class GldSmn:
         # ==Init GlmParser
         self.gp = GlmParser()
 
+    def prep_manifest(self, manifest_pfn=""):
+        """Record the finished scenarios in a SQLite file, so a restarted sweep skips them
+        """
+        if not manifest_pfn:
+            manifest_pfn = os.path.join(self.stor_csv_path, "sweep_manifest.sqlite")
+        pathlib.Path(manifest_pfn).parent.mkdir(parents=True, exist_ok=True)
+        self.manifest = SweepManifest(manifest_pfn)
+
+    def pack_model(self):
+        """Pack the model folder (without the result files) for the executor
+        """
+        return gld_executor.pack_folder(
+            self.gld_path,
+            excl_suff_list=[self.gld_csv_suff],
+            excl_path_list=[self.stor_csv_path],
+        )
+
+    def prep_executor(self, executor_cls=gld_executor.LocalPoolExecutor, **executor_kwargs):
+        """Run the scenarios through an executor (e.g., a local process pool or a TCP work queue)
+        """
+        self.executor = executor_cls(self.pack_model(), **executor_kwargs)
+        self.executor_bundle_list = []
+        self.executor_scn_dict = {}
+
+    def get_bundle_rel_pfn(self, pfn):
+        """The path of a file in a scenario bundle: relative to the model folder, or the base name if the file is
+        outside of it
+        """
+        try:
+            rel_pfn = os.path.relpath(pfn, self.gld_path)
+        except ValueError:
+            # ~~e.g., on another drive
+            rel_pfn = os.pardir
+        if rel_pfn == os.pardir or rel_pfn.startswith(os.pardir + os.sep):
+            return os.path.basename(pfn)
+        return rel_pfn
+
+    def queue_scn(self, scn_key, glm_str, results_flr_pfn, clean_flag):
+        """Queue a scenario bundle for the executor
+        """
+        self.executor_bundle_list.append(
+            {
+                "scn_key": scn_key,
+                "files": {self.get_bundle_rel_pfn(self.inv_glm_dst_pfn): glm_str},
+                "main_glm": self.get_bundle_rel_pfn(self.glm_pfn),
+                "gld_exe": self.gld_exe_fn,
+                "out_suff": self.gld_csv_suff,
+                "gld_opts": self.gld_opt_list,
+            }
+        )
+        self.executor_scn_dict[scn_key] = (results_flr_pfn, clean_flag)
+
+    def run_executor(self):
+        """Run the queued scenario bundles & unpack the results into the results folders
+        """
+        if self.executor is None or not self.executor_bundle_list:
+            return
+
+        for cur_result in self.executor.run_bundles(self.executor_bundle_list):
+            scn_key = cur_result["scn_key"]
+            results_flr_pfn, clean_flag = self.executor_scn_dict[scn_key]
+
+            if clean_flag:
+                self.prep_rslts_flr(results_flr_pfn)
+            # --a bundle that could not be run has no outputs & no statistics
+            if cur_result["out_tgz"]:
+                gld_executor.unpack_bytes(cur_result["out_tgz"], results_flr_pfn)
+
+            if self.run_stats_log is not None and cur_result["stats"] is not None:
+                self.run_stats_log.add_record(cur_result["stats"])
+
+            if cur_result["returncode"]:
+                err_msg = cur_result.get("error") or f"GLD exited with the code {cur_result['returncode']}"
+                print(f"Scenario '{scn_key}' failed: {err_msg}")
+                if self.manifest is not None:
+                    self.manifest.mark_failed(scn_key, err_msg)
+            elif self.manifest is not None:
+                self.manifest.mark_done(scn_key)
+
+        self.executor_bundle_list = []
+        self.executor_scn_dict = {}
+
+    def get_scn_inputs_hash(self, glm_str):
+        """Hash the inputs of a scenario: the rendered glm, the main glm, and the player file (if any)
+        """
+        input_list = [glm_str, self.glm_pfn, self.gld_exe_fn]
+        if hasattr(self, "player_file_str"):
+            player_pfn = os.path.join(self.gld_path, self.player_file_str)
+            if os.path.exists(player_pfn):
+                player_stat = os.stat(player_pfn)
+                input_list += [player_pfn, player_stat.st_size, player_stat.st_mtime]
+        return SweepManifest.hash_inputs(*input_list)
+
+    def run_scn(self, scn_key, inv_nm, q_pu, glm_str, results_flr_pfn, output_pfn, clean_flag):
+        """Export the glm, run GLD, and save the results of one scenario
+        """
+        # --skip the finished scenario
+        if self.manifest is not None:
+            inputs_hash = self.get_scn_inputs_hash(glm_str)
+            if self.manifest.is_done(scn_key, inputs_hash):
+                print(f"Scenario '{scn_key}' is done already (skipped)!")
+                return
+            self.manifest.mark_running(scn_key, inv_nm, q_pu, inputs_hash, output_pfn)
+
+        # --the outputs are collected by the executor, so the recorder files are not redirected
+        if self.executor is not None:
+            self.queue_scn(scn_key, glm_str, results_flr_pfn, clean_flag)
+            return
+
+        self.cur_scn_key = scn_key
+        try:
+            if self.direct_output_flag:
+                if clean_flag:
+                    self.prep_rslts_flr(results_flr_pfn)
+                glm_str = self.render_rec_files(glm_str, results_flr_pfn)
+
+            self.gp.export_glm(self.inv_glm_dst_pfn, glm_str)
+            gld_rc = self.run_gld()
+
+            if self.direct_output_flag:
+                self.collect_leftover_files(results_flr_pfn)
+            elif clean_flag:
+                self.save_results(results_flr_pfn)
+            else:
+                self.move_csv_files(results_flr_pfn)
+
+            self.log_run_stats(results_flr_pfn)
+
+            if gld_rc:
+                raise RuntimeError(f"GLD exited with the code {gld_rc}")
+        except Exception as err:
+            if self.manifest is None:
+                raise
+            print(f"Scenario '{scn_key}' failed: {err}")
+            self.manifest.mark_failed(scn_key, str(err))
+        else:
+            if self.manifest is not None:
+                self.manifest.mark_done(scn_key)
+
     def prep_run_inv_qlist(self, inv_q_list):
         self.inv_q_list = inv_q_list
 
@@ -195,6 +508,16 @@ class GldSmn:
         self.player_file_str = player_file_str
         self.player_nm_str = player_nm_str
 
+    def prep_run_inv_qadapt(self, resp_func=None, **planner_kwargs):
+        """Sweep the Q of each inverter adaptively (see 'AdaptiveQPlanner')
+
+        'resp_func' maps the multi-recorder file of a run to its response (a 1-D array); by default, the
+        voltage magnitudes at the last timestamp (see 'read_mr_volt_mag').
+        """
+        self.qadapt_resp_func = resp_func if resp_func is not None else GldSmn.read_mr_volt_mag
+        self.qadapt_planner_kwargs = planner_kwargs
+        self.qadapt_planner_dict = {}
+
     def prep_multi_recorder(self, mr_prop_str, mr_interval=1, mr_file_suff=".csv"):
         self.mr_prop_str = mr_prop_str
         self.mr_interval = mr_interval
@@ -211,14 +534,7 @@ class GldSmn:
         mr_interval = self.mr_interval
 
         # --create a multi-recorder
-        glm_obj_mr_str = (
-            f"//==Multi-Recorder\n"
-            f"object multi_recorder {{\n"
-            f"\tinterval {mr_interval};\n"
-            f"\tproperty {mr_prop_str};\n"
-            f"\tfile {mr_file_fn};\n"
-            f"}}\n"
-        )
+        glm_obj_mr_str = GldSmn.gen_mr_str(mr_file_fn, mr_prop_str, mr_interval)
 
         # --create a player
         glm_obj_player_class_str = """
@@ -258,17 +574,40 @@ class player {
         # --insert the multi-recorder & player into the target glm file
         cur_inv_glm_str = glm_obj_mr_str + glm_obj_player_str + cur_q_inv_glm_str
 
-        # --export glm, run GLD, and save csv files
-        self.gp.export_glm(self.inv_glm_dst_pfn, cur_inv_glm_str)
-        self.run_gld()
-
         # ~~put under individual folders
         # cur_results_flr_name = f"{cur_inv_nm}"
         # cur_results_flr_pfn = os.path.join(self.stor_csv_path, cur_results_flr_name)
         # ~~put under one folder
         cur_results_flr_pfn = self.stor_csv_path
 
-        self.move_csv_files(cur_results_flr_pfn)
+        # --export glm, run GLD, and save csv files
+        self.run_scn(
+            SweepManifest.get_scn_key(cur_inv_nm),
+            cur_inv_nm,
+            None,
+            cur_inv_glm_str,
+            cur_results_flr_pfn,
+            os.path.join(cur_results_flr_pfn, mr_file_fn),
+            clean_flag=False,
+        )
+
+    def render_inv_q_glm(self, cur_q_pu, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str):
+        """Set the Q_Out of the selected inverter to a given value (p.u. of its rated power)
+        """
+        # --get inv rated power
+        cur_inv_rp_list = self.gp.extract_attr("rated_power", cur_inv_glm_lines_str)
+
+        assert len(cur_inv_rp_list) == 1
+        cur_inv_rp = float(cur_inv_rp_list[0])
+
+        # --update Q_Out
+        cur_q_var = cur_q_pu * cur_inv_rp
+        cur_inv_glm_lines_mod_str = self.gp.modify_attr(
+            "Q_Out", str(cur_q_var), cur_inv_glm_lines_str
+        )
+
+        # --replace the obj portion in the source string
+        return self.gp.replace_obj(cur_inv_re_tpl, igs_str, cur_inv_glm_lines_mod_str)
 
     def run_inv_qlist(self, cur_inv_nm, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str):
         # --data sanity check
@@ -276,37 +615,90 @@ class player {
 
         # --run gld for each q value
         for cur_q_pu in self.inv_q_list:
-            # --get inv rated power
-            cur_inv_rp_list = self.gp.extract_attr("rated_power", cur_inv_glm_lines_str)
-
-            assert len(cur_inv_rp_list) == 1
-            cur_inv_rp = float(cur_inv_rp_list[0])
-
-            # --update Q_Out
-            cur_q_var = cur_q_pu * cur_inv_rp
-            cur_inv_glm_lines_mod_str = self.gp.modify_attr(
-                "Q_Out", str(cur_q_var), cur_inv_glm_lines_str
-            )
-
-            # --replace the obj portion in the source string
-            cur_q_inv_glm_str = self.gp.replace_obj(
-                cur_inv_re_tpl, igs_str, cur_inv_glm_lines_mod_str
+            cur_q_inv_glm_str = self.render_inv_q_glm(
+                cur_q_pu, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str
             )
 
             # --export glm, run GLD, and save csv files
-            self.gp.export_glm(self.inv_glm_dst_pfn, cur_q_inv_glm_str)
-            self.run_gld()
             cur_results_flr_name = f"{cur_inv_nm}_{cur_q_pu}"
             cur_results_flr_pfn = os.path.join(self.stor_csv_path, cur_results_flr_name)
-            self.save_results(cur_results_flr_pfn)
 
-    def run_inv(self, run_player_mode=True):
+            self.run_scn(
+                SweepManifest.get_scn_key(cur_inv_nm, cur_q_pu),
+                cur_inv_nm,
+                cur_q_pu,
+                cur_q_inv_glm_str,
+                cur_results_flr_pfn,
+                cur_results_flr_pfn,
+                clean_flag=True,
+            )
+
+    def run_inv_qadapt(self, cur_inv_nm, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str):
+        """Run the Q points planned by 'AdaptiveQPlanner' round by round, until no interval needs refining
+        """
+        # --params (multi-recorder)
+        mr_file_fn = f"{cur_inv_nm}{self.mr_file_suff}"
+        mr_prop_str = f"{cur_inv_nm}:{self.mr_prop_str}"
+        glm_obj_mr_str = GldSmn.gen_mr_str(mr_file_fn, mr_prop_str, self.mr_interval)
+
+        planner = AdaptiveQPlanner(**self.qadapt_planner_kwargs)
+        self.qadapt_planner_dict[cur_inv_nm] = planner
+
+        while True:
+            batch_list = planner.next_batch()
+            if not batch_list:
+                break
+
+            # --the points of a round are queued together when an executor is used
+            mr_pfn_list = []
+            for cur_q_pu in batch_list:
+                cur_q_inv_glm_str = glm_obj_mr_str + self.render_inv_q_glm(
+                    cur_q_pu, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str
+                )
+
+                cur_results_flr_name = f"{cur_inv_nm}_{cur_q_pu}"
+                cur_results_flr_pfn = os.path.join(self.stor_csv_path, cur_results_flr_name)
+                mr_pfn_list.append(os.path.join(cur_results_flr_pfn, mr_file_fn))
+
+                self.run_scn(
+                    SweepManifest.get_scn_key(cur_inv_nm, cur_q_pu),
+                    cur_inv_nm,
+                    cur_q_pu,
+                    cur_q_inv_glm_str,
+                    cur_results_flr_pfn,
+                    cur_results_flr_pfn,
+                    clean_flag=True,
+                )
+            self.run_executor()
+
+            # --a failed run (no output) is recorded as such, and is not refined around
+            for cur_q_pu, cur_mr_pfn in zip(batch_list, mr_pfn_list):
+                try:
+                    cur_resp = self.qadapt_resp_func(cur_mr_pfn)
+                except (OSError, ValueError, IndexError, pd.errors.ParserError) as err:
+                    print(f"No response for '{cur_inv_nm}' at Q = {cur_q_pu} p.u.: {err}")
+                    cur_resp = None
+                planner.add_result(cur_q_pu, cur_resp)
+
+        print(f"Inverter '{cur_inv_nm}': {planner.num_runs} runs, thresholds: {planner.get_thresholds()}")
+
+    def run_inv(self, run_player_mode=True, run_adaptive_mode=False, clean_rslts_flag=None):
+        """Run the sweep of all the inverters
+
+        The results folder is cleaned first, unless 'clean_rslts_flag' is False, or (by default) a manifest or a
+        run-stats log is used, since both are kept in it (and the finished results of a resumed sweep with them).
+        """
         # --search the list of inverters if not given
         if not self.inv_nm_list:
             self.inv_nm_list = self.gp.read_inv_names(self.inv_glm_src_pfn)
 
         # --prepare the results folder
-        self.prep_rslts_flr(self.stor_csv_path)
+        if clean_rslts_flag is None:
+            clean_rslts_flag = self.manifest is None and self.run_stats_log is None
+        if clean_rslts_flag:
+            self.prep_rslts_flr(self.stor_csv_path)
+        else:
+            pathlib.Path(self.stor_csv_path).mkdir(parents=True, exist_ok=True)
 
         # --run gld for each inverter
         for cur_inv_nm in self.inv_nm_list:
@@ -323,8 +715,12 @@ class player {
             else:
                 raise ValueError("The source glm is problematic")
 
-            # --run gld for each q value in a given list
-            if run_player_mode:
+            # --run gld for each q value in a given list (or planned adaptively)
+            if run_adaptive_mode:
+                self.run_inv_qadapt(
+                    cur_inv_nm, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str
+                )
+            elif run_player_mode:
                 self.run_inv_qplayer(
                     cur_inv_nm, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str
                 )
@@ -333,6 +729,14 @@ class player {
                     cur_inv_nm, cur_inv_glm_lines_str, cur_inv_re_tpl, igs_str
                 )
 
+        # --run the queued scenarios (if an executor is used)
+        self.run_executor()
+
+        if self.manifest is not None:
+            self.manifest.disp_summary()
+        if self.run_stats_log is not None:
+            self.run_stats_log.disp_summary()
+
 
 def test_GldSmn():
     """
@@ -375,6 +779,17 @@ def test_GldSmn():
     # ==Init the Instance of GlmParser
     p.init_GlmParser(inv_glm_path, inv_glm_src_fn, inv_glm_dst_fn, inv_nm_list)
 
+    # ==Resume from the previous (interrupted) sweep, if any (note that the results folder is then kept, see 'run_inv')
+    # p.prep_manifest() # left here as a demo
+
+    # ==Record the per-run statistics (also keeps the results folder)
+    # p.prep_run_stats() # left here as a demo
+
+    # ==Run the scenarios on a local process pool
+    # p.prep_executor(max_workers=4)
+    # ~~or, hand them out to the workers (started by 'python gld_executor.py worker <host> <port> --gld-exe <exe> --token <token>')
+    # p.prep_executor(gld_executor.TcpCoordinator, host="0.0.0.0", port=50007, token="<token>")
+
     """
     Demos
     """
@@ -391,6 +806,11 @@ def test_GldSmn():
     # p.prep_run_inv_qlist(inv_q_list)
     # p.run_inv(run_player_mode=False)
 
+    # ==Demo 01b (modify Q_Out directly in glm, at the Q points planned adaptively)
+    # p.prep_multi_recorder("VA_Out.imag, " + GldSmn.create_prop_str(["n264462735_1209"], ["voltage_A"]))
+    # p.prep_run_inv_qadapt(num_coarse=5, tol=0.5, min_step=1e-2, lim_list=[0.95 * 7200, 1.05 * 7200])
+    # p.run_inv(run_adaptive_mode=True)
+
     # ==Demo 02 (modify Q_Out via player)
     # --1) params
     player_file_str = "inv_q_all.player"
@@ -428,6 +848,45 @@ def test_GldSmn():
     # --save CSV files
     # p.save_results()
 
+def test_GldSmn_fake():
+    """Run the Q list mode on the fake gridlabd: each per-Q folder gets the files of the recorders in the rendered
+    inverter glm (redirected) & in the main glm (moved after each run)
+    """
+    import tempfile
+
+    import fake_gridlabd
+
+    gld_path = tempfile.mkdtemp(prefix="gld_smn_")
+    gld_exe_fn = fake_gridlabd.install_wrapper(os.path.join(gld_path, "bin"))
+    stor_csv_path = os.path.join(gld_path, "results")
+
+    with open(os.path.join(gld_path, "main.glm"), "w") as hf_glm:
+        hf_glm.write(
+            "clock { starttime '2000-01-01 00:00:00 EST'; stoptime '2000-01-01 00:01:00 EST'; }\n"
+            "object node { name n1; phases ABCN; nominal_voltage 7200;\n"
+            "  object recorder { property voltage_A,voltage_B,voltage_C; file n1_volt.csv; interval 1; };\n"
+            "}\n"
+            "#include \"SolarPV.glm\"\n"
+        )
+    with open(os.path.join(gld_path, "Copy_SolarPV.glm"), "w") as hf_glm:
+        hf_glm.write(
+            "object inverter {\n\tname inv1;\n\tparent n1;\n\trated_power 10000;\n\tQ_Out 0;\n}\n"
+            "object recorder { parent inv1; property VA_Out; file inv1_va.csv; interval 1; }\n"
+        )
+
+    p = GldSmn(gld_path, gld_path, "main.glm", gld_path, stor_csv_path, gld_exe_fn)
+    p.init_GlmParser(gld_path, "Copy_SolarPV.glm", "SolarPV.glm", ["inv1"])
+    p.prep_run_inv_qlist([-1.0, 0.0, 1.0])
+    p.run_inv(run_player_mode=False)
+
+    assert p.move_leftover_flag
+    for cur_q_pu in p.inv_q_list:
+        cur_flr_pfn = os.path.join(stor_csv_path, f"inv1_{cur_q_pu}")
+        assert sorted(os.listdir(cur_flr_pfn)) == ["inv1_va.csv", "n1_volt.csv"], cur_flr_pfn
+    assert not os.path.exists(os.path.join(gld_path, "n1_volt.csv"))
+    print(f"The results are in '{stor_csv_path}'")
+
+
 def test_inverters():
     #==Params
     csv_fp = r'D:\#Github\duke_te2\UC1SC1_InitTopo_dv_150v'
@@ -442,8 +901,10 @@ def test_export_player_file():
     #a = GldSmn.gen_player_str("2019-07-29 12:00:00", 201, -1.0)
     #GldSmn.export_player_file("luan.player", a)
 
-    a = GldSmn.gen_player_str("2000-01-01 00:00:00", 600003, -1.0, dt_sec = 40e-6,datetime_mask=r"%Y-%m-%d %H:%M:%S")
-    GldSmn.export_player_file("luan.player", a)
+    # a = GldSmn.gen_player_str("2000-01-01 00:00:00", 600003, -1.0, dt_sec = 40e-6,datetime_mask=r"%Y-%m-%d %H:%M:%S")
+    # GldSmn.export_player_file("luan.player", a)
+
+    GldSmn.gen_player_file("luan.player", "2000-01-01 00:00:00", 600003, -1.0, dt_sec = 40e-6,datetime_mask=r"%Y-%m-%d %H:%M:%S")
 
 if __name__ == "__main__":
     """
@@ -463,3 +924,8 @@ if __name__ == "__main__":
     03: for 'test_inverters()'
     """
     # test_inverters()
+
+    """
+    04: for 'test_GldSmn_fake()'
+    """
+    test_GldSmn_fake()
@@ -0,0 +1,181 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import hashlib
+import os.path
+import sqlite3
+import time
+
+# ==Constant
+SCN_STATUS_PENDING = "pending"
+SCN_STATUS_RUNNING = "running"
+SCN_STATUS_DONE = "done"
+SCN_STATUS_FAILED = "failed"
+
+
+class SweepManifest:
+    """Record the status of each scenario of a sweep in a local SQLite file, so an interrupted sweep can be resumed"""
+
+    @staticmethod
+    def hash_inputs(*input_str_list):
+        """Hash the inputs (e.g., the rendered glm string, the player file name) of a scenario
+        """
+        h = hashlib.sha256()
+        for cur_str in input_str_list:
+            h.update(str(cur_str).encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    @staticmethod
+    def get_scn_key(inv_nm, q_pu=None):
+        """The key of a scenario, i.e., (inverter) or (inverter, Q)
+        """
+        if q_pu is None:
+            return f"{inv_nm}"
+        return f"{inv_nm}_{q_pu}"
+
+    def __init__(self, db_pfn):
+        """Open (or create) the manifest
+        """
+        self.db_pfn = db_pfn
+
+        # ==DB
+        self.conn = sqlite3.connect(db_pfn)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS scenarios ("
+            "scn_key TEXT PRIMARY KEY, "
+            "inv_nm TEXT, "
+            "q_pu REAL, "
+            "status TEXT NOT NULL, "
+            "inputs_hash TEXT, "
+            "output_path TEXT, "
+            "st_time REAL, "
+            "end_time REAL, "
+            "elapsed_sec REAL, "
+            "num_attempts INTEGER DEFAULT 0, "
+            "err_msg TEXT)"
+        )
+        self.conn.commit()
+
+        # ==Scenarios left as 'running' were interrupted (e.g., by a crash)
+        self.conn.execute(
+            "UPDATE scenarios SET status = ?, err_msg = ? WHERE status = ?",
+            (SCN_STATUS_FAILED, "interrupted", SCN_STATUS_RUNNING),
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def get_scn(self, scn_key):
+        cur = self.conn.execute(
+            "SELECT scn_key, inv_nm, q_pu, status, inputs_hash, output_path, "
+            "st_time, end_time, elapsed_sec, num_attempts, err_msg "
+            "FROM scenarios WHERE scn_key = ?",
+            (scn_key,),
+        )
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return dict(zip([x[0] for x in cur.description], row))
+
+    def register_scn(self, scn_key, inv_nm, q_pu=None, inputs_hash=None, output_path=None):
+        """Add a scenario as 'pending' (an existing record is kept)
+        """
+        self.conn.execute(
+            "INSERT OR IGNORE INTO scenarios (scn_key, inv_nm, q_pu, status, inputs_hash, output_path) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (scn_key, inv_nm, q_pu, SCN_STATUS_PENDING, inputs_hash, output_path),
+        )
+        self.conn.commit()
+
+    def is_done(self, scn_key, inputs_hash=None):
+        """A scenario is done when it finished with the same inputs and its output is still there
+        """
+        cur_scn = self.get_scn(scn_key)
+        if cur_scn is None or cur_scn["status"] != SCN_STATUS_DONE:
+            return False
+        if inputs_hash is not None and cur_scn["inputs_hash"] != inputs_hash:
+            return False
+        if cur_scn["output_path"] and not os.path.exists(cur_scn["output_path"]):
+            return False
+        return True
+
+    def mark_running(self, scn_key, inv_nm, q_pu=None, inputs_hash=None, output_path=None):
+        self.register_scn(scn_key, inv_nm, q_pu, inputs_hash, output_path)
+        self.conn.execute(
+            "UPDATE scenarios SET status = ?, inputs_hash = ?, output_path = ?, st_time = ?, "
+            "end_time = NULL, elapsed_sec = NULL, err_msg = NULL, num_attempts = num_attempts + 1 "
+            "WHERE scn_key = ?",
+            (SCN_STATUS_RUNNING, inputs_hash, output_path, time.time(), scn_key),
+        )
+        self.conn.commit()
+
+    def mark_finished(self, scn_key, status, err_msg=None):
+        end_time = time.time()
+        self.conn.execute(
+            "UPDATE scenarios SET status = ?, end_time = ?, elapsed_sec = ? - st_time, err_msg = ? "
+            "WHERE scn_key = ?",
+            (status, end_time, end_time, err_msg, scn_key),
+        )
+        self.conn.commit()
+
+    def mark_done(self, scn_key):
+        self.mark_finished(scn_key, SCN_STATUS_DONE)
+
+    def mark_failed(self, scn_key, err_msg=""):
+        self.mark_finished(scn_key, SCN_STATUS_FAILED, err_msg)
+
+    def get_scn_keys(self, status):
+        cur = self.conn.execute(
+            "SELECT scn_key FROM scenarios WHERE status = ? ORDER BY scn_key", (status,)
+        )
+        return [x[0] for x in cur.fetchall()]
+
+    def get_summary(self):
+        cur = self.conn.execute("SELECT status, COUNT(*) FROM scenarios GROUP BY status")
+        return dict(cur.fetchall())
+
+    def disp_summary(self):
+        summary_dict = self.get_summary()
+        print(
+            f"Sweep manifest '{self.db_pfn}': "
+            + ", ".join([f"{v} {k}" for k, v in sorted(summary_dict.items())])
+        )
+
+
+def test_SweepManifest():
+    db_pfn = "test_sweep.sqlite"
+    if os.path.exists(db_pfn):
+        os.remove(db_pfn)
+
+    m = SweepManifest(db_pfn)
+    for cur_q_pu in [-1.0, 0.0, 1.0]:
+        cur_key = SweepManifest.get_scn_key("Inv_S1", cur_q_pu)
+        cur_hash = SweepManifest.hash_inputs("glm contents", cur_q_pu)
+        if m.is_done(cur_key, cur_hash):
+            continue
+        m.mark_running(cur_key, "Inv_S1", cur_q_pu, cur_hash)
+        if cur_q_pu > 0:
+            m.mark_failed(cur_key, "demo failure")
+        else:
+            m.mark_done(cur_key)
+    m.disp_summary()
+    m.close()
+
+    # --reopen, as a restarted sweep would do
+    m = SweepManifest(db_pfn)
+    assert m.is_done("Inv_S1_-1.0", SweepManifest.hash_inputs("glm contents", -1.0))
+    assert not m.is_done("Inv_S1_1.0")
+    print(m.get_scn_keys("failed"))
+    m.close()
+
+    os.remove(db_pfn)
+
+
+if __name__ == "__main__":
+    test_SweepManifest()
@@ -0,0 +1,193 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import numpy as np
+
+
+class AdaptiveQPlanner:
+    """Plan the Q points of an inverter sweep adaptively
+
+    The sweep starts from a coarse grid. In each round, an interval between two evaluated points is split at its
+    midpoint when:
+    1) the response is nonlinear there, i.e., the quadratic through the interval & its neighboring point differs
+       from the straight line by more than 'tol' at the midpoint; or
+    2) a response crosses one of the limits (e.g., the ANSI voltage bounds) in it, which bisects the interval
+       until it is narrower than 'min_step'.
+
+    The points of a round are independent of each other, so a round can be run as one batch (e.g., by an executor).
+    """
+
+    def __init__(
+        self,
+        q_lower_lim=-1.0,
+        q_upper_lim=1.0,
+        num_coarse=5,
+        tol=1e-3,
+        min_step=1e-2,
+        lim_list=[],
+        max_runs=100,
+        q_decimals=6,
+    ):
+        self.q_lower_lim = q_lower_lim
+        self.q_upper_lim = q_upper_lim
+        self.num_coarse = num_coarse
+        self.tol = tol
+        self.min_step = min_step
+        self.lim_list = lim_list
+        self.max_runs = max_runs
+        self.q_decimals = q_decimals
+
+        # --the evaluated points & their responses (each response is a 1-D array, e.g., voltages of the nodes)
+        self.resp_dict = {}
+        # --the points that are planned but have no response (e.g., failed runs); they are not planned again
+        self.failed_set = set()
+        self.pending_list = []
+
+    @property
+    def num_runs(self):
+        return len(self.resp_dict) + len(self.failed_set)
+
+    def get_q_resp(self):
+        """The evaluated points (sorted) & the response matrix (one row per point)
+        """
+        q_arr = np.array(sorted(self.resp_dict))
+        if not len(q_arr):
+            return q_arr, np.empty((0, 0))
+        return q_arr, np.vstack([self.resp_dict[x] for x in q_arr])
+
+    def next_batch(self):
+        """The Q points of the next round (an empty list means the sweep is done)
+        """
+        if not self.resp_dict and not self.failed_set:
+            batch_list = np.linspace(self.q_lower_lim, self.q_upper_lim, self.num_coarse).tolist()
+        else:
+            batch_list = self.find_refine_points()
+
+        batch_list = [round(x, self.q_decimals) for x in batch_list]
+        batch_list = [x for x in dict.fromkeys(batch_list) if x not in self.resp_dict and x not in self.failed_set]
+
+        num_left = self.max_runs - self.num_runs
+        self.pending_list = batch_list[: max(num_left, 0)]
+        return list(self.pending_list)
+
+    def add_result(self, q_pu, resp):
+        """Record the response of a point ('None' for a failed run)
+        """
+        q_pu = round(q_pu, self.q_decimals)
+        if resp is None:
+            self.failed_set.add(q_pu)
+        else:
+            self.resp_dict[q_pu] = np.atleast_1d(np.asarray(resp, dtype=float))
+
+    def find_refine_points(self):
+        q_arr, resp_arr = self.get_q_resp()
+        if len(q_arr) < 2:
+            return []
+
+        q_a_arr = q_arr[:-1]
+        q_b_arr = q_arr[1:]
+        mid_arr = (q_a_arr + q_b_arr) / 2
+        splittable_mask = (q_b_arr - q_a_arr) > self.min_step
+
+        refine_mask = self.get_nonlinear_mask(q_arr, resp_arr) | self.get_crossing_mask(resp_arr)
+        return mid_arr[refine_mask & splittable_mask].tolist()
+
+    def get_nonlinear_mask(self, q_arr, resp_arr):
+        """Compare the linear & quadratic interpolations at the midpoints of the intervals
+        """
+        num_intv = len(q_arr) - 1
+        if len(q_arr) < 3:
+            return np.ones(num_intv, dtype=bool)
+
+        # --the 3rd point of each interval: the left neighbor, or the right one for the 1st interval
+        ind_a_arr = np.arange(num_intv)
+        ind_c_arr = np.where(ind_a_arr > 0, ind_a_arr - 1, ind_a_arr + 2)
+
+        q_a = q_arr[ind_a_arr][:, np.newaxis]
+        q_b = q_arr[ind_a_arr + 1][:, np.newaxis]
+        q_c = q_arr[ind_c_arr][:, np.newaxis]
+        r_a = resp_arr[ind_a_arr]
+        r_b = resp_arr[ind_a_arr + 1]
+        r_c = resp_arr[ind_c_arr]
+        q_m = (q_a + q_b) / 2
+
+        # --Lagrange form of the quadratic through the three points, evaluated at the midpoint
+        r_quad = (
+            r_a * (q_m - q_b) * (q_m - q_c) / ((q_a - q_b) * (q_a - q_c))
+            + r_b * (q_m - q_a) * (q_m - q_c) / ((q_b - q_a) * (q_b - q_c))
+            + r_c * (q_m - q_a) * (q_m - q_b) / ((q_c - q_a) * (q_c - q_b))
+        )
+        r_lin = (r_a + r_b) / 2
+
+        return np.max(np.abs(r_quad - r_lin), axis=1) > self.tol
+
+    def get_crossing_mask(self, resp_arr):
+        """Intervals in which any response crosses any limit
+        """
+        crossing_mask = np.zeros(len(resp_arr) - 1, dtype=bool)
+        for cur_lim in self.lim_list:
+            cur_side_arr = np.sign(resp_arr - cur_lim)
+            crossing_mask |= np.any(cur_side_arr[:-1] * cur_side_arr[1:] < 0, axis=1)
+        return crossing_mask
+
+    def get_thresholds(self):
+        """The Q values at which each response crosses each limit (interpolated within the final intervals)
+
+        Returns a list of (response index, limit, Q) tuples.
+        """
+        q_arr, resp_arr = self.get_q_resp()
+        thld_list = []
+        if len(q_arr) < 2:
+            return thld_list
+
+        for cur_lim in self.lim_list:
+            cur_dev_arr = resp_arr - cur_lim
+            intv_ind_arr, resp_ind_arr = np.nonzero(cur_dev_arr[:-1] * cur_dev_arr[1:] < 0)
+            dev_a_arr = cur_dev_arr[intv_ind_arr, resp_ind_arr]
+            dev_b_arr = cur_dev_arr[intv_ind_arr + 1, resp_ind_arr]
+            q_thld_arr = q_arr[intv_ind_arr] + (q_arr[intv_ind_arr + 1] - q_arr[intv_ind_arr]) * dev_a_arr / (
+                dev_a_arr - dev_b_arr
+            )
+            thld_list += list(zip(resp_ind_arr.tolist(), [cur_lim] * len(q_thld_arr), q_thld_arr.tolist()))
+        return thld_list
+
+    def interp(self, q_grid):
+        """Rebuild the response curves on a given grid (piecewise-linear between the evaluated points)
+        """
+        q_arr, resp_arr = self.get_q_resp()
+        q_grid = np.asarray(q_grid, dtype=float)
+        return np.column_stack([np.interp(q_grid, q_arr, resp_arr[:, x]) for x in range(resp_arr.shape[1])])
+
+    def run(self, eval_func):
+        """Run the whole sweep with a function mapping a list of Q points to their responses
+        """
+        while True:
+            batch_list = self.next_batch()
+            if not batch_list:
+                break
+            for cur_q_pu, cur_resp in zip(batch_list, eval_func(batch_list)):
+                self.add_result(cur_q_pu, cur_resp)
+        return self.get_q_resp()
+
+
+def test_AdaptiveQPlanner():
+    # --a made-up response: linear, then saturating above Q = 0.4 p.u.
+    def eval_func(q_list):
+        q_arr = np.asarray(q_list)
+        volt_arr = 1.0 + 0.03 * q_arr - 0.2 * np.maximum(q_arr - 0.4, 0) ** 2
+        return np.column_stack([volt_arr, volt_arr - 0.01])
+
+    planner = AdaptiveQPlanner(num_coarse=5, tol=2e-4, min_step=1e-3, lim_list=[0.98, 1.02])
+    q_arr, resp_arr = planner.run(eval_func)
+
+    q_grid = np.linspace(-1.0, 1.0, 201)
+    err = np.max(np.abs(planner.interp(q_grid) - eval_func(q_grid)))
+    print(f"{planner.num_runs} runs (vs. {len(q_grid)} on the fixed grid), max interpolation error: {err}")
+    print(planner.get_thresholds())
+
+
+if __name__ == "__main__":
+    test_AdaptiveQPlanner()
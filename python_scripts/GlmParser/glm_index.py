@@ -0,0 +1,165 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import os.path
+import re
+
+# ==Constant
+RE_GLM_COMM = re.compile(r"//[^\n]*")
+RE_GLM_INCLUDE = re.compile(r"^[ \t]*#include\s+[\"<]?([^\">\n]+?)[\">]?\s*$", re.MULTILINE)
+
+# --the tokens of a .glm file: a macro line (e.g., '#set'), an object opening (incl. 'object class:id {'),
+# --a (non-object) block opening, a closing brace, or a property ('key value;')
+RE_GLM_TOKEN = re.compile(
+    r"\s*(?:(?P<macro>#[^\n]*)"
+    r"|(?P<obj>\bobject\s+(?P<cls>[\w.]+)(?::(?P<id>[\w.]*))?\s*\{)"
+    r"|(?P<blk>[^{};]*\{)"
+    r"|(?P<close>\})"
+    r"|(?P<prop>(?P<key>[\w.:]+)\s+(?P<val>[^;{}]*?)\s*;)"
+    r"|(?P<stmt>[^{};]*;))"
+)
+
+
+class GlmIndex:
+    """A single-pass index of the objects of a .glm file (with the '#include' files inlined)
+
+    Each object is kept as a dict of its 'class', 'name', 'props' (the raw property strings), 'parent' (the 'parent'
+    property, or the enclosing object of a nested one), and 'span' (of its text in 'glm_str'). The objects are
+    looked up by class ('by_class') or by name ('by_name'), so the same model is never parsed twice.
+    """
+
+    @staticmethod
+    def read_glm(glm_pfn, seen_set=None):
+        """Read a .glm file without the comments, with the '#include' files inlined (relative to the including file)
+        """
+        if seen_set is None:
+            seen_set = set()
+        glm_pfn = os.path.abspath(glm_pfn)
+        if glm_pfn in seen_set:
+            return ""
+        seen_set.add(glm_pfn)
+
+        with open(glm_pfn, "r") as hf_glm:
+            glm_str = RE_GLM_COMM.sub("", hf_glm.read())
+
+        def repl_include(m_inc):
+            inc_pfn = os.path.join(os.path.dirname(glm_pfn), m_inc.group(1).strip())
+            if not os.path.exists(inc_pfn):
+                print(f"The included file '{m_inc.group(1)}' is not found, and is skipped")
+                return ""
+            return GlmIndex.read_glm(inc_pfn, seen_set)
+
+        return RE_GLM_INCLUDE.sub(repl_include, glm_str)
+
+    def __init__(self, glm_pfn="", glm_str=None):
+        """Index a .glm file (or a given string of a model)
+        """
+        self.glm_pfn = glm_pfn
+        if glm_str is None:
+            glm_str = GlmIndex.read_glm(glm_pfn)
+        self.glm_str = glm_str
+
+        self.obj_list = []
+        self.by_class = {}
+        self.by_name = {}
+        self.index_objs()
+
+    def index_objs(self):
+        """Scan the tokens once, with a stack of the open blocks (None for a non-object block, e.g., 'module')
+        """
+        blk_stack = []
+        for m_tok in RE_GLM_TOKEN.finditer(self.glm_str):
+            if m_tok.group("obj"):
+                par_ind = next((x for x in reversed(blk_stack) if x is not None), None)
+                cur_obj = {
+                    "class": m_tok.group("cls"),
+                    "name": None,
+                    "id": m_tok.group("id"),
+                    "props": {},
+                    "parent": None if par_ind is None else par_ind,
+                    "span": [m_tok.start("obj"), None],
+                }
+                blk_stack.append(len(self.obj_list))
+                self.obj_list.append(cur_obj)
+            elif m_tok.group("blk") is not None:
+                blk_stack.append(None)
+            elif m_tok.group("close"):
+                if not blk_stack:
+                    continue
+                cur_ind = blk_stack.pop()
+                if cur_ind is not None:
+                    self.obj_list[cur_ind]["span"][1] = m_tok.end()
+            elif m_tok.group("prop") and blk_stack and blk_stack[-1] is not None:
+                cur_val_str = m_tok.group("val").strip()
+                if len(cur_val_str) > 1 and cur_val_str[0] == cur_val_str[-1] == '"':
+                    cur_val_str = cur_val_str[1:-1]
+                self.obj_list[blk_stack[-1]]["props"][m_tok.group("key")] = cur_val_str
+
+        # ==Names & parents (the nested objects refer to the enclosing ones by index until the names are known)
+        for cur_ind, cur_obj in enumerate(self.obj_list):
+            if "name" in cur_obj["props"]:
+                cur_obj["name"] = cur_obj["props"]["name"]
+            elif cur_obj["id"]:
+                cur_obj["name"] = f"{cur_obj['class']}:{cur_obj['id']}"
+            else:
+                cur_obj["name"] = f"{cur_obj['class']}:{cur_ind}"
+
+            self.by_class.setdefault(cur_obj["class"], []).append(cur_ind)
+            if cur_obj["name"] in self.by_name:
+                print(f"The object name '{cur_obj['name']}' is repeated; the 1st one is indexed")
+            else:
+                self.by_name[cur_obj["name"]] = cur_ind
+
+        # --a named object can still be referred to as 'class:id' (e.g., 'from node:150;')
+        for cur_ind, cur_obj in enumerate(self.obj_list):
+            if cur_obj["id"]:
+                self.by_name.setdefault(f"{cur_obj['class']}:{cur_obj['id']}", cur_ind)
+
+        for cur_obj in self.obj_list:
+            if "parent" in cur_obj["props"]:
+                cur_obj["parent"] = self.get_name(cur_obj["props"]["parent"])
+            elif cur_obj["parent"] is not None:
+                cur_obj["parent"] = self.obj_list[cur_obj["parent"]]["name"]
+
+    def get_name(self, ref_str):
+        """The name of the object referred to (by its name, or as 'class:id'); the reference itself if unknown
+        """
+        if ref_str in self.by_name:
+            return self.obj_list[self.by_name[ref_str]]["name"]
+        return ref_str
+
+    def get_obj(self, name_str):
+        return self.obj_list[self.by_name[name_str]]
+
+    def get_raw(self, name_str):
+        """The text of an object (incl. its nested objects)
+        """
+        st_pos, end_pos = self.get_obj(name_str)["span"]
+        return self.glm_str[st_pos:end_pos]
+
+    def select(self, cls_str, where_dict=None):
+        """The objects of a class, of which the properties match the given patterns (e.g., {'phases': 'A.*B.*C'})
+        """
+        obj_list = [self.obj_list[x] for x in self.by_class.get(cls_str, [])]
+        if not where_dict:
+            return obj_list
+        re_where_list = [(k, re.compile(v)) for k, v in where_dict.items()]
+        return [
+            x for x in obj_list if all(k in x["props"] and r.search(x["props"][k]) for k, r in re_where_list)
+        ]
+
+
+def test_GlmIndex():
+    glm_pfn = r"../../IEEE Test Models/13node/IEEE-13.glm"
+
+    gi = GlmIndex(glm_pfn)
+    print({k: len(v) for k, v in gi.by_class.items()})
+    print([x["name"] for x in gi.select("node", {"phases": "A.*B.*C"})])
+    print(gi.get_obj(gi.obj_list[-1]["name"]))
+
+
+if __name__ == "__main__":
+    test_GlmIndex()
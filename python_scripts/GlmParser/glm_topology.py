@@ -0,0 +1,306 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.csgraph
+
+from glm_index import GlmIndex
+
+# ==Constant
+TOPO_IND_DTYPE = np.int32
+# --csgraph marks the root (& the unreached nodes) with this predecessor
+CSGRAPH_NO_PRED = -9999
+# --the classes of the children that hang on their parents (not, e.g., a recorder, player, or collector)
+TOPO_NODE_CLS_LIST = [
+    "node", "meter", "load", "triplex_node", "triplex_meter", "triplex_load", "substation", "capacitor"
+]
+
+
+class GlmTopology:
+    """The connectivity of a model as a compressed sparse row (CSR) adjacency of NumPy int32 arrays
+
+    The nodes are numbered in the order of their first appearance ('node_list', 'node_ind_dict'). Each link (a
+    'from'/'to' object, or a 'parent' relation from the parent to a child node) is stored in both directions, so the
+    neighbors of node i are 'indices[indptr[i]:indptr[i + 1]]' via the links 'link_ids[indptr[i]:indptr[i + 1]]'.
+    The BFS/DFS, upstream path, subtree, and connected-component queries run in linear time (scipy.sparse.csgraph).
+    """
+
+    @staticmethod
+    def is_open(status_str):
+        """If a link is open (e.g., 'status OPEN;' of a switch, fuse, or recloser)
+        """
+        return isinstance(status_str, str) and status_str.strip().strip('"').upper() == "OPEN"
+
+    @staticmethod
+    def from_index(glm_idx, parent_flag=True, skip_open_flag=True, node_cls_list=TOPO_NODE_CLS_LIST):
+        """The topology of a 'GlmIndex' (or a .glm file): the objects with both 'from' & 'to', and the parents of the
+        children of the node classes ('node_cls_list')
+
+        With 'skip_open_flag', the open links are left out (their end nodes are kept, e.g., as islands).
+        """
+        if isinstance(glm_idx, str):
+            glm_idx = GlmIndex(glm_idx)
+
+        fm_list = []
+        to_list = []
+        link_list = []
+        par_list = []
+        node_list = []
+        for cur_obj in glm_idx.obj_list:
+            cur_props = cur_obj["props"]
+            if "from" in cur_props and "to" in cur_props:
+                if skip_open_flag and GlmTopology.is_open(cur_props.get("status")):
+                    node_list += [glm_idx.get_name(cur_props["from"]), glm_idx.get_name(cur_props["to"])]
+                    continue
+                fm_list.append(glm_idx.get_name(cur_props["from"]))
+                to_list.append(glm_idx.get_name(cur_props["to"]))
+                link_list.append(cur_obj["name"])
+                par_list.append(False)
+            elif parent_flag and cur_obj["parent"] is not None and cur_obj["class"] in node_cls_list:
+                fm_list.append(cur_obj["parent"])
+                to_list.append(cur_obj["name"])
+                link_list.append(cur_obj["name"])
+                par_list.append(True)
+
+        return GlmTopology(fm_list, to_list, link_list, par_list, node_list)
+
+    @staticmethod
+    def from_objs(obj_iter, parent_flag=True, skip_open_flag=True, node_cls_list=TOPO_NODE_CLS_LIST):
+        """The topology of the object dicts with 'name', and 'from' & 'to' or 'parent' (e.g., the objects of glmMap,
+        or the values of the 'glmTree' of cymeToGridlab); the open links & the children of other classes (the
+        'class' or 'object' of a dict) are left out as in 'from_index'
+        """
+        fm_list = []
+        to_list = []
+        link_list = []
+        par_list = []
+        node_list = []
+        for cur_obj in obj_iter:
+            if cur_obj.get("from") is not None and cur_obj.get("to") is not None:
+                if skip_open_flag and GlmTopology.is_open(cur_obj.get("status")):
+                    node_list += [cur_obj["from"], cur_obj["to"]]
+                    continue
+                fm_list.append(cur_obj["from"])
+                to_list.append(cur_obj["to"])
+                link_list.append(cur_obj.get("name"))
+                par_list.append(False)
+            elif (
+                parent_flag
+                and cur_obj.get("parent") is not None
+                and cur_obj.get("class", cur_obj.get("object")) in node_cls_list
+            ):
+                fm_list.append(cur_obj["parent"])
+                to_list.append(cur_obj["name"])
+                link_list.append(cur_obj["name"])
+                par_list.append(True)
+
+        return GlmTopology(fm_list, to_list, link_list, par_list, node_list)
+
+    def __init__(self, fm_list, to_list, link_list=None, par_list=None, node_list=None):
+        """Build the CSR adjacency of the links (from & to node names); 'node_list' adds the isolated nodes
+        """
+        self.node_list = []
+        self.node_ind_dict = {}
+        for cur_name in node_list or []:
+            self.add_node(cur_name)
+        self.fm_arr = np.fromiter((self.add_node(x) for x in fm_list), dtype=TOPO_IND_DTYPE, count=len(fm_list))
+        self.to_arr = np.fromiter((self.add_node(x) for x in to_list), dtype=TOPO_IND_DTYPE, count=len(to_list))
+
+        self.link_list = list(link_list) if link_list is not None else list(range(len(self.fm_arr)))
+        self.par_link_arr = np.asarray(par_list if par_list is not None else [False] * len(self.fm_arr), dtype=bool)
+
+        # ==CSR (both directions), by a stable sort of the source nodes
+        num_nodes = len(self.node_list)
+        src_arr = np.concatenate([self.fm_arr, self.to_arr])
+        dst_arr = np.concatenate([self.to_arr, self.fm_arr])
+        lnk_arr = np.tile(np.arange(len(self.fm_arr), dtype=TOPO_IND_DTYPE), 2)
+        order_arr = np.argsort(src_arr, kind="stable")
+
+        self.indices = dst_arr[order_arr]
+        self.link_ids = lnk_arr[order_arr]
+        self.indptr = np.zeros(num_nodes + 1, dtype=TOPO_IND_DTYPE)
+        np.cumsum(np.bincount(src_arr, minlength=num_nodes), out=self.indptr[1:])
+
+        self.csgraph = scipy.sparse.csr_matrix(
+            (np.ones(len(self.indices), dtype=np.int8), self.indices, self.indptr), shape=(num_nodes, num_nodes)
+        )
+
+        # --the rooted tree of 'build_tree()'
+        self.root_ind = None
+        self.pred_arr = None
+        self.pred_link_arr = None
+        self.tree_csgraph = None
+
+    def add_node(self, name_str):
+        if name_str not in self.node_ind_dict:
+            self.node_ind_dict[name_str] = len(self.node_list)
+            self.node_list.append(name_str)
+        return self.node_ind_dict[name_str]
+
+    @property
+    def num_nodes(self):
+        return len(self.node_list)
+
+    @property
+    def num_links(self):
+        return len(self.fm_arr)
+
+    def get_ind(self, node):
+        """The index of a node given by name (or by index)
+        """
+        if isinstance(node, (int, np.integer)):
+            return int(node)
+        return self.node_ind_dict[node]
+
+    def get_names(self, ind_arr):
+        return [self.node_list[x] for x in ind_arr]
+
+    def get_neighbors(self, node):
+        """The neighbor nodes & the links to them
+        """
+        cur_ind = self.get_ind(node)
+        st_pos, end_pos = self.indptr[cur_ind], self.indptr[cur_ind + 1]
+        return self.indices[st_pos:end_pos], self.link_ids[st_pos:end_pos]
+
+    def get_degrees(self):
+        return np.diff(self.indptr)
+
+    @staticmethod
+    def fix_pred(pred_arr):
+        return np.where(pred_arr == CSGRAPH_NO_PRED, -1, pred_arr).astype(TOPO_IND_DTYPE)
+
+    def bfs(self, root):
+        """The nodes reached from the root in the BFS order, and the predecessor of each node (-1 if none)
+        """
+        order_arr, pred_arr = scipy.sparse.csgraph.breadth_first_order(
+            self.csgraph, self.get_ind(root), directed=False, return_predecessors=True
+        )
+        return order_arr.astype(TOPO_IND_DTYPE), GlmTopology.fix_pred(pred_arr)
+
+    def dfs(self, root):
+        """The nodes reached from the root in the DFS (pre)order, and the predecessor of each node (-1 if none)
+        """
+        order_arr, pred_arr = scipy.sparse.csgraph.depth_first_order(
+            self.csgraph, self.get_ind(root), directed=False, return_predecessors=True
+        )
+        return order_arr.astype(TOPO_IND_DTYPE), GlmTopology.fix_pred(pred_arr)
+
+    def build_tree(self, root):
+        """Root the topology (by a BFS): the upstream node & link of each node, and the downstream (child) graph
+
+        For a meshed model, the BFS tree is used (i.e., the 1st path found).
+        """
+        self.root_ind = self.get_ind(root)
+        _, self.pred_arr = self.bfs(self.root_ind)
+
+        # --the link to the upstream node (of parallel links, the last one)
+        src_arr = np.repeat(np.arange(self.num_nodes, dtype=TOPO_IND_DTYPE), self.get_degrees())
+        up_mask = self.indices == self.pred_arr[src_arr]
+        self.pred_link_arr = np.full(self.num_nodes, -1, dtype=TOPO_IND_DTYPE)
+        self.pred_link_arr[src_arr[up_mask]] = self.link_ids[up_mask]
+
+        child_arr = np.flatnonzero(self.pred_arr >= 0)
+        self.tree_csgraph = scipy.sparse.csr_matrix(
+            (np.ones(len(child_arr), dtype=np.int8), (self.pred_arr[child_arr], child_arr)),
+            shape=(self.num_nodes, self.num_nodes),
+        )
+
+    def check_tree(self):
+        if self.pred_arr is None:
+            raise ValueError("The topology is not rooted yet; please call build_tree() first")
+
+    def get_upstream_path(self, node):
+        """The nodes (names) from a node up to the root, and the links (names) between them
+        """
+        self.check_tree()
+        cur_ind = self.get_ind(node)
+        if cur_ind != self.root_ind and self.pred_arr[cur_ind] < 0:
+            raise ValueError(f"'{self.node_list[cur_ind]}' is not connected to the root")
+
+        node_path_list = [self.node_list[cur_ind]]
+        link_path_list = []
+        while self.pred_arr[cur_ind] >= 0:
+            link_path_list.append(self.link_list[self.pred_link_arr[cur_ind]])
+            cur_ind = self.pred_arr[cur_ind]
+            node_path_list.append(self.node_list[cur_ind])
+        return node_path_list, link_path_list
+
+    def get_subtree(self, node):
+        """The indices of the nodes downstream of a node (incl. itself), in the BFS order
+        """
+        self.check_tree()
+        return scipy.sparse.csgraph.breadth_first_order(
+            self.tree_csgraph, self.get_ind(node), directed=True, return_predecessors=False
+        ).astype(TOPO_IND_DTYPE)
+
+    def get_subtree_mask(self, node):
+        """A boolean mask of the subtree of a node (e.g., 'mask[topo.get_ind(x)]' tells if x is downstream)
+        """
+        sub_mask = np.zeros(self.num_nodes, dtype=bool)
+        sub_mask[self.get_subtree(node)] = True
+        return sub_mask
+
+    def get_components(self):
+        """The number of connected components, and the component label of each node
+        """
+        num_comps, label_arr = scipy.sparse.csgraph.connected_components(self.csgraph, directed=False)
+        return num_comps, label_arr.astype(TOPO_IND_DTYPE)
+
+    def get_islands(self, root):
+        """The indices of the nodes not connected to the root
+        """
+        _, label_arr = self.get_components()
+        return np.flatnonzero(label_arr != label_arr[self.get_ind(root)]).astype(TOPO_IND_DTYPE)
+
+
+def test_GlmTopology():
+    import time
+
+    glm_pfn = r"../../IEEE Test Models/123node/IEEE-123.glm"
+
+    topo = GlmTopology.from_index(glm_pfn)
+    print(f"{topo.num_nodes} nodes, {topo.num_links} links, {topo.get_components()[0]} component(s)")
+    topo.build_tree("150")
+    node_path_list, link_path_list = topo.get_upstream_path("114")
+    print(node_path_list, link_path_list)
+    print(topo.get_names(topo.get_subtree("67")))
+    print(f"islands (behind the open switches): {topo.get_names(topo.get_islands('150'))}")
+
+    # --the open switches (e.g., 151-300) are not used
+    assert "151-300" not in link_path_list and "151-300" not in topo.link_list
+    assert topo.get_upstream_path("108")[1][:2] == ["105-108", "101-105"]
+
+    # --a recorder (on the regulator 'Reg1') is not a node of the topology
+    topo = GlmTopology.from_index(r"../../IEEE Test Models/13node/IEEE-13.glm")
+    assert topo.get_components()[0] == 1 and not any(x.startswith("recorder:") for x in topo.node_list)
+
+    # ==A random radial feeder of 2M links (each node hangs on one of the last 5 nodes)
+    rng = np.random.default_rng(0)
+    num_links = 2_000_000
+    to_list = [f"n{x}" for x in range(1, num_links + 1)]
+    fm_list = [f"n{x}" for x in np.arange(1, num_links + 1) - rng.integers(1, 6, num_links).clip(max=np.arange(1, num_links + 1))]
+
+    t_st = time.perf_counter()
+    topo = GlmTopology(fm_list, to_list)
+    topo.build_tree("n0")
+    t_build = time.perf_counter() - t_st
+    num_comps = topo.get_components()[0]
+    node_path_list, _ = topo.get_upstream_path(f"n{num_links}")
+    mid_node = node_path_list[len(node_path_list) // 2]
+    sub_mask = topo.get_subtree_mask(mid_node)
+    print(
+        f"{topo.num_nodes} nodes: built & rooted in {t_build:.2f} s, queried in {time.perf_counter() - t_st - t_build:.2f} s; "
+        f"{num_comps} component(s), {len(node_path_list)} nodes up from the last one, {sub_mask.sum()} nodes below {mid_node}"
+    )
+
+    # --the path is downstream of its middle node up to it, and upstream beyond
+    assert num_comps == 1
+    assert all(sub_mask[topo.get_ind(x)] for x in node_path_list[: len(node_path_list) // 2 + 1])
+    assert not any(sub_mask[topo.get_ind(x)] for x in node_path_list[len(node_path_list) // 2 + 1 :])
+
+if __name__ == "__main__":
+    test_GlmTopology()
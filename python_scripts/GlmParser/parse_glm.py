@@ -1,7 +1,7 @@
 # ***************************************
 # Author: Jing Xie
 # Created Date: 2019-10
-# Updated Date: 2020-11-25
+# Updated Date: 2026-10-19
 # Email: jing.xie@pnnl.gov
 # ***************************************
 
@@ -21,6 +21,7 @@ PHASE_STR_LIST = ['A', 'B', 'C']
 DELTA_STR_LIST = ['B', 'C', 'A']
 PHASE_US_STR_LIST = ['_A', '_B', '_C']
 JSON_IND_LIST = [2, 4, 6]
+REC_CLS_LIST = ['recorder', 'multi_recorder', 'group_recorder', 'collector']
 
 """
 GlmParser
@@ -680,6 +681,43 @@ class GlmParser:
         hf_output.write(str_to_glm)
         hf_output.close()
 
+    def redirect_rec_files(self, src_str, dst_flr_path, rec_cls_list=REC_CLS_LIST):
+        """Rewrite the 'file' of each recorder-type object, so GLD writes the output directly into the given folder
+
+        1) A relative file name keeps its sub-folder(s) under the destination, the same as the layout produced by
+           moving the files afterwards (see 'GldSmn.move_rslts_files');
+        2) An absolute file name is put under the destination with its base name only;
+        3) The sub-folders are created here, since GLD does not create them;
+        4) The destination is made absolute, since GLD runs in its own working folder (i.e., 'gld_path').
+        Returns the modified string and the list of the (redirected) output files.
+        """
+        re_rec_obj = r"(object\s+(?:{})\b[^{{]*?{{)([^{{}}]*?)(}})".format("|".join(rec_cls_list))
+        re_rec_file = r"(^|[{;\s])(file\s+)(\"?)([^;\"]+?)(\"?)\s*;"
+
+        rec_pfn_list = []
+        dst_flr_abs_path = os.path.abspath(dst_flr_path)
+
+        def repl_file(m_file):
+            cur_fn = m_file.group(4).strip()
+            if os.path.isabs(cur_fn) or pathlib.PureWindowsPath(cur_fn).drive:
+                cur_fn = pathlib.PureWindowsPath(cur_fn).name
+            cur_dst_pfn = pathlib.Path(dst_flr_abs_path, cur_fn)
+            cur_dst_pfn.parent.mkdir(parents=True, exist_ok=True)
+            rec_pfn_list.append(str(cur_dst_pfn))
+
+            # ~~GLD cannot take a path with spaces unless it is quoted
+            cur_dst_str = cur_dst_pfn.as_posix()
+            if " " in cur_dst_str:
+                cur_dst_str = f'"{cur_dst_str}"'
+            return f"{m_file.group(1)}{m_file.group(2)}{cur_dst_str};"
+
+        def repl_obj(m_obj):
+            cur_body_str = re.sub(re_rec_file, repl_file, m_obj.group(2), flags=re.MULTILINE)
+            return m_obj.group(1) + cur_body_str + m_obj.group(3)
+
+        mod_str = re.sub(re_rec_obj, repl_obj, src_str, flags=re.DOTALL)
+        return mod_str, rec_pfn_list
+
     def create_folder(self, fld_fp, fld_fn):
         fld_fpn = pathlib.Path(fld_fp) / pathlib.Path(fld_fn)
         if fld_fpn.is_dir():
@@ -0,0 +1,340 @@
+# ***************************************
+# Author: agent
+# Created Date: 2026-10-19
+# Email: agent@local
+# ***************************************
+
+import collections
+import json
+import os.path
+import re
+
+# @TODO: It is not good to modify the path. Two options (the 2nd one is better): 1) __init__.py; 2) package, then install via pip
+import sys
+
+sys.path.append("../JsonExporter")
+
+from glm_index import GlmIndex
+from glm_topology import GlmTopology
+from export_json import JsonExporter
+
+# ==Constant
+LINK_CLS_LIST = [
+    "overhead_line",
+    "underground_line",
+    "triplex_line",
+    "transformer",
+    "regulator",
+    "switch",
+    "fuse",
+    "recloser",
+    "sectionalizer",
+    "series_reactor",
+]
+NODE_CLS_LIST = ["node", "meter", "load", "triplex_node", "triplex_meter", "triplex_load", "substation"]
+# --the classes that can be a cut node (i.e., turned into a swing meter downstream & a load upstream)
+CUT_NODE_CLS_LIST = ["node", "meter"]
+
+BND_EP_PREF = "BND_"
+BND_JSON_FN = "boundaries.json"
+
+# --the object references (e.g., 'from node:18;'), rewritten to the names in the partitions
+RE_GLM_REF_PROP = re.compile(r"(?<![\w.:])(?P<key>from|to|parent)(?P<sp>\s+)(?P<q>\"?)(?P<ref>[^;{}\"\s]+)(?P=q)(?P<end>\s*;)")
+
+
+class GlmPartitioner:
+    """Split a radial .glm model into partitions (one GLD federate each) at cut nodes
+
+    At a cut node, the upstream partition keeps the link into it and gets a 'load' of the same name (of which the
+    constant power is set by the downstream federate); the downstream partition gets a swing 'meter' of the same name
+    (of which the voltage is set by the upstream federate). The HELICS endpoints of these boundary objects are
+    exported with 'JsonExporter', one GLD json file per partition.
+    """
+
+    def __init__(self, glm_pfn, root_name=None):
+        self.gi = GlmIndex(glm_pfn)
+        self.glm_pfn = glm_pfn
+
+        # ==Topology (the closed links only; the other objects follow their parents)
+        self.node_set = {x["name"] for x in self.gi.obj_list if x["class"] in NODE_CLS_LIST and x["parent"] is None}
+        self.topo = GlmTopology.from_index(self.gi, parent_flag=False, skip_open_flag=True)
+        self.open_link_list = [
+            x["name"]
+            for x in self.gi.obj_list
+            if "from" in x["props"] and "to" in x["props"] and GlmTopology.is_open(x["props"].get("status"))
+        ]
+
+        if root_name is None:
+            root_name = next(
+                (x["name"] for x in self.gi.obj_list if x["props"].get("bustype", "").upper() == "SWING"), None
+            )
+        if root_name is None:
+            raise ValueError("No swing node is found; please give the root node")
+        self.root_name = root_name
+
+        # --BFS from the root: the upstream node & the link (object index) of each node
+        self.topo.build_tree(root_name)
+        bfs_arr, _ = self.topo.bfs(root_name)
+        self.bfs_list = self.topo.get_names(bfs_arr)
+        self.up_dict = {root_name: (None, None)}
+        for cur_ind in bfs_arr[1:]:
+            self.up_dict[self.topo.node_list[cur_ind]] = (
+                self.topo.node_list[self.topo.pred_arr[cur_ind]],
+                self.gi.by_name[self.topo.link_list[self.topo.pred_link_arr[cur_ind]]],
+            )
+
+        self.cut_list = []
+        self.part_dict = {}
+
+    def find_balanced_cuts(self, num_parts):
+        """Pick the cut nodes, so each partition has about 1/num_parts of the nodes
+
+        The nodes are visited from the leaves up; a node is cut once the nodes below it (not yet cut off) reach the
+        target size.
+        """
+        tgt_size = len(self.bfs_list) / num_parts
+        rem_dict = dict.fromkeys(self.bfs_list, 1)
+        cut_list = []
+        for cur_node in reversed(self.bfs_list[1:]):
+            if (
+                len(cut_list) < num_parts - 1
+                and rem_dict[cur_node] >= tgt_size
+                and self.gi.get_obj(cur_node)["class"] in CUT_NODE_CLS_LIST
+            ):
+                cut_list.append(cur_node)
+            else:
+                rem_dict[self.up_dict[cur_node][0]] += rem_dict[cur_node]
+        return cut_list[::-1]
+
+    def partition(self, cut_list=None, num_parts=2):
+        """Assign the nodes to partitions (0 is the one of the root), at the given cut nodes or at balanced ones
+        """
+        if cut_list is None:
+            cut_list = self.find_balanced_cuts(num_parts)
+        for cur_node in cut_list:
+            if cur_node not in self.up_dict or cur_node == self.root_name:
+                raise ValueError(f"'{cur_node}' is not a (non-root) node connected to the root")
+            if self.gi.get_obj(cur_node)["class"] not in CUT_NODE_CLS_LIST:
+                raise ValueError(f"'{cur_node}' is not a cut node of {CUT_NODE_CLS_LIST}")
+        self.cut_list = list(cut_list)
+
+        cut_ind_dict = {x: i + 1 for i, x in enumerate(self.cut_list)}
+        self.part_dict = {self.root_name: 0}
+        for cur_node in self.bfs_list[1:]:
+            self.part_dict[cur_node] = cut_ind_dict.get(cur_node, self.part_dict[self.up_dict[cur_node][0]])
+
+        # --the islands behind the open links go with the node on the other side (e.g., 350 behind 300-350)
+        _, label_arr = self.topo.get_components()
+        upd_flag = True
+        while upd_flag:
+            upd_flag = False
+            for cur_link_str in self.open_link_list:
+                cur_props = self.gi.get_obj(cur_link_str)["props"]
+                cur_end_list = [self.gi.get_name(cur_props["from"]), self.gi.get_name(cur_props["to"])]
+                for cur_src, cur_dst in [cur_end_list, cur_end_list[::-1]]:
+                    if cur_src in self.part_dict and cur_dst not in self.part_dict:
+                        cur_label = label_arr[self.topo.get_ind(cur_dst)]
+                        for cur_ind in (label_arr == cur_label).nonzero()[0]:
+                            self.part_dict[self.topo.node_list[cur_ind]] = self.part_dict[cur_src]
+                        upd_flag = True
+
+        num_node_list = collections.Counter(self.part_dict.values())
+        print(f"Partitions (number of nodes): {dict(sorted(num_node_list.items()))}")
+        return self.part_dict
+
+    def get_obj_part(self, obj_ind):
+        """The partition of an object: a node's own, a link's upstream node's, or a child's parent's
+
+        Returns None for the objects of all partitions (e.g., the configurations & schedules).
+        """
+        cur_obj = self.gi.obj_list[obj_ind]
+        for _ in range(len(self.gi.obj_list)):
+            if cur_obj["name"] in self.part_dict:
+                return self.part_dict[cur_obj["name"]]
+            if cur_obj["class"] in LINK_CLS_LIST and "from" in cur_obj["props"] and "to" in cur_obj["props"]:
+                # ~~the upstream end of a link is the one found first by the BFS
+                fm_str = self.gi.get_name(cur_obj["props"]["from"])
+                to_str = self.gi.get_name(cur_obj["props"]["to"])
+                if self.up_dict.get(to_str, (None,))[0] == fm_str or to_str not in self.part_dict:
+                    return self.part_dict.get(fm_str)
+                return self.part_dict.get(to_str)
+            if cur_obj["parent"] is None or cur_obj["parent"] not in self.gi.by_name:
+                return None
+            cur_obj = self.gi.get_obj(cur_obj["parent"])
+        return None
+
+    def get_top_spans(self):
+        """The spans of the top-level objects (i.e., not nested in another one), with their indices
+        """
+        top_list = []
+        last_end = -1
+        for cur_ind, cur_obj in enumerate(self.gi.obj_list):
+            if cur_obj["span"][0] > last_end and cur_obj["span"][1] is not None:
+                top_list.append((cur_ind, cur_obj["span"]))
+                last_end = cur_obj["span"][1]
+        return top_list
+
+    def rename_refs(self, obj_str):
+        """Rewrite the 'from'/'to'/'parent' references of an object text to the object names (e.g., 'node:18' to
+        '18'), since the boundary objects that replace the cut nodes are referred to by name only
+        """
+        def repl_ref(m_ref):
+            cur_name_str = self.gi.get_name(m_ref.group("ref"))
+            if cur_name_str == m_ref.group("ref"):
+                return m_ref.group(0)
+            return f"{m_ref.group('key')}{m_ref.group('sp')}{m_ref.group('q')}{cur_name_str}{m_ref.group('q')}{m_ref.group('end')}"
+
+        return RE_GLM_REF_PROP.sub(repl_ref, obj_str)
+
+    @staticmethod
+    def get_bnd_phases(obj):
+        return "".join([x for x in "ABC" if x in obj["props"].get("phases", "")])
+
+    @staticmethod
+    def get_bnd_prop_str(obj, prop_list):
+        """The properties of a cut node copied to its boundary objects (the missing ones are left out)
+        """
+        return "".join([f"\t{x} {obj['props'][x]};\n" for x in prop_list if obj["props"].get(x)])
+
+    def get_bnd_load_str(self, cut_node):
+        obj = self.gi.get_obj(cut_node)
+        ph_str = GlmPartitioner.get_bnd_phases(obj)
+        pwr_str = "".join([f"\tconstant_power_{x} 0+0j;\n" for x in ph_str])
+        return (
+            f"object load {{\n\tname {cut_node};\n"
+            f"{GlmPartitioner.get_bnd_prop_str(obj, ['phases', 'nominal_voltage'])}{pwr_str}}}\n"
+        )
+
+    def get_bnd_swing_str(self, cut_node):
+        obj = self.gi.get_obj(cut_node)
+        return (
+            f"object meter {{\n\tname {cut_node};\n"
+            f"{GlmPartitioner.get_bnd_prop_str(obj, ['phases', 'nominal_voltage'])}\tbustype SWING;\n}}\n"
+        )
+
+    def export_parts(self, out_flr_path, helics_flag=True, json_settings_dic=None):
+        """Write each partition into '<out folder>/part_<k>/' (the .glm file, and the GLD json file of HELICS)
+
+        The text outside of the objects (e.g., the clock, modules, and macros) and the objects of all partitions
+        (e.g., the configurations) are copied into each partition.
+        """
+        if not self.part_dict:
+            self.partition()
+        num_parts = len(self.cut_list) + 1
+        glm_stem_str = os.path.splitext(os.path.basename(self.glm_pfn))[0]
+
+        # ==Text of each partition
+        comm_str_list = []
+        part_str_list = [[] for _ in range(num_parts)]
+        last_end = 0
+        for cur_ind, (cur_st, cur_end) in self.get_top_spans():
+            comm_str_list.append(self.gi.glm_str[last_end:cur_st])
+            last_end = cur_end
+
+            cur_obj = self.gi.obj_list[cur_ind]
+            cur_obj_str = self.rename_refs(self.gi.glm_str[cur_st:cur_end]) + "\n\n"
+            if cur_obj["name"] in self.cut_list:
+                continue
+            cur_part = self.get_obj_part(cur_ind)
+
+            # --an open link between two partitions carries no power, and is left out (it would refer to a node
+            # --of the other partition)
+            if cur_obj["name"] in self.open_link_list:
+                cur_end_set = {
+                    self.part_dict.get(self.gi.get_name(cur_obj["props"][x])) for x in ["from", "to"]
+                }
+                if len(cur_end_set) > 1:
+                    print(f"The open link '{cur_obj['name']}' between the partitions {cur_end_set} is left out")
+                    continue
+
+            if cur_part is None:
+                comm_str_list.append(cur_obj_str)
+            else:
+                part_str_list[cur_part].append(cur_obj_str)
+        comm_str_list.append(self.gi.glm_str[last_end:])
+        comm_str = re.sub(r"\n[ \t]+(?=\n)", "\n", "".join(comm_str_list))
+        comm_str = re.sub(r"\n{3,}", "\n\n", comm_str)
+
+        # ==Boundary objects & endpoints
+        bnd_list = []
+        ep_dict_list = [collections.defaultdict(list) for _ in range(num_parts)]
+        for cur_down_part, cur_node in enumerate(self.cut_list, start=1):
+            cur_up_part = self.part_dict[self.up_dict[cur_node][0]]
+            part_str_list[cur_up_part].append(self.get_bnd_load_str(cur_node))
+            part_str_list[cur_down_part].append(self.get_bnd_swing_str(cur_node))
+
+            cur_ph_str = GlmPartitioner.get_bnd_phases(self.gi.get_obj(cur_node))
+            bnd_list.append(
+                {"node": cur_node, "upstream": cur_up_part, "downstream": cur_down_part, "phases": cur_ph_str}
+            )
+            for cur_ph in cur_ph_str:
+                for cur_prop in [f"voltage_{cur_ph}", f"constant_power_{cur_ph}"]:
+                    ep_dict_list[cur_up_part][cur_prop].append(cur_node)
+                for cur_prop in [f"voltage_{cur_ph}", f"measured_power_{cur_ph}"]:
+                    ep_dict_list[cur_down_part][cur_prop].append(cur_node)
+
+        # ==Export
+        part_flr_list = []
+        for cur_part in range(num_parts):
+            cur_flr_path = os.path.join(out_flr_path, f"part_{cur_part}")
+            os.makedirs(cur_flr_path, exist_ok=True)
+            part_flr_list.append(cur_flr_path)
+
+            cur_fed_str = f"GLD_{cur_part}"
+            cur_json_fn = f"{cur_fed_str}.json"
+            cur_helics_str = ""
+            if helics_flag:
+                cur_helics_str = (
+                    f"module connection;\n\nobject helics_msg {{\n\tname {cur_fed_str};\n"
+                    f"\tconfigure {cur_json_fn};\n}}\n\n"
+                )
+
+                je = JsonExporter()
+                for cur_prop, cur_node_list in ep_dict_list[cur_part].items():
+                    cur_key_list = [f"{BND_EP_PREF}{x}_{cur_prop}" for x in cur_node_list]
+                    je.get_gld_endpoints(cur_key_list, dict(zip(cur_key_list, cur_node_list)), cur_prop)
+                cur_settings_dic = {"name": cur_fed_str, "coreType": "zmq", "period": 1}
+                cur_settings_dic.update(json_settings_dic or {})
+                cur_settings_dic["name"] = cur_fed_str
+                je.export_gld_json(os.path.join(cur_flr_path, cur_json_fn), cur_settings_dic)
+
+            with open(os.path.join(cur_flr_path, f"{glm_stem_str}.glm"), "w") as hf_glm:
+                hf_glm.write(comm_str.rstrip() + "\n\n" + cur_helics_str + "".join(part_str_list[cur_part]))
+
+        with open(os.path.join(out_flr_path, BND_JSON_FN), "w") as hf_bnd:
+            json.dump({"root": self.root_name, "boundaries": bnd_list}, hf_bnd, indent=4)
+
+        return part_flr_list
+
+
+def test_GlmPartitioner():
+    import tempfile
+
+    glm_pfn = r"../../IEEE Test Models/123node/IEEE-123.glm"
+    out_flr_path = tempfile.mkdtemp()
+
+    gp = GlmPartitioner(glm_pfn)
+    gp.partition(num_parts=3)
+    print(gp.cut_list)
+    part_flr_list = gp.export_parts(out_flr_path)
+    print(part_flr_list)
+
+    # --each node is in one partition, and each cut node is on both sides
+    gi_list = [GlmIndex(os.path.join(x, "IEEE-123.glm")) for x in part_flr_list]
+    num_node_list = [len(x.by_name.keys() & gp.node_set) for x in gi_list]
+    assert sum(num_node_list) == len(gp.node_set) + len(gp.cut_list)
+
+    # --no reference dangles in any partition
+    for cur_part, cur_gi in enumerate(gi_list):
+        for cur_obj in cur_gi.obj_list:
+            for cur_key in ["from", "to", "parent"]:
+                cur_ref_str = cur_obj["props"].get(cur_key)
+                assert cur_ref_str is None or cur_ref_str in cur_gi.by_name, (cur_part, cur_obj["name"], cur_ref_str)
+
+    # --the boundary objects do not get the missing properties
+    gp.gi.get_obj(gp.cut_list[0])["props"].pop("nominal_voltage", None)
+    assert "nominal_voltage" not in gp.get_bnd_load_str(gp.cut_list[0]) + gp.get_bnd_swing_str(gp.cut_list[0])
+
+
+if __name__ == "__main__":
+    test_GlmPartitioner()
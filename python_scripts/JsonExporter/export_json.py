@@ -1,14 +1,23 @@
 # ***************************************
 # Author: Jing Xie
 # Created Date: 2020-3
-# Updated Date: 2020-3-23
+# Updated Date: 2026-10-19
 # Email: jing.xie@pnnl.gov
 # ***************************************
 
 import os.path
 import json
+import json.encoder
+import re
+import sys
+import types
 import warnings
 
+# ==Constant
+JSON_STREAM_BATCH_SIZE = 1000
+# --the folder of 'GlmIndex' (imported on demand, see 'export_json_from_glm')
+GLM_PARSER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GlmParser")
+
 
 class JsonExporter:
     """Export the .json file(s)"""
@@ -19,12 +28,19 @@ class JsonExporter:
         ns3_filters_pref="filter_",
         sort_flag=False,
         indent_val=4,
+        compact_flag=False,
+        stream_flag=False,
     ):
         """Init the settings
+
+        With 'compact_flag', the json files are written without indents & spaces; with 'stream_flag', the endpoints &
+        filters are encoded by batches as they are generated, instead of being collected into lists first.
         """
         # == for json.dump()
         self.json_dump_sort_key = sort_flag
         self.json_dump_indent_val = indent_val
+        self.json_dump_compact_flag = compact_flag
+        self.json_dump_stream_flag = stream_flag
 
         # == for CC json file
         self.param_cc_ep_pref = cc_ep_pref
@@ -47,22 +63,102 @@ class JsonExporter:
         self.param_gld_ep_type = "string"
         self.param_gld_ep_global = False
 
+    def get_json_encoder(self):
+        if self.json_dump_compact_flag:
+            return json.JSONEncoder(sort_keys=self.json_dump_sort_key, separators=(",", ":"))
+        return json.JSONEncoder(sort_keys=self.json_dump_sort_key, indent=self.json_dump_indent_val)
+
     def dump_json(self, json_path_fn, json_data_dic):
         """Dump the data dictionary into a json file
         """
+        if self.json_dump_stream_flag:
+            self.dump_json_stream(json_path_fn, json_data_dic)
+            return
+
         with open(json_path_fn, "w") as hf_json:
             json.dump(
                 json_data_dic,
                 hf_json,
                 sort_keys=self.json_dump_sort_key,
-                indent=self.json_dump_indent_val,
+                indent=None if self.json_dump_compact_flag else self.json_dump_indent_val,
+                separators=(",", ":") if self.json_dump_compact_flag else None,
             )
 
+    def dump_json_stream(self, json_path_fn, json_data_dic):
+        """Dump the data dictionary into a json file, encoding the items of its list (or generator) values by batches
+
+        The output is the same as that of 'dump_json', but a generator value (e.g., of the endpoints) is never held
+        in memory as a whole.
+        """
+        encoder = self.get_json_encoder()
+        if self.json_dump_compact_flag or self.json_dump_indent_val is None:
+            ind_1_str = ""
+            key_sep_str = ":" if self.json_dump_compact_flag else ": "
+            item_sep_str = "," if self.json_dump_compact_flag else ", "
+        else:
+            ind_str = self.json_dump_indent_val
+            if isinstance(ind_str, int):
+                ind_str = " " * ind_str
+            ind_1_str = "\n" + ind_str
+            key_sep_str = ": "
+            item_sep_str = ","
+
+        key_list = list(json_data_dic)
+        if self.json_dump_sort_key:
+            key_list.sort()
+
+        with open(json_path_fn, "w") as hf_json:
+            hf_json.write("{")
+            for cur_key_ind, cur_key in enumerate(key_list):
+                if cur_key_ind:
+                    hf_json.write(item_sep_str)
+                hf_json.write(ind_1_str + json.encoder.encode_basestring_ascii(str(cur_key)) + key_sep_str)
+
+                cur_val = json_data_dic[cur_key]
+                if isinstance(cur_val, (list, tuple, types.GeneratorType)):
+                    # ~~the items are encoded by batches (as lists, without the brackets), so only a batch is held
+                    num_items = 0
+                    item_list = []
+                    for cur_item in cur_val:
+                        item_list.append(cur_item)
+                        num_items += 1
+                        if len(item_list) >= JSON_STREAM_BATCH_SIZE:
+                            hf_json.write(
+                                ("[" if num_items == len(item_list) else item_sep_str)
+                                + self.encode_json_items(encoder, item_list, ind_1_str)
+                            )
+                            item_list = []
+                    if item_list:
+                        hf_json.write(
+                            ("[" if num_items == len(item_list) else item_sep_str)
+                            + self.encode_json_items(encoder, item_list, ind_1_str)
+                        )
+                    hf_json.write(ind_1_str + "]" if num_items else "[]")
+                else:
+                    cur_val_str = encoder.encode(cur_val)
+                    hf_json.write(cur_val_str.replace("\n", ind_1_str) if ind_1_str else cur_val_str)
+            hf_json.write(("\n" if ind_1_str and key_list else "") + "}")
+
+    @staticmethod
+    def encode_json_items(encoder, item_list, ind_1_str):
+        """Encode a batch of items as the body of a list nested by one level (i.e., without the brackets)
+        """
+        item_str = encoder.encode(item_list)[1:-1]
+        if ind_1_str:
+            # ~~each new line of a list at the top level gets one more indent
+            item_str = item_str[:-1].replace("\n", ind_1_str)
+        return item_str
+
     def get_gld_endpoints(self, gld_comp_list, gld_ep_obj_dic, ep_property):
         """
         Static method for handling different types of endpoints
         """
         gld_ep_list = []
+
+        # --the encoding of the 'info' strings is shared, except for the object names
+        ep_info_pref_str = '{"object": '
+        ep_info_suff_str = f', "property": {json.encoder.encode_basestring_ascii(str(ep_property))}}}'
+
         for cur_comp_str in gld_comp_list:
             cur_ep_dic = {}
 
@@ -76,8 +172,9 @@ class JsonExporter:
                 cur_ep_info_obj = gld_ep_obj_dic[cur_comp_str]
             else:
                 cur_ep_info_obj = cur_comp_str
-            cur_ep_info_dic = {"object": cur_ep_info_obj, "property": ep_property}
-            cur_ep_dic["info"] = json.dumps(cur_ep_info_dic)
+            cur_ep_dic["info"] = (
+                ep_info_pref_str + json.encoder.encode_basestring_ascii(str(cur_ep_info_obj)) + ep_info_suff_str
+            )
 
             # --assemble
             gld_ep_list.append(cur_ep_dic)
@@ -85,6 +182,73 @@ class JsonExporter:
         self.gld_ep_all_list += gld_ep_list
         self.gld_all_key_list += gld_comp_list
 
+    def get_gld_endpoints_from_index(self, glm_idx, ep_sel_list):
+        """Add the endpoints of the objects selected from a GLM index (see 'GlmIndex'), without parsing the model again
+
+        Each selector is a dict of 'class', 'property' (one, or a list), and optionally 'where' (the patterns of the
+        properties, see 'GlmIndex.select') & 'key_pref' (of the endpoint names), e.g.,
+        {'class': 'inverter_dyn', 'property': 'Q_Out', 'key_pref': 'INV_'}, or
+        {'class': 'meter', 'property': ['voltage_A', 'voltage_B', 'voltage_C'], 'where': {'phases': 'A.*B.*C'}}.
+        With several properties, the endpoint names get the property as a suffix.
+        """
+        # --the selectors are grouped by class, so each object of a selected class is visited once
+        sel_cls_dict = {}
+        for cur_sel_ind, cur_sel_dict in enumerate(ep_sel_list):
+            cur_re_where_list = [(k, re.compile(v)) for k, v in cur_sel_dict.get("where", {}).items()]
+            sel_cls_dict.setdefault(cur_sel_dict["class"], []).append((cur_sel_ind, cur_re_where_list))
+
+        sel_obj_list = [[] for _ in ep_sel_list]
+        for cur_cls_str, cur_sel_list in sel_cls_dict.items():
+            for cur_obj_ind in glm_idx.by_class.get(cur_cls_str, []):
+                cur_obj = glm_idx.obj_list[cur_obj_ind]
+                for cur_sel_ind, cur_re_where_list in cur_sel_list:
+                    if all(k in cur_obj["props"] and r.search(cur_obj["props"][k]) for k, r in cur_re_where_list):
+                        sel_obj_list[cur_sel_ind].append(cur_obj["name"])
+
+        for cur_sel_dict, cur_obj_name_list in zip(ep_sel_list, sel_obj_list):
+            cur_prop_list = cur_sel_dict["property"]
+            if isinstance(cur_prop_list, str):
+                cur_prop_list = [cur_prop_list]
+            cur_key_pref_str = cur_sel_dict.get("key_pref", "")
+
+            for cur_prop_str in cur_prop_list:
+                cur_key_suff_str = f"_{cur_prop_str}" if len(cur_prop_list) > 1 else ""
+                cur_key_list = [f"{cur_key_pref_str}{x}{cur_key_suff_str}" for x in cur_obj_name_list]
+                self.get_gld_endpoints(cur_key_list, dict(zip(cur_key_list, cur_obj_name_list)), cur_prop_str)
+
+    def export_json_from_glm(
+        self,
+        glm_src,
+        ep_sel_list,
+        gld_json_path_fn,
+        gld_json_settings_dic,
+        cc_json_path_fn,
+        cc_json_settings_dic,
+        ns3_json_path_fn,
+        ns3_json_settings_dic,
+    ):
+        """Export the GLD, CC, and ns3 json files of the endpoints selected from a model (a GlmIndex, or a .glm file)
+        """
+        if isinstance(glm_src, str):
+            # @TODO: It is not good to modify the path. Two options (the 2nd one is better): 1) __init__.py; 2) package, then install via pip
+            if GLM_PARSER_PATH not in sys.path:
+                sys.path.append(GLM_PARSER_PATH)
+            from glm_index import GlmIndex
+
+            glm_idx = GlmIndex(glm_src)
+        else:
+            glm_idx = glm_src
+        self.get_gld_endpoints_from_index(glm_idx, ep_sel_list)
+
+        self.export_all_json(
+            gld_json_path_fn,
+            gld_json_settings_dic,
+            cc_json_path_fn,
+            cc_json_settings_dic,
+            ns3_json_path_fn,
+            ns3_json_settings_dic,
+        )
+
     def update_param_gld_endpoints(self, gld_ep_type="string", gld_ep_global=False):
         self.param_gld_ep_type = gld_ep_type
         self.param_gld_ep_global = gld_ep_global
@@ -96,52 +260,80 @@ class JsonExporter:
         self.param_cc_ep_type = cc_ep_type
         self.param_cc_ep_global = cc_ep_global
 
-    def get_cc_endpoints(self):
+    @staticmethod
+    def get_full_names(list_all_key, json_config_name):
+        """The full endpoint names (e.g., 'GLD/INV_1'), each formatted once, so the CC & ns3 items that refer to the
+        same endpoint share one string
         """
-        Member method for adding a controller with respect to each endpoint defined in the GLD json file
+        return [f"{json_config_name}/{x}" for x in list_all_key]
+
+    @staticmethod
+    def iter_full_names(list_all_key, json_config_name, full_name_list=None):
+        """The given full endpoint names, or the ones formatted on the fly
         """
-        # ~~controllers
-        self.cc_ep_list = []
-        self.cc_list_all_key = []
-        for cur_gld_ep_name in self.gld_list_all_key:
+        if full_name_list is not None:
+            return full_name_list
+        return (f"{json_config_name}/{x}" for x in list_all_key)
+
+    def iter_cc_endpoints(self, gld_full_name_list=None):
+        """
+        Member method for generating a controller with respect to each endpoint defined in the GLD json file
+        """
+        for cur_cc_ep_name, cur_gld_full_name in zip(
+            self.cc_list_all_key,
+            JsonExporter.iter_full_names(self.gld_list_all_key, self.gld_json_config_name, gld_full_name_list),
+        ):
             cur_cc_ep_dict = {}
 
             cur_cc_ep_dict["global"] = self.param_cc_ep_global
-            cur_cc_ep_dict["name"] = self.param_cc_ep_pref + cur_gld_ep_name
-            cur_cc_ep_dict[
-                "destination"
-            ] = f"{self.gld_json_config_name}/{cur_gld_ep_name}"
+            cur_cc_ep_dict["name"] = cur_cc_ep_name
+            cur_cc_ep_dict["destination"] = cur_gld_full_name
             cur_cc_ep_dict["type"] = self.param_cc_ep_type
 
-            self.cc_ep_list.append(cur_cc_ep_dict)
-            self.cc_list_all_key.append(cur_cc_ep_dict["name"])
+            yield cur_cc_ep_dict
+
+    def get_cc_endpoints(self):
+        """
+        Member method for adding a controller with respect to each endpoint defined in the GLD json file
+        """
+        # ~~controllers
+        self.cc_list_all_key = [self.param_cc_ep_pref + x for x in self.gld_list_all_key]
+        self.cc_ep_list = list(self.iter_cc_endpoints())
 
     def update_param_ns3_endpoints(self, ns3_ep_info, ns3_ep_global):
         self.param_ns3_ep_info = ns3_ep_info
         self.param_ns3_ep_global = ns3_ep_global
 
-    def get_ns3_endpoints(self):
+    def iter_ns3_endpoints(self, gld_full_name_list=None, cc_full_name_list=None):
         """
+        Member method for generating the ns3 endpoints (of the endpoints defined in the GLD & CC json files)
         """
-        self.ns3_ep_list = []
-
-        # --adding the endpoints defined in the GLD json file
-        for cur_gld_ep_name in self.gld_list_all_key:
+        # --the endpoints defined in the GLD json file
+        for cur_gld_full_name in JsonExporter.iter_full_names(
+            self.gld_list_all_key, self.gld_json_config_name, gld_full_name_list
+        ):
             cur_gld_ep_dict = {}
-            cur_gld_ep_dict["name"] = f"{self.gld_json_config_name}/{cur_gld_ep_name}"
+            cur_gld_ep_dict["name"] = cur_gld_full_name
             cur_gld_ep_dict["info"] = self.param_ns3_ep_info
             cur_gld_ep_dict["global"] = self.param_ns3_ep_global
 
-            self.ns3_ep_list.append(cur_gld_ep_dict)
+            yield cur_gld_ep_dict
 
-        # --adding the endpoints defined in the CC json file
-        for cur_cc_ep_name in self.cc_list_all_key:
+        # --the endpoints defined in the CC json file
+        for cur_cc_full_name in JsonExporter.iter_full_names(
+            self.cc_list_all_key, self.cc_json_config_name, cc_full_name_list
+        ):
             cur_cc_ep_dict = {}
-            cur_cc_ep_dict["name"] = f"{self.cc_json_config_name}/{cur_cc_ep_name}"
+            cur_cc_ep_dict["name"] = cur_cc_full_name
             cur_cc_ep_dict["info"] = self.param_ns3_ep_info
             cur_cc_ep_dict["global"] = self.param_ns3_ep_global
 
-            self.ns3_ep_list.append(cur_cc_ep_dict)
+            yield cur_cc_ep_dict
+
+    def get_ns3_endpoints(self):
+        """
+        """
+        self.ns3_ep_list = list(self.iter_ns3_endpoints())
 
     def update_param_ns3_filters(
         self,
@@ -153,29 +345,35 @@ class JsonExporter:
         self.param_ns3_filter_oper = ns3_filter_oper
         self.param_ns3_filter_prop_name = ns3_filter_prop_name
 
-    def get_ns3_sub_filters(self, list_all_key, json_config_name):
-        # --adding filters
-        for cur_gld_ep_name in list_all_key:
+    def iter_ns3_sub_filters(self, list_all_key, json_config_name, full_name_list=None):
+        # --generating filters
+        for cur_gld_ep_name, cur_full_name in zip(
+            list_all_key, JsonExporter.iter_full_names(list_all_key, json_config_name, full_name_list)
+        ):
             cur_ns3_filter_dict = {}
             cur_ns3_filter_dict[
                 "name"
             ] = f"{self.param_ns3_filters_pref}{json_config_name}_{cur_gld_ep_name}"
-            cur_ns3_filter_dict["sourcetargets"] = [
-                f"{json_config_name}/{cur_gld_ep_name}"
-            ]
+            cur_ns3_filter_dict["sourcetargets"] = [cur_full_name]
             cur_ns3_filter_dict["operation"] = self.param_ns3_filter_oper
 
             # ~~property dict
             cur_ns3_filter_prop_dict = {}
             cur_ns3_filter_prop_dict["name"] = self.param_ns3_filter_prop_name
-            cur_ns3_filter_prop_dict[
-                "value"
-            ] = f"{self.ns3_json_config_name}/{json_config_name}/{cur_gld_ep_name}"
+            cur_ns3_filter_prop_dict["value"] = f"{self.ns3_json_config_name}/{cur_full_name}"
 
             cur_ns3_filter_dict["properties"] = cur_ns3_filter_prop_dict
 
             # ~~assemble
-            self.ns3_filters_list.append(cur_ns3_filter_dict)
+            yield cur_ns3_filter_dict
+
+    def get_ns3_sub_filters(self, list_all_key, json_config_name):
+        # --adding filters
+        self.ns3_filters_list.extend(self.iter_ns3_sub_filters(list_all_key, json_config_name))
+
+    def iter_ns3_filters(self, gld_full_name_list=None, cc_full_name_list=None):
+        yield from self.iter_ns3_sub_filters(self.gld_list_all_key, self.gld_json_config_name, gld_full_name_list)
+        yield from self.iter_ns3_sub_filters(self.cc_list_all_key, self.cc_json_config_name, cc_full_name_list)
 
     def get_ns3_filters(self):
         self.ns3_filters_list = []
@@ -208,7 +406,14 @@ class JsonExporter:
 
         # --end points
         # p.update_param_cc_endpoints(cc_ep_pref='ctr_') # left here as a demo
-        p.get_cc_endpoints()
+        if self.json_dump_stream_flag:
+            # ~~only the names are kept (for the ns3 json file); the endpoints are encoded as they are generated
+            self.cc_list_all_key = [self.param_cc_ep_pref + x for x in self.gld_list_all_key]
+            self.cc_data["endpoints"] = self.iter_cc_endpoints()
+            self.dump_json(output_json_path_fn, self.cc_data)
+            return
+
+        self.get_cc_endpoints()
 
         if not hasattr(self, "cc_ep_list"):
             warnings.warn(
@@ -228,7 +433,13 @@ class JsonExporter:
         self.ns3_data = {}
         self.ns3_data.update(json_data_settings_dic)
 
-        # --end points
+        # --end points & filters (generated while being dumped, in the streaming mode)
+        if self.json_dump_stream_flag:
+            self.ns3_data["endpoints"] = self.iter_ns3_endpoints()
+            self.ns3_data["filters"] = self.iter_ns3_filters()
+            self.dump_json(output_json_path_fn, self.ns3_data)
+            return
+
         self.get_ns3_endpoints()
         self.ns3_data["endpoints"] = self.ns3_ep_list
 
@@ -239,6 +450,75 @@ class JsonExporter:
         # --dump
         self.dump_json(output_json_path_fn, self.ns3_data)
 
+    def check_configs(self):
+        """Check the consistency of the GLD, CC, and ns3 configs with sets (i.e., in O(n)); returns the problems found
+        """
+        err_list = []
+
+        gld_key_set = set(self.gld_list_all_key)
+        if len(gld_key_set) != len(self.gld_list_all_key):
+            err_list.append(f"{len(self.gld_list_all_key) - len(gld_key_set)} repeated GLD endpoint name(s)")
+
+        cc_key_set = set(self.cc_list_all_key)
+        if len(cc_key_set) != len(self.cc_list_all_key):
+            err_list.append(f"{len(self.cc_list_all_key) - len(cc_key_set)} repeated CC endpoint name(s)")
+
+        gld_full_set = set(JsonExporter.iter_full_names(gld_key_set, self.gld_json_config_name))
+        num_bad_dst = sum(x["destination"] not in gld_full_set for x in self.cc_ep_list)
+        if num_bad_dst:
+            err_list.append(f"{num_bad_dst} CC endpoint(s) with an unknown GLD destination")
+
+        ns3_ep_name_set = {x["name"] for x in self.ns3_ep_list}
+        if len(ns3_ep_name_set) != len(self.ns3_ep_list):
+            err_list.append(f"{len(self.ns3_ep_list) - len(ns3_ep_name_set)} repeated ns3 endpoint name(s)")
+
+        num_bad_tgt = sum(y not in ns3_ep_name_set for x in self.ns3_filters_list for y in x["sourcetargets"])
+        if num_bad_tgt:
+            err_list.append(f"{num_bad_tgt} ns3 filter target(s) without an ns3 endpoint")
+
+        for cur_err_str in err_list:
+            warnings.warn(cur_err_str)
+        return err_list
+
+    def export_all_json(
+        self,
+        gld_json_path_fn,
+        gld_json_settings_dic,
+        cc_json_path_fn,
+        cc_json_settings_dic,
+        ns3_json_path_fn,
+        ns3_json_settings_dic,
+    ):
+        """Export the GLD, CC, and ns3 json files, with the full endpoint names formatted once & shared by the CC &
+        ns3 items (see 'get_full_names'), and check their consistency (see 'check_configs')
+
+        The files are the same as those of 'export_gld_json', 'export_cc_json', and 'export_ns3_json'.
+        """
+        # --record
+        self.gld_json_config_name = gld_json_settings_dic["name"]
+        self.cc_json_config_name = cc_json_settings_dic["name"]
+        self.ns3_json_config_name = ns3_json_settings_dic["name"]
+        self.gld_list_all_key = self.gld_all_key_list
+        self.cc_list_all_key = [self.param_cc_ep_pref + x for x in self.gld_list_all_key]
+
+        # --generate
+        gld_full_name_list = JsonExporter.get_full_names(self.gld_list_all_key, self.gld_json_config_name)
+        cc_full_name_list = JsonExporter.get_full_names(self.cc_list_all_key, self.cc_json_config_name)
+        self.cc_ep_list = list(self.iter_cc_endpoints(gld_full_name_list))
+        self.ns3_ep_list = list(self.iter_ns3_endpoints(gld_full_name_list, cc_full_name_list))
+        self.ns3_filters_list = list(self.iter_ns3_filters(gld_full_name_list, cc_full_name_list))
+        self.check_configs()
+
+        # --dump
+        self.gld_data = dict(gld_json_settings_dic, endpoints=self.gld_ep_all_list)
+        self.dump_json(gld_json_path_fn, self.gld_data)
+
+        self.cc_data = dict(cc_json_settings_dic, endpoints=self.cc_ep_list)
+        self.dump_json(cc_json_path_fn, self.cc_data)
+
+        self.ns3_data = dict(ns3_json_settings_dic, endpoints=self.ns3_ep_list, filters=self.ns3_filters_list)
+        self.dump_json(ns3_json_path_fn, self.ns3_data)
+
 
 def test_export_gld_json(p):
     # ==Parameters
@@ -378,8 +658,94 @@ def test_export_ns3_json(p):
     p.export_ns3_json(output_json_path_fn, json_data_settings_dic)
 
 
+def test_export_json_from_glm():
+    # ==Parameters
+    glm_pfn = r"../../IEEE Test Models/13node/IEEE-13.glm"
+    ep_sel_list = [
+        {"class": "switch", "property": "status", "key_pref": "SW_"},
+        {"class": "regulator", "property": ["tap_A", "tap_B", "tap_C"]},
+        {"class": "node", "property": ["voltage_A", "voltage_B", "voltage_C"], "where": {"phases": "A.*B.*C"}},
+    ]
+
+    # ==Export
+    q = JsonExporter()
+    q.export_json_from_glm(
+        glm_pfn,
+        ep_sel_list,
+        "IEEE13_gld_config.json",
+        {"name": "GLD", "coreType": "zmq", "period": 1e-2},
+        "IEEE13_cc_config.json",
+        {"name": "CC", "coreType": "zmq", "period": 1e-2},
+        "IEEE13_ns3_config.json",
+        {"name": "ns3", "coreType": "zmq", "period": 1e-9},
+    )
+    print(f"{len(q.gld_all_key_list)} endpoints: {q.gld_all_key_list[:5]}, ...")
+
+
+def test_export_all_json(num_invs=50000):
+    import filecmp
+    import tempfile
+    import time
+
+    flr_path = tempfile.mkdtemp()
+    list_invs_val = [f"Inv_{x}" for x in range(num_invs)]
+    list_invs_key = ["INV_" + x for x in list_invs_val]
+    settings_dic_list = [{"name": "GLD", "period": 1e-2}, {"name": "CC", "period": 1e-2}, {"name": "ns3", "period": 1e-9}]
+
+    pfn_dict = {}
+    for cur_all_flag in [False, True]:
+        q = JsonExporter(compact_flag=True)
+        q.get_gld_endpoints(list_invs_key, dict(zip(list_invs_key, list_invs_val)), "Q_Out")
+        pfn_dict[cur_all_flag] = [os.path.join(flr_path, f"{x['name']}_{cur_all_flag}.json") for x in settings_dic_list]
+
+        st_time = time.time()
+        if cur_all_flag:
+            q.export_all_json(*[y for x in zip(pfn_dict[cur_all_flag], settings_dic_list) for y in x])
+        else:
+            q.export_gld_json(pfn_dict[cur_all_flag][0], settings_dic_list[0])
+            q.export_cc_json(pfn_dict[cur_all_flag][1], settings_dic_list[1])
+            q.export_ns3_json(pfn_dict[cur_all_flag][2], settings_dic_list[2])
+        print(f"export_all_json: {cur_all_flag}, {time.time() - st_time} (secs)")
+
+    for cur_pfn, cur_all_pfn in zip(pfn_dict[False], pfn_dict[True]):
+        assert filecmp.cmp(cur_pfn, cur_all_pfn, shallow=False)
+    assert not q.check_configs()
+
+
+def test_export_stream(num_invs=50000):
+    import filecmp
+    import tempfile
+    import time
+
+    flr_path = tempfile.mkdtemp()
+    list_invs_val = [f"Inv_{x}" for x in range(num_invs)]
+    list_invs_key = ["INV_" + x for x in list_invs_val]
+
+    for cur_compact_flag in [False, True]:
+        pfn_dict = {}
+        for cur_stream_flag in [False, True]:
+            st_time = time.time()
+            q = JsonExporter(compact_flag=cur_compact_flag, stream_flag=cur_stream_flag)
+            q.get_gld_endpoints(list_invs_key, dict(zip(list_invs_key, list_invs_val)), "Q_Out")
+
+            pfn_dict[cur_stream_flag] = [
+                os.path.join(flr_path, f"{x}_{cur_compact_flag}_{cur_stream_flag}.json") for x in ["gld", "cc", "ns3"]
+            ]
+            q.export_gld_json(pfn_dict[cur_stream_flag][0], {"name": "GLD", "period": 1e-2})
+            q.export_cc_json(pfn_dict[cur_stream_flag][1], {"name": "CC", "period": 1e-2})
+            q.export_ns3_json(pfn_dict[cur_stream_flag][2], {"name": "ns3", "period": 1e-9})
+            print(f"compact: {cur_compact_flag}, stream: {cur_stream_flag}, {time.time() - st_time} (secs)")
+
+        for cur_pfn, cur_stream_pfn in zip(pfn_dict[False], pfn_dict[True]):
+            assert filecmp.cmp(cur_pfn, cur_stream_pfn, shallow=False)
+
+
 if __name__ == "__main__":
     p = JsonExporter()
     test_export_gld_json(p)
     test_export_cc_json(p)
     test_export_ns3_json(p)
+
+    # test_export_json_from_glm()
+    # test_export_all_json()
+    # test_export_stream()